@@ -5,6 +5,8 @@ Provides abstract backend interfaces that should be implemented.
 
 """
 import collections
+from datetime import datetime
+from ..utils.python import timestamp
 
 
 class AbstractBackend(object):
@@ -16,28 +18,44 @@ class AbstractBackend(object):
     :param news_model: News class to use with backend.
     :type news_model: Implementation of
         :class:`~news.models.abstract.AbstractNews`.
+    :param page_model: Page class to keep crawl states of the schedules with.
+        Crawl states will not be kept between covers if not given.
+    :type page_model: Implementation of
+        :class:`~news.models.abstract.AbstractPage`.
 
     """
     combinations = {}
 
-    def __init__(self, schedule_model=None, news_model=None, *args, **kwargs):
+    def __init__(self, schedule_model=None, news_model=None, page_model=None,
+                 *args, **kwargs):
         self.schedule_model = self.Schedule = schedule_model
         self.news_model = self.News = news_model
+        self.page_model = self.Page = page_model
 
     @classmethod
     def create_backend(
-            cls, schedule_model=None, news_model=None, *args, **kwargs):
+            cls, schedule_model=None, news_model=None, page_model=None,
+            *args, **kwargs):
         # make combination of model classes and check if same type of backend
         # with same combination of model classes ever been instantiated or
         # not.
-        C = collections.namedtuple('Combination', 'schedule news')
-        c = C(schedule=schedule_model, news=news_model)
+        C = collections.namedtuple('Combination', 'schedule news page')
+        c = C(schedule=schedule_model, news=news_model, page=page_model)
 
         if c in cls.combinations:
             return cls.combinations[c]
         else:
             return cls(schedule_model=schedule_model, news_model=news_model,
-                       *args, **kwargs)
+                       page_model=page_model, *args, **kwargs)
+
+    def now(self):
+        """Returns current datetime in the backend's timezone convention.
+
+        :returns: Current datetime.
+        :rtype: :class:`~datetime.datetime`
+
+        """
+        return datetime.now()
 
     def get_news(self, id):
         """Should retrive a news with given id.
@@ -61,6 +79,21 @@ class AbstractBackend(object):
         """
         raise NotImplementedError
 
+    def get_news_map(self, schedule):
+        """Should retrieve all news of the schedule within a single query and
+        return them as an url keyed dictionary.
+
+        Only the columns needed for matching the news with fetched urls(e.g.
+        id, url, schedule and parent) are required to be loaded.
+
+        :param schedule: Schedule of the news.
+        :type schedule: :attr:`schedule_model`
+        :return: A dictionary from urls to news of the schedule.
+        :rtype: :class:`dict`
+
+        """
+        raise NotImplementedError
+
     def get_news_list(self, owner, root_url):
         """Should retrieve  a list of news for owner from backend.
 
@@ -77,12 +110,65 @@ class AbstractBackend(object):
     def save_news(self, *news):
         """Should save news to the backend.
 
+        Unsaved ancestors of the news should be saved along with them.
+
         :param news: News to save.
         :type news: :attr:`news_model`
 
         """
         raise NotImplementedError
 
+    def level_news(self, *news):
+        """Flatten the news and their unsaved ancestors into levels so that
+        every news comes after it's parent.
+
+        News of a level only depend on the news of the previous levels,
+        which makes each level insertable in bulk once the previous levels
+        have been saved.
+
+        :param news: News to flatten.
+        :type news: :attr:`news_model`
+        :return: A list of levels, each of which is a list of news.
+        :rtype: :class:`list`
+
+        """
+        flattened = collections.OrderedDict()
+        for n in news:
+            flattened[id(n)] = n
+            parent = self.get_cached_parent(n)
+            while parent is not None and parent.id is None and \
+                    id(parent) not in flattened:
+                flattened[id(parent)] = parent
+                parent = self.get_cached_parent(parent)
+
+        # a news is one level deeper than it's parent if the parent is saved
+        # in the same batch.
+        depths = {}
+
+        def depth(n):
+            if id(n) not in depths:
+                parent = self.get_cached_parent(n)
+                depths[id(n)] = 0 if parent is None or \
+                    id(parent) not in flattened else depth(parent) + 1
+            return depths[id(n)]
+
+        levels = collections.defaultdict(list)
+        for n in flattened.values():
+            levels[depth(n)].append(n)
+        return [levels[d] for d in sorted(levels)]
+
+    def get_cached_parent(self, news):
+        """Return parent of the news without hitting the backend if it's
+        possible.
+
+        :param news: News to get parent of.
+        :type news: :attr:`news_model`
+        :return: Parent of the news.
+        :rtype: :attr:`news_model`
+
+        """
+        return news.parent
+
     def delete_news(self, *news):
         """Delete news in the backend.
 
@@ -117,17 +203,75 @@ class AbstractBackend(object):
         """
         raise NotImplementedError
 
-    def get_schedules(owner):
+    def get_schedules(self, owner=None, url=None, ids=None):
         """Should retrieve a list of schedule for owner from backend.
 
         :param owner: Owner of the schedules.
         :type owner: :attr:`owner` of :attr:`schedule_model`
+        :param url: Url of the schedules.
+        :type url: :class:`str`
+        :param ids: Ids of the schedules to retrieve within a single query.
+        :type ids: :class:`list`
         :return: A list of owner's schedule.
         :rtype: :class:`list`
 
         """
         raise NotImplementedError
 
+    def get_pages(self, schedule):
+        """Should retrieve crawl states of all pages of the schedule within a
+        single query and return them as an url keyed dictionary.
+
+        :param schedule: Schedule of the pages.
+        :type schedule: :attr:`schedule_model`
+        :return: A dictionary from urls to pages of the schedule.
+        :rtype: :class:`dict`
+
+        """
+        raise NotImplementedError
+
+    def save_pages(self, *pages):
+        """Should save crawl states of the pages to the backend in bulk.
+
+        :param pages: Pages to save.
+        :type pages: :attr:`page_model`
+
+        """
+        raise NotImplementedError
+
+    def dump_schedule(self, schedule):
+        """Dump a compact snapshot of the schedule that can be serialized
+        into task messages.
+
+        :param schedule: Schedule to dump.
+        :type schedule: :attr:`schedule_model`
+        :return: A snapshot of the schedule.
+        :rtype: :class:`dict`
+
+        """
+        return {
+            'id': schedule.id,
+            'owner_id': schedule.owner_id,
+            'url': str(schedule.url),
+            'type': schedule.type,
+            'cycle': schedule.cycle,
+            'enabled': schedule.enabled,
+            'options': schedule.options,
+            'updated': timestamp(getattr(schedule, 'updated', None)),
+        }
+
+    def load_schedule(self, snapshot):
+        """Should load a schedule from the snapshot without hitting the
+        backend.
+
+        :param snapshot: Snapshot from :meth:`dump_schedule`.
+        :type snapshot: :class:`dict`
+        :return: Schedule of the snapshot.
+        :rtype: :attr:`schedule_model`
+
+        """
+        raise NotImplementedError
+
     def schedule_exists(self, id):
         """Should check existance of the schedule in the backend.
 
@@ -4,12 +4,35 @@
 Provides an implemenation of news backend for django ORM.
 
 """
-from django.db import transaction
+from datetime import datetime
+from django.conf import settings
+from django.db import (
+    models,
+    transaction,
+)
+from django.utils import timezone
 from django.core.exceptions import ObjectDoesNotExist
 from .abstract import AbstractBackend
+from ..constants import BULK_SAVE_CHUNK_SIZE
+from ..utils.python import chunks
 
 
 class DjangoBackend(AbstractBackend):
+    #: News fields to be updated when existing news are saved again.
+    news_update_fields = (
+        'parent', 'author', 'title', 'summary',
+        'content', 'image', 'published',
+    )
+
+    #: Page fields to be updated when existing pages are saved again.
+    page_update_fields = (
+        'fingerprint', 'fetched', 'changed', 'etag', 'last_modified',
+        'discovered', 'visits', 'changes',
+    )
+
+    def now(self):
+        return timezone.now()
+
     def get_news(self, id):
         try:
             return self.News.objects.get(id=id)
@@ -22,6 +45,12 @@ class DjangoBackend(AbstractBackend):
             .filter(url=url)\
             .first()
 
+    def get_news_map(self, schedule):
+        news_list = self.News.objects\
+            .filter(schedule=schedule)\
+            .only('id', 'url', 'schedule', 'parent')
+        return {n.url: n for n in news_list}
+
     def get_news_list(self, owner=None, root_url=None):
         news_list = self.News.objects.all()
 
@@ -34,20 +63,115 @@ class DjangoBackend(AbstractBackend):
 
     @transaction.atomic
     def save_news(self, *news):
+        """Save news and their unsaved ancestors to the backend.
+
+        News are inserted with `bulk_create` and updated with a `Case`/`When`
+        update per chunk, level by level. Note that neither `save()` of the
+        news model is called nor are `pre_save` and `post_save` signals sent
+        for the news. Deferred fields of the news (e.g. of the news from
+        :meth:`get_news_map`) are left as they are in the backend.
+
+        :param news: News to save.
+        :type news: :attr:`news_model`
+
+        """
+        levels = self.level_news(*news)
+
+        # resolve ids of the news that already exist in the backend.
+        self._resolve_news_ids([n for l in levels for n in l if n.id is None])
+
+        # save the news level by level, so that parents are always saved
+        # before their children.
+        for level in levels:
+            for n in level:
+                parent = self.get_cached_parent(n)
+                if parent is not None:
+                    n.parent_id = parent.id
+
+            created = [n for n in level if n.id is None]
+            updated = [n for n in level if n.id is not None]
+            self._bulk_create_news(created)
+            self._bulk_update_news(updated)
+
+    def get_cached_parent(self, news):
+        field = self.News._meta.get_field('parent')
+        return getattr(news, field.get_cache_name(), None)
+
+    def _resolve_news_ids(self, news):
+        # group the news by their schedule and lookup ids of the news with
+        # a query per chunk.
+        for chunk in chunks(news, BULK_SAVE_CHUNK_SIZE):
+            keys = {(n.schedule_id, n.url): n for n in chunk}
+            ids = self.News.objects\
+                .filter(schedule_id__in={s for s, _ in keys})\
+                .filter(url__in={u for _, u in keys})\
+                .values_list('schedule_id', 'url', 'id')
+
+            for schedule_id, url, id in ids:
+                n = keys.get((schedule_id, url))
+                if n is not None:
+                    n.id = id
+                    n._state.adding = False
+                    n._state.db = self.News.objects.db
+
+    def _bulk_create_news(self, news):
+        if not news:
+            return
+
+        # drop duplicated news so that they don't violate unique constraint.
+        unique = list({(n.schedule_id, n.url): n for n in news}.values())
+        now = timezone.now()
+        for n in unique:
+            n.created = n.updated = now
+
+        self.News.objects.bulk_create(unique, batch_size=BULK_SAVE_CHUNK_SIZE)
+
+        # backends that can't return ids of bulk inserted rows require us
+        # to look them up again, along with the dropped duplicates.
+        self._resolve_news_ids([n for n in news if n.id is None])
+
+    def _bulk_update_news(self, news):
+        now = timezone.now()
         for n in news:
-            if not self.news_exists(n.id):
-                self.cascade_save_news(n)
-            else:
-                previous = self.get_news(n.id)
-                previous.content = n.content
-                previous.parent = n.parent
-                previous.save()
+            n.updated = now
+        self._bulk_update(self.News, news, self.news_update_fields,
+                          updated=now)
+
+    def _bulk_update(self, model, instances, fields, **values):
+        # update each chunk of the instances with a single query, choosing
+        # the value of each field by the instance's id. deferred fields are
+        # left as they are instead of being loaded one by one.
+        meta = model._meta
+        for chunk in chunks(instances, BULK_SAVE_CHUNK_SIZE):
+            chunk_values = dict(values)
+            for name in fields:
+                field = meta.get_field(name)
+                loaded = [i for i in chunk if field.attname in i.__dict__]
+                if not loaded:
+                    continue
+                output_field = models.IntegerField() \
+                    if field.is_relation else field
+                chunk_values[field.attname] = models.Case(*[
+                    models.When(id=i.id, then=models.Value(
+                        getattr(i, field.attname),
+                        output_field=output_field
+                    )) for i in loaded
+                ], default=models.F(field.attname), output_field=output_field)
+
+            model.objects\
+                .filter(id__in=[i.id for i in chunk])\
+                .update(**chunk_values)
+
+    def get_pages(self, schedule):
+        pages = self.Page.objects.filter(schedule=schedule)
+        return {p.url: p for p in pages}
 
     @transaction.atomic
-    def cascade_save_news(self, news):
-        if news.parent and news.parent.is_root:
-            self.cascade_save_news(news.parent)
-        news.save()
+    def save_pages(self, *pages):
+        created = [p for p in pages if p.id is None]
+        updated = [p for p in pages if p.id is not None]
+        self.Page.objects.bulk_create(created, batch_size=BULK_SAVE_CHUNK_SIZE)
+        self._bulk_update(self.Page, updated, self.page_update_fields)
 
     def delete_news(self, *news):
         queryset = self.News.objects.filter(id__in=[n.id for n in news])
@@ -56,12 +180,35 @@ class DjangoBackend(AbstractBackend):
     def get_schedule(self, id):
         return self.Schedule.objects.get(id=id)
 
-    def get_schedules(self, owner=None, url=None):
+    def load_schedule(self, snapshot):
+        updated = snapshot.get('updated')
+        if updated is not None:
+            updated = datetime.utcfromtimestamp(updated)
+            if settings.USE_TZ:
+                updated = timezone.make_aware(updated, timezone.utc)
+
+        schedule = self.Schedule(
+            id=snapshot['id'],
+            owner_id=snapshot['owner_id'],
+            url=snapshot['url'],
+            type=snapshot['type'],
+            cycle=snapshot['cycle'],
+            enabled=snapshot['enabled'],
+            options=snapshot['options'],
+            updated=updated,
+        )
+        schedule._state.adding = False
+        schedule._state.db = self.Schedule.objects.db
+        return schedule
+
+    def get_schedules(self, owner=None, url=None, ids=None):
         queryset = self.Schedule.objects.all()
 
         if owner:
             queryset = queryset.filter(owner=owner)
         if url:
             queryset = queryset.filter(url=url)
+        if ids is not None:
+            queryset = queryset.filter(id__in=ids)
 
         return queryset.all()
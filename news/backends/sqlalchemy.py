@@ -4,9 +4,24 @@
 Provides an implementation of news backend for SQLAlchemy.
 
 """
-from sqlalchemy.orm import sessionmaker
+import itertools
+from datetime import datetime
+from sqlalchemy import (
+    and_,
+    bindparam,
+    inspect,
+    select,
+)
+from sqlalchemy.orm import (
+    sessionmaker,
+    load_only,
+    make_transient_to_detached,
+)
+from sqlalchemy.orm.util import identity_key
 from .abstract import AbstractBackend
+from ..constants import BULK_SAVE_CHUNK_SIZE
 from ..exceptions import HeterogenuousEngineError
+from ..utils.python import chunks
 
 
 class SQLAlchemyBackend(AbstractBackend):
@@ -34,6 +49,12 @@ class SQLAlchemyBackend(AbstractBackend):
                 self.Schedule.owner_id == owner.id
             ).first()
 
+    def get_news_map(self, schedule):
+        news_list = self.session.query(self.News)\
+            .options(load_only('id', 'url', 'schedule_id', 'parent_id'))\
+            .filter(self.News.schedule_id == schedule.id)
+        return {n.url: n for n in news_list}
+
     def get_news_list(self, owner=None, root_url=None):
         query = self.session.query(self.News).join(self.Schedule)
 
@@ -45,30 +66,111 @@ class SQLAlchemyBackend(AbstractBackend):
         return query.all()
 
     def save_news(self, *news):
-        try:
-            root = [n for n in news if n.is_root][0]
-        except IndexError:
-            root = None
+        levels = self.level_news(*news)
+        flattened = [n for level in levels for n in level]
+
+        # keep the news out of the orm's unit of work while saving them with
+        # core statements.
+        for n in flattened:
+            if inspect(n).pending:
+                self.session.expunge(n)
+
+        # save the news level by level, so that parents are always saved
+        # before their children.
+        upsert = self._get_upsert()
+        for level in levels:
+            if upsert is None:
+                self._resolve_news_ids(level)
 
-        if root:
-            # save-update cascade will do heavy lifting
-            self.session.add(root)
-            self.session.commit()
+            # news with known ids might have been loaded partially(e.g. the
+            # stored news), so they are updated rather than upserted.
+            rows = self._make_news_rows(level)
+            created = [r for r in rows if r['id'] is None]
+            updated = [r for r in rows if r['id'] is not None]
+            if upsert is not None:
+                self._upsert_news_rows(upsert, created)
+            else:
+                self._insert_news_rows(created)
+            self._update_news_rows(updated)
+            self._resolve_news_ids(level)
+
+        # attach the saved news to the session as if they were loaded. news
+        # whose rows are already held by the session under another instance
+        # are replaced with that instance.
+        identity_map = self.session.identity_map
+        persistents = [n for n in flattened if inspect(n).persistent]
+        replaced = {}
+        for n in flattened:
+            if inspect(n).transient:
+                existing = identity_map.get(identity_key(self.News, n.id))
+                if existing is not None:
+                    replaced[id(n)] = existing
+
+        transients = [n for n in flattened if
+                      inspect(n).transient and id(n) not in replaced]
+        for n in transients:
+            parent = self.get_cached_parent(n)
+            if parent is not None and id(parent) in replaced:
+                n.parent = replaced[id(parent)]
+        for n in transients:
+            make_transient_to_detached(n)
+        for n in transients:
+            self.session.add(n)
+        for n in persistents + list(replaced.values()):
+            self.session.expire(n)
+
+        self.session.commit()
 
     def delete_news(self, *news):
         self.session.delete(*news)
         self.session.commit()
 
+    def get_pages(self, schedule):
+        pages = self.session.query(self.Page)\
+            .filter(self.Page.schedule_id == schedule.id)
+        return {str(p.url): p for p in pages}
+
+    def save_pages(self, *pages):
+        # pages are grouped into executemany statements of inserts and
+        # updates instead of being flushed one by one.
+        for p in pages:
+            if p.schedule_id is None and p.schedule is not None:
+                p.schedule_id = p.schedule.id
+        self.session.bulk_save_objects(pages)
+        self.session.commit()
+
     def get_schedule(self, id):
         return self.session.query(self.Schedule).get(id)
 
-    def get_schedules(self, owner=None, url=None):
+    def load_schedule(self, snapshot):
+        updated = snapshot.get('updated')
+        schedule = self.Schedule(
+            url=snapshot['url'],
+            type=snapshot['type'],
+            cycle=snapshot['cycle'],
+            enabled=snapshot['enabled'],
+            options=snapshot['options'],
+        )
+        schedule.id = snapshot['id']
+        schedule.owner_id = snapshot['owner_id']
+        schedule.updated = datetime.utcfromtimestamp(updated) \
+            if updated is not None else None
+
+        # leave the owner unloaded so that it can be lazily loaded, and merge
+        # the schedule into the session as if it was loaded.
+        del schedule.owner
+        make_transient_to_detached(schedule)
+        return self.session.merge(schedule, load=False)
+
+    def get_schedules(self, owner=None, url=None, ids=None):
         query = self.session.query(self.Schedule)
 
         if owner:
             query = query.filter(self.Schedule.owner == owner)
         if url:
             query = query.filter(self.Schedule.url == url)
+        if ids is not None:
+            query = query.filter(self.Schedule.id.in_(ids))
 
         return query.all()
 
@@ -76,6 +178,102 @@ class SQLAlchemyBackend(AbstractBackend):
         self.session = session
         return self
 
+    def _get_upsert(self):
+        # `INSERT ... ON CONFLICT DO UPDATE` is only supported by some
+        # dialects.
+        dialect = self.session.get_bind(mapper=self.News).dialect.name
+        try:
+            if dialect == 'postgresql':
+                from sqlalchemy.dialects.postgresql import insert
+            elif dialect == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                return None
+        except ImportError:
+            return None
+        return insert
+
+    def _make_news_rows(self, news):
+        table = self.News.__table__
+        now = datetime.now()
+        rows = []
+
+        for n in news:
+            state = inspect(n)
+            parent = self.get_cached_parent(n)
+            schedule = n.schedule
+
+            # only loaded columns are saved, so that deferred columns of the
+            # stored news are not overwritten.
+            row = {c.key: state.dict[c.key] for c in table.columns
+                   if c.key in state.dict and c.key != 'created'}
+            row.update(
+                id=n.id,
+                schedule_id=schedule.id if schedule else n.schedule_id,
+                parent_id=parent.id if parent else None,
+                url=str(n.url),
+                updated=now,
+            )
+            rows.append(row)
+        return rows
+
+    def _group_news_rows(self, rows):
+        # executemany requires all rows to have the same columns.
+        rows = {(r['schedule_id'], r['url']): r for r in rows}.values()
+        keyfunc = lambda r: sorted(r)  # noqa
+        for _, group in itertools.groupby(sorted(rows, key=keyfunc), keyfunc):
+            for chunk in chunks(group, BULK_SAVE_CHUNK_SIZE):
+                yield chunk
+
+    def _upsert_news_rows(self, insert, rows):
+        table = self.News.__table__
+        for chunk in self._group_news_rows(rows):
+            chunk = [{k: v for k, v in r.items() if k != 'id'} for r in chunk]
+            statement = insert(table)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.schedule_id, table.c.url],
+                set_={k: statement.excluded[k] for k in chunk[0]
+                      if k not in ('schedule_id', 'url')}
+            )
+            self.session.execute(statement, chunk)
+
+    def _insert_news_rows(self, rows):
+        table = self.News.__table__
+        for chunk in self._group_news_rows(rows):
+            chunk = [{k: v for k, v in r.items() if k != 'id'} for r in chunk]
+            self.session.execute(table.insert(), chunk)
+
+    def _update_news_rows(self, rows):
+        table = self.News.__table__
+        for chunk in self._group_news_rows(rows):
+            chunk = [{'_' + k: v for k, v in r.items()} for r in chunk]
+            statement = table.update()\
+                .where(table.c.id == bindparam('_id'))\
+                .values({k[1:]: bindparam(k) for k in chunk[0] if k != '_id'})
+            self.session.execute(statement, chunk)
+
+    def _resolve_news_ids(self, news):
+        table = self.News.__table__
+        for chunk in chunks(news, BULK_SAVE_CHUNK_SIZE):
+            keys = {}
+            for n in chunk:
+                schedule_id = n.schedule.id if n.schedule else n.schedule_id
+                keys.setdefault((schedule_id, str(n.url)), []).append(n)
+
+            ids = self.session.execute(
+                select([table.c.schedule_id, table.c.url, table.c.id])
+                .where(and_(
+                    table.c.schedule_id.in_({s for s, _ in keys}),
+                    table.c.url.in_({u for _, u in keys}),
+                ))
+            )
+            for schedule_id, url, id in ids:
+                for n in keys.get((schedule_id, str(url)), []):
+                    n.id = id
+                    n.schedule_id = schedule_id
+                    parent = self.get_cached_parent(n)
+                    n.parent_id = parent.id if parent else None
+
     @staticmethod
     def _retrieve_session(model, *models):
         if not all([m.metadata.bind for m in models + (model,)]):
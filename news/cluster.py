@@ -0,0 +1,182 @@
+""":mod:`news.cluster` --- Scheduler cluster
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides a cluster class that partitions schedules between multiple scheduler
+nodes via redis.
+
+"""
+import os
+import time
+import uuid
+import bisect
+import socket
+import hashlib
+import threading
+from .utils.logging import logger
+from .constants import (
+    DEFAULT_CLUSTER_HEARTBEAT,
+    DEFAULT_CLUSTER_NODE_TIMEOUT,
+    DEFAULT_CLUSTER_REPLICAS,
+    REDIS_CLUSTER_NODES_KEY,
+)
+
+
+class HashRing(object):
+    """Consistent hash ring of nodes.
+
+    Only about `1 / n` of the keys move to other nodes when a node joins or
+    leaves a ring of `n` nodes.
+
+    :param nodes: Nodes of the ring.
+    :type nodes: Iterable of :class:`str`
+    :param replicas: Number of virtual points per node on the ring.
+    :type replicas: :class:`int`
+
+    """
+    def __init__(self, nodes=None, replicas=DEFAULT_CLUSTER_REPLICAS):
+        self.nodes = frozenset(nodes or [])
+        self.replicas = replicas
+
+        points = sorted(
+            (self._hash('{}:{}'.format(node, i)), node)
+            for node in self.nodes for i in range(replicas)
+        )
+        self._hashes = [h for h, _ in points]
+        self._nodes = [n for _, n in points]
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def get_node(self, key):
+        """Returns the node that the key belongs to.
+
+        :param key: Key to find the node of.
+        :type key: Any object that can be converted into :class:`str`
+        :returns: Node of the key. `None` if the ring is empty.
+        :rtype: :class:`str`
+
+        """
+        if not self._hashes:
+            return None
+        index = bisect.bisect(self._hashes, self._hash(str(key)))
+        return self._nodes[index % len(self._nodes)]
+
+    @staticmethod
+    def _hash(value):
+        digest = hashlib.md5(value.encode('utf-8')).digest()
+        return int.from_bytes(digest[:8], 'big')
+
+
+class Cluster(object):
+    """Partitions schedules between scheduler nodes sharing a redis.
+
+    Each node registers itself with a heartbeat to a redis sorted set, and
+    owns schedules whose ids are consistently hashed to it. Nodes that missed
+    their heartbeats are dropped from the cluster, and the remaining nodes
+    rebalance their schedules.
+
+    :param redis: A redis instance to use for membership.
+    :type redis: :class:`~redis.Redis`
+    :param node_id: Unique id of the node. Generated from the host name and
+        the process id if not given.
+    :type node_id: :class:`str`
+    :param heartbeat: Seconds between heartbeats of the node.
+    :type heartbeat: :class:`float`
+    :param timeout: Seconds after which nodes without heartbeats are dropped.
+    :type timeout: :class:`float`
+    :param replicas: Number of virtual points per node on the hash ring.
+    :type replicas: :class:`int`
+
+    *Example*::
+
+        from redis import Redis
+        from news.cluster import Cluster
+        from news.scheduler import Scheduler
+
+        redis = Redis()
+        cluster = Cluster(redis)
+
+        # run the same scheduler on as many nodes as you want.
+        scheduler = Scheduler(backend, celery, cluster=cluster)
+        scheduler.start()
+
+    """
+    def __init__(self, redis, node_id=None,
+                 heartbeat=DEFAULT_CLUSTER_HEARTBEAT,
+                 timeout=DEFAULT_CLUSTER_NODE_TIMEOUT,
+                 replicas=DEFAULT_CLUSTER_REPLICAS):
+        self.redis = redis
+        self.node_id = node_id or '{}:{}:{}'.format(
+            socket.gethostname(), os.getpid(), uuid.uuid4().hex[:8])
+        self.heartbeat = heartbeat
+        self.timeout = timeout
+        self.replicas = replicas
+        self.ring = HashRing([self.node_id], replicas=replicas)
+        self.scheduler = None
+        self.thread = None
+
+        self._stopped = threading.Event()
+
+    @property
+    def nodes(self):
+        """(:class:`frozenset`) Live nodes of the cluster."""
+        return self.ring.nodes
+
+    def start(self, scheduler):
+        self.scheduler = scheduler
+        self._stopped.clear()
+        self.beat()
+
+        def beat_forever():
+            while not self._stopped.wait(self.heartbeat):
+                if self.beat():
+                    self._log('Rebalancing over {} node(s)'.format(
+                        len(self.ring)))
+                    self.scheduler and self.scheduler.rebalance()
+
+        self.thread = threading.Thread(target=beat_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self.scheduler = None
+        self.redis.zrem(REDIS_CLUSTER_NODES_KEY, self.node_id)
+
+    def beat(self):
+        """Register a heartbeat of the node and refresh the cluster's
+        membership.
+
+        :returns: Whether the membership has been changed or not.
+        :rtype: :class:`bool`
+
+        """
+        now = time.time()
+        pipeline = self.redis.pipeline()
+        pipeline.zremrangebyscore(
+            REDIS_CLUSTER_NODES_KEY, '-inf', now - self.timeout)
+        pipeline.zadd(REDIS_CLUSTER_NODES_KEY, {self.node_id: now})
+        pipeline.zrange(REDIS_CLUSTER_NODES_KEY, 0, -1)
+        nodes = frozenset(
+            n.decode('utf-8') if isinstance(n, bytes) else n
+            for n in pipeline.execute()[-1]
+        )
+
+        if nodes == self.ring.nodes:
+            return False
+        self.ring = HashRing(nodes, replicas=self.replicas)
+        return True
+
+    def owns(self, id):
+        """Check if the schedule belongs to the node.
+
+        :param id: Id of the schedule.
+        :type id: :class:`int`
+        :returns: Whether the schedule belongs to the node or not.
+        :rtype: :class:`bool`
+
+        """
+        return self.ring.get_node(id) == self.node_id
+
+    def _log(self, message, tag='info'):
+        logging_method = getattr(logger, tag)
+        logging_method('[Cluster]: {}'.format(message))
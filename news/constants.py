@@ -3,16 +3,51 @@
 # ===============
 
 DEFAULT_MAX_VISIT = 200
+DEFAULT_VISITED_CAPACITY = DEFAULT_MAX_VISIT
 DEFAULT_EXT_BLACKLIST = ['png', 'jpg', 'gif', 'pdf', 'svg', 'zip']
+DEFAULT_HOST_RATE_BURST = 1
+DEFAULT_REVISIT_THRESHOLD = 0.5
+DEFAULT_MIN_CYCLE = 1
+DEFAULT_MAX_CYCLE = 24 * 60
+DEFAULT_TARGET_YIELD = 1
 DEFAULT_OPTIONS = {
     'max_dist': None,
     'max_visit': DEFAULT_MAX_VISIT,
     'ext_blacklist': DEFAULT_EXT_BLACKLIST,
     'url_whitelist': [],
     'url_blacklist': [],
+    'host_rate_limit': None,
+    'host_rate_burst': DEFAULT_HOST_RATE_BURST,
+    'revisit_threshold': DEFAULT_REVISIT_THRESHOLD,
+    'revisit_budget': None,
+    'adaptive_cycle': False,
+    'min_cycle': DEFAULT_MIN_CYCLE,
+    'max_cycle': DEFAULT_MAX_CYCLE,
+    'target_yield': DEFAULT_TARGET_YIELD,
+    'frontier_scorer': None,
+    'url_weights': {},
+    'visited_error_rate': None,
 }
 
 
+# ===============
+# Fetch defaults
+# ===============
+
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 10
+DEFAULT_DNS_CACHE_TTL = 300
+# seconds for which host rate limits of a schedule are kept after it's fetch.
+DEFAULT_HOST_LIMIT_TTL = 600
+
+
+# ================
+# Backend defaults
+# ================
+
+BULK_SAVE_CHUNK_SIZE = 500
+
+
 # ==============
 # Model defaults
 # ==============
@@ -22,23 +57,65 @@ DEFAULT_SCHEDULE_CYCLE = 300
 SCHEDULE_TYPE_MAX_LENGTH = 30
 AUTHOR_MAX_LENGTH = 100
 TITLE_MAX_LENGTH = 300
+FINGERPRINT_MAX_LENGTH = 32
+VALIDATOR_MAX_LENGTH = 255
 
 
 # =========
 # Scheduler
 # =========
 
-COVER_PUSHER_CYCLE = 5
+# conjugate of the golden ratio, which spreads sequential schedule ids evenly
+# over their cycles.
+SCHEDULE_PHASE_RATIO = (5 ** 0.5 - 1) / 2
+DEFAULT_SNAPSHOT_MAX_AGE = 60
+DEFAULT_BATCH_CONCURRENCY = 100
+DEFAULT_SCHEDULER_ID = 'default'
+
+
+# =======
+# Cluster
+# =======
+
+DEFAULT_CLUSTER_HEARTBEAT = 5
+DEFAULT_CLUSTER_NODE_TIMEOUT = 15
+DEFAULT_CLUSTER_REPLICAS = 100
+REDIS_CLUSTER_NODES_KEY = 'NEWS_SCHEDULER_NODES'
+
+
+# ========
+# Inflight
+# ========
+
+DEFAULT_COVER_DEADLINE = 60 * 60
+REDIS_INFLIGHT_KEY_PREFIX = 'NEWS_COVER_INFLIGHT:'
+
+
+# =====
+# Cycle
+# =====
+
+# maximum ratio by which an adaptive cycle is stretched or shrunk at once.
+CYCLE_ADAPT_FACTOR = 2
+REDIS_CYCLE_KEY = 'NEWS_SCHEDULE_CYCLES'
 
 
 # =========
 # Persister
 # =========
 
-REDIS_PUBSUB_SLEEP_TIME = 0.001
-REDIS_SCHEDULE_CREATE_CHANNEL = 'NEWS_SCHEDULE_CREATED'
-REDIS_SCHEDULE_UPDATE_CHANNEL = 'NEWS_SCHEDULE_UPDATED'
-REDIS_SCHEDULE_DELETE_CHANNEL = 'NEWS_SCHEDULE_DELETED'
+REDIS_STREAM_BLOCK_TIME = 1
+REDIS_STREAM_READ_COUNT = 1000
+DEFAULT_PERSIST_WINDOW = 0.05
+DEFAULT_CHANGE_LOG_MAX_LENGTH = 100000
+REDIS_SCHEDULE_CHANGE_STREAM = 'NEWS_SCHEDULE_CHANGES'
+REDIS_SCHEDULE_STAMP_KEY = 'NEWS_SCHEDULE_STAMPS'
+REDIS_PERSISTER_OFFSET_KEY_PREFIX = 'NEWS_PERSISTER_OFFSET:'
+# seconds to keep the offsets of the schedulers that have stopped.
+DEFAULT_PERSISTER_OFFSET_TTL = 7 * 24 * 60 * 60
+REDIS_SCHEDULE_CREATE_EVENT = 'NEWS_SCHEDULE_CREATED'
+REDIS_SCHEDULE_UPDATE_EVENT = 'NEWS_SCHEDULE_UPDATED'
+REDIS_SCHEDULE_DELETE_EVENT = 'NEWS_SCHEDULE_DELETED'
 
 
 # =======
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+from functools import wraps
+from urllib.parse import urlparse
+from ...constants import (
+    DEFAULT_HOST_RATE_BURST,
+    DEFAULT_HOST_LIMIT_TTL,
+)
+
+
+class TokenBucket(object):
+    """Reservation based token bucket.
+
+    Each acquisition reserves a token immediately and waits until the token
+    would have been refilled, so concurrent callers are served in order
+    without holding any lock across a suspension point.
+
+    :param rate: Number of tokens refilled per second.
+    :type rate: :class:`float`
+    :param burst: Maximum number of tokens that can be stored up.
+    :type burst: :class:`int`
+    :param ttl: Seconds for which limits of the bucket's users are kept after
+        their last use.
+    :type ttl: :class:`float`
+
+    """
+    def __init__(self, rate, burst=DEFAULT_HOST_RATE_BURST,
+                 ttl=DEFAULT_HOST_LIMIT_TTL):
+        self.rate = rate
+        self.burst = burst
+        self.ttl = ttl
+        self._tokens = burst
+        self._stamp = time.monotonic()
+        self._limits = {}
+        self._lock = threading.Lock()
+
+    def configure(self, rate, burst=DEFAULT_HOST_RATE_BURST):
+        """Replace the bucket's limits with the given ones. Tokens refilled
+        so far are kept up to the new burst."""
+        with self._lock:
+            self._set_limits(rate, burst)
+
+    def limit(self, key, rate, burst=DEFAULT_HOST_RATE_BURST):
+        """Register limits of a user of the bucket (e.g. a schedule). The
+        bucket is limited by the strictest limits among it's users that have
+        used it within the bucket's ttl, and reconfigured only when they
+        change.
+
+        :param key: Key of the user.
+        :type key: Any hashable
+        :param rate: Number of tokens refilled per second.
+        :type rate: :class:`float`
+        :param burst: Maximum number of tokens that can be stored up.
+        :type burst: :class:`int`
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._limits[key] = (rate, burst, now)
+            for k, (_, _, stamp) in list(self._limits.items()):
+                if now - stamp > self.ttl:
+                    del self._limits[k]
+
+            rate = min(r for r, _, _ in self._limits.values())
+            burst = min(b for _, b, _ in self._limits.values())
+            if (rate, burst) != (self.rate, self.burst):
+                self._set_limits(rate, burst)
+
+    def reserve(self):
+        """Reserve a token and return seconds to wait before using it."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return 0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def _set_limits(self, rate, burst):
+        self._refill()
+        self.rate = rate
+        self.burst = burst
+        self._tokens = min(self._tokens, self.burst)
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._stamp
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._stamp = now
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Process wide host buckets shared by all covers running in the process.
+__NEWS_HOST_BUCKETS__ = {}
+__NEWS_HOST_BUCKETS_LOCK__ = threading.Lock()
+
+
+def get_host_bucket(host, rate, burst=DEFAULT_HOST_RATE_BURST, key=None):
+    with __NEWS_HOST_BUCKETS_LOCK__:
+        try:
+            bucket = __NEWS_HOST_BUCKETS__[host]
+        except KeyError:
+            bucket = __NEWS_HOST_BUCKETS__[host] = TokenBucket(rate, burst)
+    bucket.limit(key, rate, burst)
+    return bucket
+
+
+def throttling_fetch_middleware(reporter, fetch):
+    @wraps(fetch)
+    async def enhanced(*args, **kwargs):
+        rate = reporter.options.get('host_rate_limit', None)
+        if rate:
+            burst = reporter.options.get('host_rate_burst',
+                                         DEFAULT_HOST_RATE_BURST)
+            host = urlparse(reporter.url).hostname
+            await get_host_bucket(host, rate, burst,
+                                  key=reporter.schedule.id).acquire()
+        return await fetch(*args, **kwargs)
+    return enhanced
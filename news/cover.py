@@ -5,7 +5,14 @@ News cover jobs to be run by reporters.
 
 """
 import asyncio
+import aiohttp
+from .crawl import CrawlState
 from .reporters import ReporterMeta
+from .constants import (
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_REVISIT_THRESHOLD,
+)
 
 
 class Cover(object):
@@ -24,11 +31,24 @@ class Cover(object):
         self.schedule = schedule
         self.backend = backend
         self.reporter = None
+        self.crawl_state = None
+        self.stored_urls = set()
+        self.session = None
+        self.runtime = None
         self.loop = None
 
+        self._connection_limit = DEFAULT_CONNECTION_LIMIT
+        self._connection_limit_per_host = DEFAULT_CONNECTION_LIMIT_PER_HOST
+
     def prepare(self, reporter_class,
                 dispatch_middlewares=None,
-                fetch_middlewares=None, **kwargs):
+                fetch_middlewares=None,
+                session=None,
+                executor=None,
+                connection_limit=DEFAULT_CONNECTION_LIMIT,
+                connection_limit_per_host=DEFAULT_CONNECTION_LIMIT_PER_HOST,
+                runtime=None,
+                **kwargs):
         """Prepare a reporter for the cover.
 
         :param reporter_class: Reporter class to use.
@@ -43,23 +63,72 @@ class Cover(object):
         :type fetch_middlewares: :class:`list` of functions that takes an
             reporter and it's fetch method as arguments and returns enhanced
             `fetch` method.
+        :param session: A http client session to be shared by the cover's
+            reporters. The cover will open it's own pooled session on
+            :meth:`run` if not given.
+        :type session: :class:`aiohttp.ClientSession`
+        :param executor: An executor to which the cover's reporters dispatch
+            their parsers. Parsers will be run on the cover's event loop if not
+            given.
+        :type executor: :class:`concurrent.futures.Executor`
+        :param connection_limit: Maximum number of simultaneous connections of
+            the cover's own pooled session.
+        :type connection_limit: :class:`int`
+        :param connection_limit_per_host: Maximum number of simultaneous
+            connections to a single host of the cover's own pooled session.
+        :type connection_limit_per_host: :class:`int`
+        :param runtime: A long-lived runtime to run the cover on. The cover
+            will use the runtime's event loop, session and executor unless
+            they are given explicitly.
+        :type runtime: :class:`~news.runtime.Runtime`
         :returns: Prepared cover itself.
         :rtype: `~news.cover.Cover`
 
         """
-        meta = ReporterMeta(self.schedule)
         backend = self.backend
 
+        # prefetch stored news of the schedule so that reporters don't have
+        # to query them one by one, along with the schedule's crawl state if
+        # the backend keeps them. reporters will query stored news one by
+        # one if the backend can't prefetch them.
+        try:
+            stored_news = backend.get_news_map(self.schedule)
+        except NotImplementedError:
+            stored_news = None
+        self.stored_urls = {str(url) for url in stored_news} if \
+            stored_news is not None else None
+        self.crawl_state = CrawlState.load(
+            self.schedule, backend, threshold=self.schedule.options.get(
+                'revisit_threshold', DEFAULT_REVISIT_THRESHOLD)
+        ) if backend.Page is not None else None
+        meta = ReporterMeta(self.schedule, stored_news=stored_news,
+                            crawl_state=self.crawl_state)
+
+        # take the runtime's resources unless they are given explicitly.
+        if runtime is not None:
+            session = session if session is not None else runtime.session
+            executor = executor if executor is not None else \
+                runtime.executor
+        self.runtime = runtime
+
+        # set http client session and connection limits of the cover.
+        self.session = session
+        self._connection_limit = connection_limit
+        self._connection_limit_per_host = connection_limit_per_host
+
         # set root reporter of the cover.
         self.reporter = reporter_class.create_instance(
             meta=meta, backend=backend,
             dispatch_middlewares=dispatch_middlewares,
             fetch_middlewares=fetch_middlewares,
+            session=session,
+            executor=executor,
             **kwargs
         ).enhance()
 
         # set event loop for the reporter
-        self.loop = asyncio.get_event_loop()
+        self.loop = runtime.loop if runtime is not None else \
+            asyncio.get_event_loop()
         return self
 
     def run(self, **dispatch_options):
@@ -78,6 +147,77 @@ class Cover(object):
         # prepare the reporter with bare experience and middlewares if he is
         # not ready to be dispatched yet.
         assert(self.reporter and self.loop), 'Cover is not prepared yet'
-        return self.loop.run_until_complete(
-            self.reporter.dispatch(**dispatch_options)
+        return self.loop.run_until_complete(self.dispatch(**dispatch_options))
+
+    async def dispatch(self, **dispatch_options):
+        """Dispatch the cover's root reporter within a pooled http client
+        session.
+
+        The session will be shared by the root reporter and all of it's
+        descendents so that connections to the same host can be kept alive
+        and reused along the whole cover.
+
+        :param **dispatch_options: Optional dispatch options that will be feed
+            to the reporter's `dispatch` method call.
+        :type **dispatch_options: :class:`dict`
+        :returns: A list of news.
+        :rtype: :class:`list`
+
+        """
+        assert(self.reporter), 'Cover is not prepared yet'
+
+        # keep the crawl state of the pages visited by the cover, even if
+        # the cover has failed halfway.
+        try:
+            return await self._dispatch(**dispatch_options)
+        finally:
+            if self.crawl_state is not None:
+                self.crawl_state.save()
+
+    async def _dispatch(self, **dispatch_options):
+        # dispatch the reporter with given session if we have any.
+        if self.session is not None:
+            return await self.reporter.dispatch(**dispatch_options)
+
+        # otherwise open our own pooled session for the cover. the session
+        # should be opened within the running loop.
+        async with self.make_session() as session:
+            self.reporter.session = session
+            try:
+                return await self.reporter.dispatch(**dispatch_options)
+            finally:
+                self.reporter.session = None
+
+    def count_yield(self, news):
+        """Count new or changed news among the news found by the cover.
+
+        News are counted as changed only if the backend keeps crawl states of
+        the schedule's pages. Otherwise only new news will be counted. All
+        news are counted as new if the backend can't prefetch stored news.
+
+        :param news: News found by the cover.
+        :type news: :class:`list`
+        :returns: Number of new or changed news.
+        :rtype: :class:`int`
+
+        """
+        if self.stored_urls is None:
+            return len(news)
+        changed = self.crawl_state.changed if self.crawl_state is not None \
+            else set()
+        return sum(1 for n in news if str(n.url) not in self.stored_urls or
+                   str(n.url) in changed)
+
+    def make_session(self):
+        """Make a pooled http client session with the cover's connection
+        limits.
+
+        :returns: A pooled http client session.
+        :rtype: :class:`aiohttp.ClientSession`
+
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self._connection_limit,
+            limit_per_host=self._connection_limit_per_host,
         )
+        return aiohttp.ClientSession(connector=connector)
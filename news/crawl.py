@@ -0,0 +1,261 @@
+""":mod:`news.crawl` --- Crawl state
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides crawl states of schedules that are kept between covers, so that
+covers revisit only new pages and pages that are likely to have changed.
+
+"""
+import math
+import hashlib
+from .constants import DEFAULT_REVISIT_THRESHOLD
+
+
+def fingerprint(content):
+    """Returns a fingerprint of the content.
+
+    :param content: Content to make fingerprint of.
+    :type content: :class:`str`
+    :returns: A 64-bit hexadecimal fingerprint of the content.
+    :rtype: :class:`str`
+
+    """
+    # truncated sha1, as blake2 isn't available until python 3.6.
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()[:16]
+
+
+class CrawlState(object):
+    """Crawl state of a schedule's pages from the previous covers.
+
+    Each page keeps the fingerprint of it's content, it's last fetched and
+    changed datetimes, it's http validators and the history of it's changes.
+    Pages visited by a cover are recorded to the state and saved to the
+    backend in bulk after the cover.
+
+    Change rates of the pages are estimated from their histories, assuming
+    that each page changes as a poisson process. A page will be revisited
+    once the probability that it has changed since it's last fetch reaches
+    the threshold, so that pages that change often are revisited often while
+    pages that rarely change are left alone.
+
+    :param schedule: Schedule of the pages.
+    :type schedule: :class:`~news.models.AbstractSchedule` implementation
+    :param backend: Backend to save the pages to.
+    :type backend: :class:`~news.backends.abstract.AbstractBackend`
+        implementation
+    :param pages: Url keyed dictionary of the schedule's stored pages.
+    :type pages: :class:`dict`
+    :param threshold: Change probability from which pages are considered
+        likely to have changed.
+    :type threshold: :class:`float`
+
+    *Example*::
+
+        from news.crawl import CrawlState
+
+        crawl_state = CrawlState.load(schedule, backend)
+        crawl_state.likely_changed(url)
+
+    """
+    def __init__(self, schedule, backend, pages=None,
+                 threshold=DEFAULT_REVISIT_THRESHOLD):
+        assert(0 < threshold < 1), 'Threshold should be between 0 and 1'
+        self.schedule = schedule
+        self.backend = backend
+        self.pages = pages if pages is not None else {}
+        self.threshold = threshold
+
+        self._recorded = {}
+        self._changed = set()
+
+    @classmethod
+    def load(cls, schedule, backend, **kwargs):
+        """Load crawl state of the schedule from the backend.
+
+        :param schedule: Schedule to load crawl state of.
+        :type schedule: :class:`~news.models.AbstractSchedule` implementation
+        :param backend: Backend to load the pages from.
+        :type backend: :class:`~news.backends.abstract.AbstractBackend`
+            implementation
+        :param **kwargs: Optional crawl state constructor arguments.
+        :type **kwargs: :class:`dict`
+        :returns: Crawl state of the schedule.
+        :rtype: :class:`~news.crawl.CrawlState`
+
+        """
+        return cls(schedule, backend, pages=backend.get_pages(schedule),
+                   **kwargs)
+
+    def __len__(self):
+        return len(self.pages)
+
+    def __contains__(self, url):
+        return url in self.pages
+
+    @property
+    def changed(self):
+        """(:class:`set`) Urls of the pages that have been found changed
+        since the crawl state has been loaded."""
+        return self._changed
+
+    def get(self, url):
+        """Returns the stored page of the url.
+
+        :param url: Url of the page.
+        :type url: :class:`str`
+        :returns: Page of the url or `None` if it has never been visited.
+        :rtype: :class:`~news.models.AbstractPage` implementation
+
+        """
+        return self.pages.get(url)
+
+    def headers(self, url):
+        """Returns conditional request headers for the url from it's stored
+        validators.
+
+        :param url: Url to fetch.
+        :type url: :class:`str`
+        :returns: `If-None-Match` and `If-Modified-Since` headers if the page
+            has any validators.
+        :rtype: :class:`dict`
+
+        """
+        page = self.pages.get(url)
+        headers = {}
+        if page is not None and page.etag:
+            headers['If-None-Match'] = page.etag
+        if page is not None and page.last_modified:
+            headers['If-Modified-Since'] = page.last_modified
+        return headers
+
+    def record(self, url, content=None, headers=None):
+        """Record a visit of the url.
+
+        :param url: Visited url.
+        :type url: :class:`str`
+        :param content: Fetched content of the url. `None` if the url has not
+            been modified since the last visit.
+        :type content: :class:`str`
+        :param headers: Response headers of the url.
+        :type headers: :class:`dict`-like
+        :returns: Page of the url.
+        :rtype: :class:`~news.models.AbstractPage` implementation
+
+        """
+        page = self.pages.get(url)
+        if page is None:
+            page = self.pages[url] = self.backend.Page.create_instance(
+                url=url, schedule=self.schedule)
+
+        now = self.backend.now()
+        revisited = page.fetched is not None
+        if revisited:
+            page.visits = (page.visits or 0) + 1
+        else:
+            page.discovered = now
+
+        if content is not None:
+            new_fingerprint = fingerprint(content)
+            if new_fingerprint != page.fingerprint:
+                # the content can't have changed if we've never seen it.
+                if revisited and page.fingerprint is not None:
+                    page.changes = (page.changes or 0) + 1
+                    self._changed.add(url)
+                page.fingerprint = new_fingerprint
+                page.changed = now
+        page.fetched = now
+
+        if headers is not None:
+            page.etag = headers.get('ETag')
+            page.last_modified = headers.get('Last-Modified')
+
+        self._recorded[url] = page
+        return page
+
+    def discard_validators(self, url):
+        """Discard stored validators of the url if any."""
+        page = self.pages.get(url)
+        if page is not None and (page.etag or page.last_modified):
+            page.etag = page.last_modified = None
+            self._recorded[url] = page
+
+    def change_rate(self, url):
+        """Estimate the change rate of the page of the url from it's history.
+
+        The rate is estimated with Cho and Garcia-Molina's estimator for
+        pages that are revisited in regular intervals, which stays finite
+        even if the page has been found changed on every revisit. Pages that
+        have never been found changed are expected to stay unchanged for as
+        long as they have been observed.
+
+        :param url: Url of the page.
+        :type url: :class:`str`
+        :returns: Estimated number of changes per second or `None` if the page
+            has not been revisited yet.
+        :rtype: :class:`float`
+
+        """
+        page = self.pages.get(url)
+        if page is None or not page.visits or \
+                page.fetched is None or page.discovered is None:
+            return None
+
+        observed = (page.fetched - page.discovered).total_seconds()
+        if observed <= 0:
+            return None
+
+        visits = page.visits
+        changes = min(page.changes or 0, visits)
+        interval = observed / visits
+        estimate = -math.log(
+            (visits - changes + 0.5) / (visits + 0.5)) / interval
+        return max(estimate, math.log(2) / observed)
+
+    def change_probability(self, url):
+        """Probability that the page of the url has changed since it's last
+        fetch.
+
+        :param url: Url of the page.
+        :type url: :class:`str`
+        :returns: Change probability of the page. New pages and pages that
+            have not been revisited yet are always considered to be changed.
+        :rtype: :class:`float`
+
+        """
+        rate = self.change_rate(url)
+        if rate is None:
+            return 1.
+        elapsed = (self.backend.now() - self.pages[url].fetched)\
+            .total_seconds()
+        return 1. - math.exp(-rate * max(elapsed, 0))
+
+    def likely_changed(self, url):
+        """Check if the page of the url is likely to have changed since it's
+        last visit.
+
+        :param url: Url of the page.
+        :type url: :class:`str`
+        :returns: Whether the page is worth to be fetched again or not.
+        :rtype: :class:`bool`
+
+        """
+        return self.change_probability(url) >= self.threshold
+
+    def due(self):
+        """Returns urls of the stored pages that are likely to have changed,
+        in descending order of their change probabilities.
+
+        :returns: Urls of the pages to revisit.
+        :rtype: :class:`list`
+
+        """
+        probabilities = {u: self.change_probability(u) for u in self.pages}
+        return sorted(
+            (u for u, p in probabilities.items() if p >= self.threshold),
+            key=probabilities.get, reverse=True
+        )
+
+    def save(self):
+        """Save pages recorded since the last save to the backend."""
+        if self._recorded:
+            recorded, self._recorded = self._recorded, {}
+            self.backend.save_pages(*recorded.values())
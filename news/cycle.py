@@ -0,0 +1,129 @@
+""":mod:`news.cycle` --- Adaptive schedule cycles
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides registries of effective cover intervals of schedules in adaptive
+cycle mode, which are tuned after each cover by the number of new or changed
+news that the cover has found.
+
+"""
+import threading
+from .constants import (
+    CYCLE_ADAPT_FACTOR,
+    REDIS_CYCLE_KEY,
+)
+
+
+def adapt_interval(interval, yielded, minimum, maximum, target=1,
+                   factor=CYCLE_ADAPT_FACTOR):
+    """Adapt a cover interval to the yield of the latest cover.
+
+    The interval is stretched when the cover has found fewer news than the
+    target and shrunk when it has found more, in proportion to the yield but
+    by no more than the factor at once.
+
+    :param interval: Current interval in seconds.
+    :type interval: :class:`float`
+    :param yielded: Number of new or changed news found by the cover.
+    :type yielded: :class:`int`
+    :param minimum: Minimum interval in seconds.
+    :type minimum: :class:`float`
+    :param maximum: Maximum interval in seconds.
+    :type maximum: :class:`float`
+    :param target: Number of new or changed news expected per cover.
+    :type target: :class:`float`
+    :param factor: Maximum ratio to stretch or shrink the interval by.
+    :type factor: :class:`float`
+    :returns: Next interval in seconds.
+    :rtype: :class:`float`
+
+    """
+    ratio = factor if not yielded else \
+        min(max(target / yielded, 1 / factor), factor)
+    return min(max(interval * ratio, minimum), maximum)
+
+
+class CycleRegistry(object):
+    """Cluster wide registry of adaptive cover intervals backed by redis.
+
+    Intervals are adapted by the workers that run the covers and picked up by
+    the scheduler that pushes them.
+
+    :param redis: A redis instance to use for the registry.
+    :type redis: :class:`~redis.Redis`
+
+    """
+    def __init__(self, redis):
+        self.redis = redis
+
+    def get(self, id):
+        """Returns the adapted interval of the schedule.
+
+        :param id: Id of the schedule.
+        :type id: :class:`int`
+        :returns: Interval in seconds or `None` if not adapted yet.
+        :rtype: :class:`float`
+
+        """
+        interval = self.redis.hget(REDIS_CYCLE_KEY, id)
+        return float(interval) if interval is not None else None
+
+    def get_many(self, ids):
+        """Returns the adapted intervals of the schedules within a single
+        round trip.
+
+        :param ids: Ids of the schedules.
+        :type ids: :class:`list`
+        :returns: Id keyed intervals of the schedules that have been adapted.
+        :rtype: :class:`dict`
+
+        """
+        if not ids:
+            return {}
+        intervals = self.redis.hmget(REDIS_CYCLE_KEY, ids)
+        return {id: float(i) for id, i in zip(ids, intervals)
+                if i is not None}
+
+    def set(self, id, interval):
+        """Set the adapted interval of the schedule.
+
+        :param id: Id of the schedule.
+        :type id: :class:`int`
+        :param interval: Interval in seconds.
+        :type interval: :class:`float`
+
+        """
+        self.redis.hset(REDIS_CYCLE_KEY, id, interval)
+
+    def discard(self, id):
+        """Discard the adapted interval of the schedule.
+
+        :param id: Id of the schedule.
+        :type id: :class:`int`
+
+        """
+        self.redis.hdel(REDIS_CYCLE_KEY, id)
+
+
+class LocalCycleRegistry(object):
+    """Process local registry of adaptive cover intervals. Should be used only
+    when covers are run within the scheduler's process."""
+    def __init__(self):
+        self._intervals = {}
+        self._lock = threading.Lock()
+
+    def get(self, id):
+        with self._lock:
+            return self._intervals.get(id)
+
+    def get_many(self, ids):
+        with self._lock:
+            return {id: self._intervals[id] for id in ids
+                    if id in self._intervals}
+
+    def set(self, id, interval):
+        with self._lock:
+            self._intervals[id] = interval
+
+    def discard(self, id):
+        with self._lock:
+            self._intervals.pop(id, None)
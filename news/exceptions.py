@@ -13,3 +13,9 @@ class NewsException(Exception):
 class HeterogenuousEngineError(NewsException):
     """Engine error that will be raised when either given sqlalchemy models
     doesn't share common engine"""
+
+
+class SchedulerConfigurationError(NewsException):
+    """Configuration error that will be raised when the scheduler is missing
+    a component required to run it's covers, e.g. a redis instance to share
+    state with the celery workers."""
@@ -0,0 +1,173 @@
+""":mod:`news.executor` --- Local cover executor
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides an in-process executor that runs covers on local event loops, so that
+schedulers can be run without celery and it's broker.
+
+"""
+import asyncio
+import itertools
+import threading
+import collections
+from celery import states
+from .runtime import init_runtime, close_runtime
+from .utils.logging import logger
+from .constants import DEFAULT_BATCH_CONCURRENCY
+
+
+# Status of a cover run by the local executor. Mimics celery's async result
+# so that :meth:`~news.models.AbstractSchedule.get_state` works with both.
+LocalResult = collections.namedtuple('LocalResult', 'id state')
+
+# tasks of a loop are listed by `Task.all_tasks` until python 3.7 and by
+# `asyncio.all_tasks` since then.
+_all_tasks = getattr(asyncio, 'all_tasks', None) or asyncio.Task.all_tasks
+
+
+class LocalExecutor(object):
+    """Runs covers of a scheduler on event loops of worker threads within the
+    scheduler's process.
+
+    Covers are handed over to the workers' loops right away instead of being
+    published to a broker and consumed by celery workers. Each worker runs
+    it's covers concurrently on it's own long-lived runtime, and cover
+    callbacks and in-flight registrations are handled the same way as the
+    celery tasks do.
+
+    Since cover callbacks are called from the worker threads, the scheduler's
+    backend should be safe to be used across threads if more than one worker
+    is used.
+
+    :param workers: Number of worker threads, each of which runs an event
+        loop.
+    :type workers: :class:`int`
+    :param concurrency: Maximum number of covers to run at the same time on
+        each worker.
+    :type concurrency: :class:`int`
+    :param runtime_options: Runtime constructor arguments of the workers.
+    :type runtime_options: :class:`dict`
+
+    *Example*::
+
+        from news.executor import LocalExecutor
+        from news.scheduler import Scheduler
+
+        scheduler = Scheduler(backend, executor=LocalExecutor())
+        scheduler.start()
+
+    """
+    def __init__(self, workers=1, concurrency=DEFAULT_BATCH_CONCURRENCY,
+                 runtime_options=None):
+        self.workers = workers
+        self.concurrency = concurrency
+        self.runtime_options = runtime_options or {}
+        self.scheduler = None
+        self.threads = []
+
+        self._loops = []
+        self._semaphores = []
+        self._states = {}
+        self._lock = threading.Lock()
+        self._cycle = None
+
+    @property
+    def running(self):
+        """(:class:`bool`) Whether the executor's workers are running or
+        not."""
+        return bool(self._loops)
+
+    def start(self, scheduler):
+        """Start worker threads of the executor.
+
+        :param scheduler: Scheduler whose covers will be run.
+        :type scheduler: :class:`~news.scheduler.Scheduler`
+
+        """
+        if self.running:
+            self.stop()
+
+        self.scheduler = scheduler
+        for _ in range(self.workers):
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._work, args=(ready,), daemon=True)
+            thread.start()
+            ready.wait()
+            self.threads.append(thread)
+        self._cycle = itertools.cycle(range(len(self._loops)))
+
+    def stop(self):
+        """Stop the worker threads. Covers that are still running will be
+        cancelled along with their worker's loop."""
+        loops, self._loops = self._loops, []
+        for loop in loops:
+            loop.call_soon_threadsafe(loop.stop)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+        self._semaphores = []
+        self.scheduler = None
+
+    def submit(self, id, snapshot=None):
+        """Submit a cover of the schedule to one of the workers.
+
+        :param id: Id of the schedule.
+        :type id: :class:`int`
+        :param snapshot: Snapshot of the schedule.
+        :type snapshot: :class:`dict`
+
+        """
+        assert(self.running), 'Executor is not started yet'
+        with self._lock:
+            index = next(self._cycle)
+            self._states[str(id)] = states.PENDING
+        asyncio.run_coroutine_threadsafe(
+            self._run(self._semaphores[index], id, snapshot),
+            self._loops[index]
+        )
+
+    def AsyncResult(self, id):
+        """Returns status of the schedule's cover. States are kept only while
+        covers are queued or running, so finished covers are reported as
+        pending, just as celery does without a result backend.
+
+        :param id: Id of the schedule.
+        :type id: :class:`str`
+        :returns: Status of the cover.
+        :rtype: :class:`~news.executor.LocalResult`
+
+        """
+        return LocalResult(id=id, state=self._states.get(
+            str(id), states.PENDING))
+
+    async def _run(self, semaphore, id, snapshot=None):
+        try:
+            async with semaphore:
+                self._states[str(id)] = states.STARTED
+                await self.scheduler._dispatch_cover(id, snapshot)
+        except asyncio.CancelledError:
+            # let the cover be pushed again by the next scheduler.
+            self.scheduler.inflight.release(id)
+            raise
+        finally:
+            # keep states of unfinished covers only.
+            self._states.pop(str(id), None)
+
+    def _work(self, ready):
+        runtime = init_runtime(**self.runtime_options)
+        with self._lock:
+            self._loops.append(runtime.loop)
+            self._semaphores.append(asyncio.Semaphore(self.concurrency))
+        ready.set()
+
+        try:
+            runtime.loop.run_forever()
+        except Exception as e:
+            logger.error('[LocalExecutor]: Worker stopped: {}'.format(e))
+        finally:
+            tasks = _all_tasks(runtime.loop)
+            for task in tasks:
+                task.cancel()
+            runtime.loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True))
+            close_runtime()
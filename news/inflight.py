@@ -0,0 +1,109 @@
+""":mod:`news.inflight` --- In-flight cover registry
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides registries of covers that have been pushed to the task queue but not
+finished yet, so that schedulers don't push duplicated covers of a schedule.
+
+"""
+import time
+import threading
+from .constants import (
+    DEFAULT_COVER_DEADLINE,
+    REDIS_INFLIGHT_KEY_PREFIX,
+)
+
+
+class InflightRegistry(object):
+    """Cluster wide registry of in-flight covers backed by redis.
+
+    Each in-flight cover holds a redis key that expires after the cover's
+    deadline, so that covers of stalled or lost tasks can be pushed again.
+
+    :param redis: A redis instance to use for the registry.
+    :type redis: :class:`~redis.Redis`
+    :param deadline: Seconds after which in-flight covers are considered
+        stalled.
+    :type deadline: :class:`int`
+
+    """
+    def __init__(self, redis, deadline=DEFAULT_COVER_DEADLINE):
+        self.redis = redis
+        self.deadline = deadline
+
+    def __contains__(self, id):
+        return bool(self.redis.exists(self._key(id)))
+
+    def acquire(self, id):
+        """Register a cover of the schedule as in-flight.
+
+        :param id: Id of the schedule.
+        :type id: :class:`int`
+        :returns: `False` if the schedule's cover is already in-flight.
+        :rtype: :class:`bool`
+
+        """
+        return bool(self.redis.set(
+            self._key(id), 1, nx=True, ex=int(self.deadline)))
+
+    def acquire_many(self, ids):
+        """Register covers of the schedules as in-flight within a single
+        round trip.
+
+        :param ids: Ids of the schedules.
+        :type ids: :class:`list`
+        :returns: Ids of the schedules whose covers were not in-flight.
+        :rtype: :class:`list`
+
+        """
+        pipeline = self.redis.pipeline(transaction=False)
+        for id in ids:
+            pipeline.set(self._key(id), 1, nx=True, ex=int(self.deadline))
+        return [id for id, acquired in zip(ids, pipeline.execute())
+                if acquired]
+
+    def release(self, id):
+        """Unregister the cover of the schedule.
+
+        :param id: Id of the schedule.
+        :type id: :class:`int`
+
+        """
+        self.redis.delete(self._key(id))
+
+    @staticmethod
+    def _key(id):
+        return '{}{}'.format(REDIS_INFLIGHT_KEY_PREFIX, id)
+
+
+class LocalInflightRegistry(object):
+    """Process local registry of in-flight covers. Should be used only when
+    covers are pushed by a single scheduler and released in it's process.
+
+    :param deadline: Seconds after which in-flight covers are considered
+        stalled.
+    :type deadline: :class:`int`
+
+    """
+    def __init__(self, deadline=DEFAULT_COVER_DEADLINE):
+        self.deadline = deadline
+        self._deadlines = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, id):
+        with self._lock:
+            return self._deadlines.get(id, 0) > time.monotonic()
+
+    def acquire(self, id):
+        now = time.monotonic()
+        with self._lock:
+            if self._deadlines.get(id, 0) > now:
+                return False
+            self._deadlines[id] = now + self.deadline
+            return True
+
+    def acquire_many(self, ids):
+        return [id for id in ids if self.acquire(id)]
+
+    def release(self, id):
+        with self._lock:
+            self._deadlines.pop(id, None)
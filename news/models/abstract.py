@@ -6,7 +6,8 @@ Provides abstract model interfaces that should be implemeted.
 """
 from celery import states as celery_states
 
-__all__ = ['AbstractModel', 'AbstractSchedule', 'AbstractNews']
+__all__ = ['AbstractModel', 'AbstractSchedule', 'AbstractNews',
+           'AbstractPage']
 
 
 # ===============
@@ -45,11 +46,16 @@ class AbstractSchedule(AbstractModel):
     #: (:class:`dict`) Schedule's options for reporters.
     options = NotImplementedError
 
+    #: (:class:`datetime.datetime`) Last time the schedule has been updated.
+    updated = NotImplementedError
+
     def get_state(self, celery):
         """Returns current celery task state of the schedule.
 
-        :param celery: Celery instance running for news fetch tasks.
-        :type celery: :class:`~celery.Celery`
+        :param celery: Celery instance running for news fetch tasks, or the
+            local executor running covers of the scheduler.
+        :type celery: :class:`~celery.Celery` or
+            :class:`~news.executor.LocalExecutor`
 
         """
         try:
@@ -159,6 +165,87 @@ class AbstractNews(AbstractModel):
         return 0 if not self.parent else self.parent.distance + 1
 
 
+class AbstractPage(AbstractModel):
+    """
+    Provides crawl state model interface of the pages visited by covers of
+    a schedule, that should be implemented by backends.
+
+    """
+    @classmethod
+    def create_instance(cls, url, schedule, fingerprint=None, fetched=None,
+                        changed=None, etag=None, last_modified=None,
+                        discovered=None, visits=0, changes=0):
+        """
+        Provides common interface to create models and abstracts different
+        behaviours of model constructors away from various types of orms.
+
+        :param url: Url of the page.
+        :type url: :class:`str`
+        :param schedule: Schedule that visited the page.
+        :type schedule: :class:`~news.models.AbstractSchedule` implementation
+        :param fingerprint: Fingerprint of the page's content.
+        :type fingerprint: :class:`str`
+        :param fetched: Last fetched datetime of the page.
+        :type fetched: :class:`~datetime.datetime`
+        :param changed: Last datetime when the page's content has been found
+            changed.
+        :type changed: :class:`~datetime.datetime`
+        :param etag: `ETag` validator of the page.
+        :type etag: :class:`str`
+        :param last_modified: `Last-Modified` validator of the page.
+        :type last_modified: :class:`str`
+        :param discovered: First fetched datetime of the page.
+        :type discovered: :class:`~datetime.datetime`
+        :param visits: Number of revisits of the page since it's discovery.
+        :type visits: :class:`int`
+        :param changes: Number of revisits on which the page's content has
+            been found changed.
+        :type changes: :class:`int`
+        :returns: Should return instance of a Page visited by a reporter.
+        :rtype: :class:`~news.models.AbstractPage` implementation
+
+        """
+        return cls(url=url, schedule=schedule, fingerprint=fingerprint,
+                   fetched=fetched, changed=changed, etag=etag,
+                   last_modified=last_modified, discovered=discovered,
+                   visits=visits, changes=changes)
+
+    #: (:class:`str`) Url of the page.
+    url = NotImplementedError
+
+    #: (:class:`news.models.abstract.AbstractSchedule` implementation)
+    #: Schedule that the page belongs to.
+    schedule = NotImplementedError
+
+    #: (:class:`str`) Fingerprint of the page's content.
+    fingerprint = NotImplementedError
+
+    #: (:class:`datetime.datetime`)
+    #: Last fetched datetime of the page.
+    fetched = NotImplementedError
+
+    #: (:class:`datetime.datetime`)
+    #: Last datetime when the page's content has been found changed.
+    changed = NotImplementedError
+
+    #: (:class:`str`) `ETag` validator of the page.
+    etag = NotImplementedError
+
+    #: (:class:`str`) `Last-Modified` validator of the page.
+    last_modified = NotImplementedError
+
+    #: (:class:`datetime.datetime`)
+    #: First fetched datetime of the page.
+    discovered = NotImplementedError
+
+    #: (:class:`int`) Number of revisits of the page since it's discovery.
+    visits = NotImplementedError
+
+    #: (:class:`int`) Number of revisits on which the page's content has been
+    #: found changed.
+    changes = NotImplementedError
+
+
 class Readable(AbstractNews):
     """Partial implementation of :class:`AbstractNews`.
 
@@ -172,7 +259,7 @@ class Readable(AbstractNews):
 
     """
     def __init__(self, title, content, summary, url=None,
-                 author=None, image=None, published=None):
+                 author=None, image=None, published=None, links=None):
         # `ReadableItem` doesn't contain any logical information than news
         # content itself.
         self.schedule = None
@@ -189,6 +276,9 @@ class Readable(AbstractNews):
         self.created = None
         self.updated = None
 
+        # hrefs of links found from the content if extracted by the parser.
+        self.links = links
+
     def kwargs(self, exclude=None):
         """Create kwargs needed for instantiating a news.
 
@@ -14,7 +14,8 @@ from jsonfield import JSONField
 
 from .abstract import (
     AbstractSchedule,
-    AbstractNews
+    AbstractNews,
+    AbstractPage,
 )
 from ..constants import (
     DEFAULT_SCHEDULE_CYCLE,
@@ -23,13 +24,15 @@ from ..constants import (
     SCHEDULE_TYPE_MAX_LENGTH,
     AUTHOR_MAX_LENGTH,
     TITLE_MAX_LENGTH,
+    FINGERPRINT_MAX_LENGTH,
+    VALIDATOR_MAX_LENGTH,
 )
 
 
 __all__ = [
-    'create_schedule_abc', 'create_news_abc',
-    'create_schedule', 'create_news',
-    'create_default_schedule', 'create_default_news'
+    'create_schedule_abc', 'create_news_abc', 'create_page_abc',
+    'create_schedule', 'create_news', 'create_page',
+    'create_default_schedule', 'create_default_news', 'create_default_page',
 ]
 
 
@@ -58,6 +61,7 @@ def create_schedule_abc(user_model=None):
         type = models.CharField(max_length=SCHEDULE_TYPE_MAX_LENGTH,
                                 default=DEFAULT_SCHEDULE_TYPE)
         options = JSONField(default=DEFAULT_OPTIONS)
+        updated = models.DateTimeField(auto_now=True, null=True)
 
         class Meta:
             abstract = True
@@ -104,6 +108,41 @@ def create_news_abc(schedule_model):
     return AbstractBaseNews
 
 
+def create_page_abc(schedule_model):
+    """Abstract base page model factory.
+
+    :param schedule_model: Schedule model to use as page's schedule.
+    :type schedule_model: Any concrete schedule model of abc models from
+        :func:`~create_abc_schedule` factory function.
+    :returns: A abstract base page model.
+    :rtype: Abstract base django model of
+        :class:`~news.models.AbstractPage` implementation
+
+    """
+    class AbstractBasePage(models.Model, AbstractPage):
+        schedule = models.ForeignKey(
+            schedule_model, related_name='pages',
+            db_index=True
+        )
+
+        url = models.URLField()
+        fingerprint = models.CharField(max_length=FINGERPRINT_MAX_LENGTH,
+                                       null=True)
+        fetched = models.DateTimeField(null=True)
+        changed = models.DateTimeField(null=True)
+        etag = models.CharField(max_length=VALIDATOR_MAX_LENGTH, null=True)
+        last_modified = models.CharField(max_length=VALIDATOR_MAX_LENGTH,
+                                         null=True)
+        discovered = models.DateTimeField(null=True)
+        visits = models.PositiveIntegerField(default=0)
+        changes = models.PositiveIntegerField(default=0)
+
+        class Meta:
+            abstract = True
+            unique_together = (('schedule', 'url'),)
+    return AbstractBasePage
+
+
 def create_schedule(abc_schedule, mixins=None, persister=None):
     """Concrete schedule model factory.
 
@@ -159,6 +198,26 @@ def create_news(abc_news, mixins=None):
     )
 
 
+def create_page(abc_page, mixins=None):
+    """Concrete page model factory.
+
+    :param abc_page: Abstract base page to use as base.
+    :type abc_page: Any ABC page from :func:`~create_page_abc` factory
+        function.
+    :param mixins: Mixins to be mixed into concrete page model.
+    :type mixins: Iterable mixin classes.
+    :returns: Concrete page model based on given abc page and mixins.
+    :rtype: :class:`~news.models.AbstractPage` Django implementation
+        based on given abc page and mixins.
+
+    """
+    mixins = mixins or tuple()
+    return type(
+        'Page', mixins + (abc_page,),
+        {'__module__': __name__}
+    )
+
+
 def create_default_schedule(user_model, persister=None):
     """Default schedule model factory.
 
@@ -187,3 +246,18 @@ def create_default_news(schedule_model):
     """
     news_abc = create_news_abc(schedule_model)
     return create_news(news_abc)
+
+
+def create_default_page(schedule_model):
+    """Default page model factory.
+
+    :param schedule_model: Schedule model to use as page's schedule.
+    :type schedule_model: :class:`~news.models.abstract.AbstractSchedule`
+        implementation
+    :returns: A default page model.
+    :rtype: Default Django :class:`~news.models.AbstractPage`
+        implementation
+
+    """
+    page_abc = create_page_abc(schedule_model)
+    return create_page(page_abc)
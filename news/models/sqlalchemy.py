@@ -28,7 +28,8 @@ from sqlalchemy_utils.types import (
 )
 from .abstract import (
     AbstractSchedule,
-    AbstractNews
+    AbstractNews,
+    AbstractPage,
 )
 from ..constants import (
     DEFAULT_SCHEDULE_CYCLE,
@@ -37,9 +38,9 @@ from ..constants import (
 )
 
 __all__ = [
-    'create_schedule_abc', 'create_news_abc',
-    'create_schedule', 'create_news',
-    'create_default_schedule', 'create_default_news',
+    'create_schedule_abc', 'create_news_abc', 'create_page_abc',
+    'create_schedule', 'create_news', 'create_page',
+    'create_default_schedule', 'create_default_news', 'create_default_page',
 ]
 
 
@@ -88,6 +89,8 @@ def create_schedule_abc(user_model):
             default=DEFAULT_SCHEDULE_TYPE
         )
         options = Column(JSONType, nullable=False, default=DEFAULT_OPTIONS)
+        updated = Column(DateTime, default=datetime.now,
+                         onupdate=datetime.now)
 
     return AbstractBaseSchedule
 
@@ -190,6 +193,73 @@ def create_news_abc(schedule_model):
     return AbstractBaseNews
 
 
+def create_page_abc(schedule_model):
+    """
+    Abstract base page model factory
+
+    :param schedule_model: Schedule model to use as page's schedule.
+    :type schedule_model: Any concrete schedule model of abc models from
+        :func:`~create_abc_schedule` factory function.
+    :returns: A abstract base page model.
+    :rtype: Abstract base sqlalchemy model of
+        :class:`~news.models.AbstractPage` implementation
+
+    """
+    class AbstractBasePage(AbstractPage):
+        __tablename__ = 'page'
+
+        @declared_attr
+        def __table_args__(cls):
+            return (UniqueConstraint('schedule_id', 'url'),)
+
+        @declared_attr
+        def schedule_id(cls):
+            return Column(Integer, ForeignKey('schedule.id'))
+
+        @declared_attr
+        def schedule(cls):
+            return relationship(
+                schedule_model,
+                backref=backref(
+                    'pages', cascade='all, delete-orphan',
+                    cascade_backrefs=False
+                ),
+            )
+
+        id = Column(Integer, primary_key=True)
+        url = Column(URLType, nullable=False)
+        fingerprint = Column(String, nullable=True)
+        fetched = Column(DateTime, nullable=True)
+        changed = Column(DateTime, nullable=True)
+        etag = Column(Text, nullable=True)
+        last_modified = Column(Text, nullable=True)
+        discovered = Column(DateTime, nullable=True)
+        visits = Column(Integer, nullable=False, default=0)
+        changes = Column(Integer, nullable=False, default=0)
+
+        def __init__(self, url='', schedule=None, fingerprint=None,
+                     fetched=None, changed=None, etag=None,
+                     last_modified=None, discovered=None, visits=0,
+                     changes=0):
+            self.url = url
+            self.schedule = schedule
+            self.fingerprint = fingerprint
+            self.fetched = fetched
+            self.changed = changed
+            self.etag = etag
+            self.last_modified = last_modified
+            self.discovered = discovered
+            self.visits = visits
+            self.changes = changes
+
+        def __repr__(self):
+            return 'Page {} of schedule {}'.format(
+                self.url, self.schedule_id
+            )
+
+    return AbstractBasePage
+
+
 def create_schedule(abc_schedule, base, mixins=None, persister=None):
     """Concrete schedule model factory.
 
@@ -249,6 +319,26 @@ def create_news(abc_news, base, mixins=None):
     return type('News', mixins + (abc_news, base), {})
 
 
+def create_page(abc_page, base, mixins=None):
+    """Concrete page model factory.
+
+    :param abc_page: Abstract base page to use as base.
+    :type abc_page: Any ABC page from :func:`~create_page_abc` factory
+        function.
+    :param base: SQLAlchemy model base to use.
+    :type base: Any SQLAlchemy model base from
+        :func:`sqlalchemy.ext.declarative.declarative_base` factory function
+    :param mixins: Mixins to be mixed into concrete page model.
+    :type mixins: Iterable mixin classes.
+    :returns: Concrete page model based on given abc page and mixins.
+    :rtype: :class:`~news.models.AbstractPage` SQLAlchemy
+        implementation based on given abc page and model base.
+
+    """
+    mixins = mixins or tuple()
+    return type('Page', mixins + (abc_page, base), {})
+
+
 def create_default_schedule(user_model, base, persister=None):
     """Default schedule model factory.
 
@@ -277,3 +367,18 @@ def create_default_news(schedule_model, base):
     """
     news_abc = create_news_abc(schedule_model, base)
     return create_news(news_abc, base)
+
+
+def create_default_page(schedule_model, base):
+    """Default page model factory.
+
+    :param schedule_model: Schedule model to use as page's schedule.
+    :type schedule_model: :class:`~news.models.abstract.AbstractSchedule`
+        implementation
+    :returns: A default page model.
+    :rtype: Default SQLAlchemy :class:`~news.models.AbstractPage`
+        implementation
+
+    """
+    page_abc = create_page_abc(schedule_model)
+    return create_page(page_abc, base)
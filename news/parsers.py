@@ -0,0 +1,132 @@
+""":mod:`news.parsers` --- Content parsers
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides module level parser functions used by reporters.
+
+Parsers only take and return picklable values(e.g. plain strings and
+:class:`~news.models.abstract.Readable`) so that they can be dispatched to
+a process pool executor without blocking the reporters' event loop.
+
+"""
+import feedparser
+from bs4 import BeautifulSoup
+from .models.abstract import Readable
+from .utils.url import fillurl
+
+# use lxml as default html parser backend if available.
+try:
+    import lxml  # noqa
+    DEFAULT_HTML_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_HTML_PARSER = 'html.parser'
+
+
+# meta tag names in order of preference for each readable attribute.
+TITLE_META = ('og:title', 'twitter:title')
+SUMMARY_META = ('og:description', 'twitter:description', 'description')
+IMAGE_META = ('og:image', 'twitter:image')
+
+
+def parse_html(url, content, features=DEFAULT_HTML_PARSER):
+    """Parses html content of http response body into a single
+    :class:`~news.models.abstract.Readable`.
+
+    Title, summary, image and links of the content are extracted together
+    within a single pass over the document. Opengraph and twitter card meta
+    tags are preferred over the ``<title>``, ``<h1>``, ``<p>`` and ``<img>``
+    tags.
+
+    :param url: Url of the content.
+    :type url: :class:`str`
+    :param content: Http response body
+    :type content: :class:`str`
+    :param features: Html parser backend of :class:`~bs4.BeautifulSoup` to
+        use. Defaults to `lxml` if available.
+    :type features: :class:`str`
+    :returns: A parsed readable carrying hrefs of the content's links.
+    :rtype: :class:`~news.models.abstract.Readable`
+
+    """
+    soup = BeautifulSoup(content, features)
+    meta = {}
+    first = {}
+    links = set()
+
+    for tag in soup.find_all(['meta', 'title', 'h1', 'p', 'img', 'a']):
+        name = tag.name
+        if name == 'a':
+            href = tag.get('href')
+            if href:
+                links.add(href)
+        elif name == 'meta':
+            key = tag.get('property') or tag.get('name')
+            value = tag.get('content')
+            if key and value:
+                meta.setdefault(key, value)
+        elif name == 'img':
+            src = tag.get('src')
+            if src:
+                first.setdefault(name, src)
+        elif name not in first:
+            text = tag.get_text(strip=True)
+            if text:
+                first[name] = text
+
+    def pick(keys, *fallbacks):
+        for key in keys:
+            if key in meta:
+                return meta[key]
+        for fallback in fallbacks:
+            if fallback in first:
+                return first[fallback]
+        return None
+
+    return Readable(
+        url=url, content=content, links=links,
+        title=pick(TITLE_META, 'title', 'h1'),
+        summary=pick(SUMMARY_META, 'p'),
+        image=pick(IMAGE_META, 'img'),
+    )
+
+
+def parse_feed(url, content):
+    """Parses feed content of http response body into multiple
+    :class:`~news.models.abstract.Readable`s.
+
+    Internally uses :mod:`~feedparser` library to extract entries from the
+    response body.
+
+    :param url: Url of the feed.
+    :type url: :class:`str`
+    :param content: Http response body
+    :type content: :class:`str`
+    :returns: A list of parsed readables
+    :rtype: :class:`list` of :class:`~news.models.abstract.Readable`
+
+    """
+    f = feedparser.parse(content)
+    return [Readable(
+        author=e.author, title=e.title, content=e.content, url=e.link,
+        summary=e.summary, image=f.image) for e in f.entries]
+
+
+def extract_links(index, content, features=DEFAULT_HTML_PARSER):
+    """Extract urls of all links from html content.
+
+    Used only when the content didn't come from :func:`parse_html`(e.g.
+    news restored from the backend).
+
+    :param index: Url to fill relative links with.
+    :type index: :class:`str`
+    :param content: Html content.
+    :type content: :class:`str`
+    :param features: Html parser backend of :class:`~bs4.BeautifulSoup` to
+        use. Defaults to `lxml` if available.
+    :type features: :class:`str`
+    :returns: A set of filled urls.
+    :rtype: :class:`set`
+
+    """
+    atags = BeautifulSoup(content, features)('a')
+    links = {a['href'] for a in atags if a.has_attr('href')}
+    return {fillurl(index, l) for l in links}
@@ -5,22 +5,52 @@ Provides a persister class that will persist schedules along multiple
 processes or threads.
 
 """
+import time
+import threading
+import collections
 from redis.exceptions import ConnectionError
 from .utils.logging import logger
+from .utils.python import timestamp
 from .constants import (
-    REDIS_PUBSUB_SLEEP_TIME,
-    REDIS_SCHEDULE_CREATE_CHANNEL,
-    REDIS_SCHEDULE_UPDATE_CHANNEL,
-    REDIS_SCHEDULE_DELETE_CHANNEL,
+    REDIS_STREAM_BLOCK_TIME,
+    REDIS_STREAM_READ_COUNT,
+    DEFAULT_PERSIST_WINDOW,
+    DEFAULT_CHANGE_LOG_MAX_LENGTH,
+    REDIS_SCHEDULE_CHANGE_STREAM,
+    REDIS_SCHEDULE_STAMP_KEY,
+    REDIS_PERSISTER_OFFSET_KEY_PREFIX,
+    DEFAULT_PERSISTER_OFFSET_TTL,
+    REDIS_SCHEDULE_CREATE_EVENT,
+    REDIS_SCHEDULE_UPDATE_EVENT,
+    REDIS_SCHEDULE_DELETE_EVENT,
 )
 
 
 class Persister(object):
-    """Persists schedule states along multiple processes or threads via redis
-    channels.
+    """Persists schedule states along multiple processes or threads via a
+    redis stream of schedule changes.
+
+    Changes are read from the stream on a blocking thread, and changes of the
+    same schedule within the persister's window are coalesced into it's latest
+    one. Schedules changed within a window are reconciled with a single backend
+    query.
+
+    The persister keeps the offset of the last change it has persisted on
+    redis under the scheduler's id, so that changes made while it has been
+    stopped, disconnected or restarted are replayed once it's back. Schedules
+    are reloaded entirely only if the missed changes have been trimmed from
+    the stream.
 
     :param redis: A redis instance to use for persistence.
     :type redis: :class:`~redis.Redis`
+    :param context: Context to persist schedules within (e.g. an app context).
+    :type context: A context manager
+    :param window: Seconds to coalesce change events for, after the first
+        event has been received.
+    :type window: :class:`float`
+    :param max_length: Approximate number of latest changes to keep in the
+        stream.
+    :type max_length: :class:`int`
 
     *Example*::
 
@@ -45,14 +75,18 @@ class Persister(object):
         scheduler.configure(persister=persister)
 
     """
-    def __init__(self, redis, context=None):
+    def __init__(self, redis, context=None, window=DEFAULT_PERSIST_WINDOW,
+                 max_length=DEFAULT_CHANGE_LOG_MAX_LENGTH):
         self.scheduler = None
         self.redis = redis
-        self.pubsub = self.redis.pubsub()
         self.thread = None
+        self.window = window
+        self.max_length = max_length
+        self.offset = None
 
         self._context = context
         self._cache = {}
+        self._stopped = threading.Event()
 
     @property
     def context(self):
@@ -67,72 +101,224 @@ class Persister(object):
             return
 
         self.scheduler = scheduler
-        self.pubsub.subscribe(**{
-            REDIS_SCHEDULE_CREATE_CHANNEL: lambda message:
-            self.persist_save(int(message['data']), True),
-
-            REDIS_SCHEDULE_UPDATE_CHANNEL: lambda message:
-            self.persist_save(int(message['data']), False),
-
-            REDIS_SCHEDULE_DELETE_CHANNEL: lambda message:
-            self.persist_delete(int(message['data']))
-        })
-        self.thread = self.pubsub.run_in_thread(
-            sleep_time=REDIS_PUBSUB_SLEEP_TIME)
+        self._stopped.clear()
+
+        # resume from the last change we've persisted, or start from the
+        # tail of the stream on the scheduler's first start. schedules are
+        # loaded after this, so changes made during the load are not missed.
+        key = self._get_offset_key()
+        if self.offset is None:
+            self.offset = self._load_offset(key)
+        if self.offset is None:
+            self.offset = self._get_tail()
+            self._save_offset(key, self.offset)
+        elif self._trimmed():
+            self.reload()
+
+        # the listener keeps the key to itself, since the scheduler is let go
+        # on stop even if the listener is still finishing it's last read.
+        self.thread = threading.Thread(
+            target=self._listen, args=(key,), daemon=True)
+        self.thread.start()
 
     def stop(self):
+        self._stopped.set()
+        if self.thread:
+            self.thread.join(REDIS_STREAM_BLOCK_TIME * 2)
+            self.thread = None
+
+        # let offsets of the schedulers that never come back expire.
+        if self.scheduler and self._redis_available():
+            try:
+                self.redis.expire(self._get_offset_key(),
+                                  DEFAULT_PERSISTER_OFFSET_TTL)
+            except ConnectionError:
+                pass
         self.scheduler = None
-        self.thread and self.thread.stop()
 
     # ====================
     # Schedule persistence
     # ====================
 
-    def persist_save(self, id, created):
-        if not self.scheduler:
+    def persist(self, changes):
+        """Reconcile the scheduler with coalesced schedule changes.
+
+        :param changes: Dictionary from ids of the changed schedules to whether
+            they have been deleted or not.
+        :type changes: :class:`dict`
+
+        """
+        if not self.scheduler or not changes:
             return
 
-        # persist schedule in app context if given any
+        # persist schedules in app context if given any
         if self.context:
             with self.context:
-                created and self.scheduler.add(id, silent=False)
-                not created and self.scheduler.update(id)
-        # otherwise persist schedule without any context
+                self._persist(changes)
+        # otherwise persist schedules without any context
         else:
-            created and self.scheduler.add(id, silent=False)
-            not created and self.scheduler.update(id)
+            self._persist(changes)
 
-    def persist_delete(self, id):
+    def reload(self):
+        """Reload all schedules of the scheduler from the backend."""
         if not self.scheduler:
             return
 
-        # persist schedule in app context if given any
+        logger.warning('[Persister]: Schedule changes might have been ' +
+                       'missed. Reloading all schedules')
         if self.context:
             with self.context:
-                self.scheduler.remove(id, silent=False)
-        # otherwise persist schedule without any context
+                self.scheduler.reload()
         else:
-            self.scheduler.remove(id, silent=False)
+            self.scheduler.reload()
+
+    def get_stamp(self, id):
+        """Returns the `updated` stamp of the schedule's latest change.
+
+        :param id: Id of the schedule.
+        :type id: :class:`int`
+        :returns: Timestamp of the change, `inf` if the schedule has been
+            deleted or `None` if unknown.
+        :rtype: :class:`float`
+
+        """
+        if not self._redis_available():
+            return None
+        try:
+            stamp = self.redis.hget(REDIS_SCHEDULE_STAMP_KEY, id)
+        except ConnectionError:
+            return None
+        return float(stamp) if stamp is not None else None
+
+    def persist_save(self, id, created):
+        self.persist({id: False})
+
+    def persist_delete(self, id):
+        self.persist({id: True})
+
+    def _persist(self, changes):
+        saved = [id for id, deleted in changes.items() if not deleted]
+        for id, deleted in changes.items():
+            deleted and self.scheduler.remove(id, silent=False)
+
+        # reconcile all saved schedules with a single query.
+        schedules = {s.id: s for s in self.scheduler.backend.get_schedules(
+            ids=saved)} if saved else {}
+        for id in saved:
+            if id in schedules:
+                self.scheduler.update(schedules[id])
+            else:
+                self.scheduler.remove(id, silent=False)
+
+    def _listen(self, key):
+        changes = collections.OrderedDict()
+        deadline = None
+
+        disconnected = False
+
+        while not self._stopped.is_set():
+            # block until changes arrive or the window closes.
+            timeout = REDIS_STREAM_BLOCK_TIME if deadline is None else \
+                max(deadline - time.monotonic(), 0)
+            try:
+                if disconnected and self._trimmed():
+                    self.reload()
+                response = self.redis.xread(
+                    {REDIS_SCHEDULE_CHANGE_STREAM: self.offset},
+                    count=REDIS_STREAM_READ_COUNT,
+                    block=int(timeout * 1000) or None,
+                )
+                disconnected = False
+            except ConnectionError as e:
+                logger.error('[Persister]: Lost connection: {}'.format(e))
+                disconnected = True
+                self._stopped.wait(REDIS_STREAM_BLOCK_TIME)
+                continue
+
+            # coalesce changes of the same schedule into the latest one.
+            for _, entries in response or []:
+                for offset, fields in entries:
+                    fields = {self._decode(k): self._decode(v) for k, v in
+                              fields.items()}
+                    id = int(fields['id'])
+                    changes.pop(id, None)
+                    changes[id] = \
+                        fields['event'] == REDIS_SCHEDULE_DELETE_EVENT
+                    self.offset = self._decode(offset)
+                if entries and deadline is None:
+                    deadline = time.monotonic() + self.window
+
+            if deadline is not None and time.monotonic() >= deadline:
+                coalesced, changes, deadline = \
+                    changes, collections.OrderedDict(), None
+                try:
+                    self.persist(coalesced)
+                    self._save_offset(key, self.offset)
+                except Exception as e:
+                    logger.error(
+                        '[Persister]: Failed to persist schedules: {}'
+                        .format(e))
 
     # ============================
     # Schedule change notification
     # ============================
 
     def notify_saved(self, instance, created, **kwargs):
-        if self._redis_available():
-            self.redis.publish(REDIS_SCHEDULE_CREATE_CHANNEL if created else
-                               REDIS_SCHEDULE_UPDATE_CHANNEL, str(instance.id))
+        self._notify(instance.id, REDIS_SCHEDULE_CREATE_EVENT if created else
+                     REDIS_SCHEDULE_UPDATE_EVENT,
+                     timestamp(getattr(instance, 'updated', None)))
 
     def notify_deleted(self, instance, **kwargs):
-        if self._redis_available():
-            self.redis.publish(REDIS_SCHEDULE_DELETE_CHANNEL, str(instance.id))
+        self._notify(instance.id, REDIS_SCHEDULE_DELETE_EVENT, float('inf'))
+
+    def _notify(self, id, event, stamp=None):
+        if not self._redis_available():
+            return
+
+        # stamps of the changes let workers tell stale schedule snapshots.
+        pipeline = self.redis.pipeline(transaction=False)
+        pipeline.xadd(
+            REDIS_SCHEDULE_CHANGE_STREAM, {'id': str(id), 'event': event},
+            maxlen=self.max_length, approximate=True
+        )
+        if stamp is not None:
+            pipeline.hset(REDIS_SCHEDULE_STAMP_KEY, id, stamp)
+        pipeline.execute()
+
+    def _load_offset(self, key):
+        offset = self.redis.get(key)
+        return self._decode(offset) if offset is not None else None
+
+    def _save_offset(self, key, offset):
+        self.redis.set(key, offset)
+
+    def _get_offset_key(self):
+        return '{}{}'.format(REDIS_PERSISTER_OFFSET_KEY_PREFIX,
+                             self.scheduler.id)
+
+    def _get_tail(self):
+        entries = self.redis.xrevrange(REDIS_SCHEDULE_CHANGE_STREAM, count=1)
+        return self._decode(entries[0][0]) if entries else '0-0'
+
+    def _trimmed(self):
+        # changes after our offset might have been trimmed, unless the
+        # stream still holds the offset or the ones before it. streams are
+        # trimmed only after they've grown to their max length.
+        entries = self.redis.xrange(REDIS_SCHEDULE_CHANGE_STREAM, count=1)
+        if not entries:
+            return self.offset != '0-0'
+        if self.offset == '0-0':
+            return self.redis.xlen(REDIS_SCHEDULE_CHANGE_STREAM) >= \
+                self.max_length
+        return self._parse_offset(self._decode(entries[0][0])) > \
+            self._parse_offset(self.offset)
 
     def _redis_available(self):
         if 'redis_available' in self._cache:
             return self._cache['redis_available']
 
         try:
-            self.redis.get(None)
+            self.redis.ping()
             available = True
         except ConnectionError:
             logger.warning(
@@ -148,3 +334,11 @@ class Persister(object):
 
     def _flush_cache(self, name):
         return self._cache.pop(name)
+
+    @staticmethod
+    def _parse_offset(offset):
+        return tuple(int(part) for part in offset.split('-'))
+
+    @staticmethod
+    def _decode(value):
+        return value.decode('utf-8') if isinstance(value, bytes) else value
@@ -18,15 +18,35 @@ class ReporterMeta(object):
     :param schedule: Schedule that will be assigned to the reporter.
     :type schedule: :class:`news.models.abstract.AbstractSchedule`
         implementation
+    :param stored_news: Url keyed index of the schedule's stored news. Should
+        be prefetched with
+        :meth:`~news.backends.abstract.AbstractBackend.get_news_map`.
+    :type stored_news: :class:`dict`
+    :param crawl_state: Crawl state of the schedule from the previous covers.
+    :type crawl_state: :class:`~news.crawl.CrawlState`
 
     """
-    def __init__(self, schedule):
+    def __init__(self, schedule, stored_news=None, crawl_state=None):
         self._schedule = schedule
+        self._stored_news = stored_news
+        self._crawl_state = crawl_state
 
     @property
     def schedule(self):
         return self._schedule
 
+    @property
+    def stored_news(self):
+        """(:class:`dict`) Url keyed index of the schedule's stored news.
+        `None` if the index has not been prefetched."""
+        return self._stored_news
+
+    @property
+    def crawl_state(self):
+        """(:class:`~news.crawl.CrawlState`) Crawl state of the schedule.
+        `None` if crawl states are not kept by the backend."""
+        return self._crawl_state
+
     @property
     def owner(self):
         """(:class:`~news.models.AbstractSchedule` implemntation) Owner of the
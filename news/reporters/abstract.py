@@ -6,18 +6,28 @@ Provide abstract base classes for reporters.
 """
 import copy
 import functools
+import asyncio
 import aiohttp
 
 
 class Reporter(object):
     """Abstract base class for all reporters."""
 
+    #: (function) Module level parser function that takes an url and it's
+    #: content and returns either a list of items or an item. Parser should
+    #: be picklable so that it can be dispatched to the reporter's
+    #: :attr:`executor`. Defaults to `None`.
+    parser = None
+
     def __init__(self, meta, backend, url=None,
                  dispatch_middlewares=None,
-                 fetch_middlewares=None, **kwargs):
+                 fetch_middlewares=None, session=None,
+                 executor=None, **kwargs):
         self.url = url or meta.schedule.url
         self.meta = meta
         self.backend = backend
+        self.session = session
+        self.executor = executor
 
         self._fetch_middlewares = fetch_middlewares or []
         self._fetch_middlewares_applied = []
@@ -28,7 +38,8 @@ class Reporter(object):
     def create_instance(
             cls, meta, backend, url=None,
             dispatch_middlewares=None,
-            fetch_middlewares=None, **kwargs):
+            fetch_middlewares=None, session=None,
+            executor=None, **kwargs):
         """Create an reporter.
 
         :param url: A url to assign to a reporter.
@@ -41,6 +52,12 @@ class Reporter(object):
         :type dispatch_middlewares: :class:`list`
         :param fetch_middlewares: Fetch middlewares to apply.
         :type fetch_middlewares: :class:`list`
+        :param session: A http client session to fetch urls with. A throwaway
+            session will be used for each fetch if not given.
+        :type session: :class:`aiohttp.ClientSession`
+        :param executor: An executor to dispatch parsers to. Parsers will be
+            run on the reporter's event loop if not given.
+        :type executor: :class:`concurrent.futures.Executor`
 
         :returns: An instance of a `Reporter` implementation.
         :rtype: `Reporter` implementation.
@@ -48,7 +65,8 @@ class Reporter(object):
         """
         return cls(meta=meta, backend=backend, url=url,
                    dispatch_middlewares=dispatch_middlewares,
-                   fetch_middlewares=fetch_middlewares, **kwargs)
+                   fetch_middlewares=fetch_middlewares, session=session,
+                   executor=executor, **kwargs)
 
     @property
     def schedule(self):
@@ -67,6 +85,26 @@ class Reporter(object):
         reporter."""
         return self.meta.owner
 
+    @property
+    def crawl_state(self):
+        """(:class:`~news.crawl.CrawlState`) Crawl state of the reporter's
+        schedule from the previous covers."""
+        return self.meta.crawl_state
+
+    def get_stored_news(self):
+        """Get the stored news of the reporter's url.
+
+        The news will be looked up from the meta's prefetched index if
+        available. Otherwise the backend will be queried.
+
+        :returns: A stored news or `None` if we don't have any.
+        :rtype: :class:`~news.models.AbstractNews` implementation
+
+        """
+        if self.meta.stored_news is not None:
+            return self.meta.stored_news.get(self.url)
+        return self.backend.get_news_by(owner=self.owner, url=self.url)
+
     def report_news(self, *news):
         """Report news to the backend.
 
@@ -83,22 +121,59 @@ class Reporter(object):
         :rtype: :class:`list` or `~news.models.AbstractNews` implemnetation.
 
         """
-        async with aiohttp.get(self.url) as response:
+        # fall back to a throwaway session if the reporter has not been given
+        # any pooled session from it's cover.
+        if self.session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self._fetch(session)
+        else:
+            return await self._fetch(self.session)
+
+    async def _fetch(self, session, conditional=True):
+        # revalidate the url with it's validators from the crawl state if we
+        # have any.
+        crawl_state = self.crawl_state
+        headers = crawl_state.headers(self.url) if \
+            conditional and crawl_state is not None else None
+
+        async with session.get(self.url, headers=headers) as response:
+            # restore stored news if the url has not been modified since the
+            # last fetch.
+            if response.status == 304:
+                stored = self.restore()
+                if stored is not None:
+                    if crawl_state is not None:
+                        crawl_state.record(self.url)
+                    return stored
+
             # return nothing if status code is not OK
-            if response.status != 200:
+            elif response.status != 200:
                 return None
 
-            # make news from the response
-            items = self.parse(await response.text())
-
-            # return a single news if we have only one. return a list of news
-            # if we have more than a single news.
-            try:
-                return (self.make_news(item) for item in items)
-            except TypeError:
-                item = items
-                news = self.make_news(item)
-                return news
+            else:
+                # record the visit to the crawl state of the schedule.
+                content = await response.text()
+                if crawl_state is not None:
+                    crawl_state.record(self.url, content, response.headers)
+
+                # make news from the response
+                items = await self.parse_async(content)
+
+                # return a single news if we have only one. return a list of
+                # news if we have more than a single news.
+                try:
+                    return (self.make_news(item) for item in items)
+                except TypeError:
+                    item = items
+                    news = self.make_news(item)
+                    return news
+
+        # fetch the url again without validators if we failed to restore any
+        # stored news of the url.
+        if not headers:
+            return None
+        crawl_state.discard_validators(self.url)
+        return await self._fetch(session, conditional=False)
 
     async def dispatch(self):
         """Dispatches the reporter to it's url and returns a list of news.
@@ -115,14 +190,62 @@ class Reporter(object):
     def parse(self, content):
         """Parses fetched response body into a list of items.
 
-        Should be implemented by all reporter subclasses. Defaults to rasing
-        `NotImplementedError`.
+        Defaults to running the reporter's :attr:`parser`. Should be
+        implemented by reporter subclasses which don't have any parser.
 
+        :param content: Http response body
+        :type content: :class:`str`
         :returns: A list of items each to be passed to `make_news` method.
         :rtype: :class:`list`
 
         """
-        raise NotImplementedError
+        if self.parser is None:
+            raise NotImplementedError
+        return self.parser(self.url, content)
+
+    async def parse_async(self, content):
+        """Parses fetched response body on the reporter's :attr:`executor`.
+
+        Falls back to :meth:`parse` on the event loop if the reporter doesn't
+        have any executor or parser, or :meth:`parse` has been overriden.
+
+        :param content: Http response body
+        :type content: :class:`str`
+        :returns: A list of items each to be passed to `make_news` method.
+        :rtype: :class:`list`
+
+        """
+        if self.executor is None or self.parser is None or \
+                type(self).parse is not Reporter.parse:
+            return self.parse(content)
+        return await self.run_in_executor(self.parser, self.url, content)
+
+    async def run_in_executor(self, function, *args):
+        """Run a picklable function on the reporter's :attr:`executor`.
+
+        :param function: A module level function to run.
+        :type function: function
+        :param *args: Picklable arguments of the function.
+        :returns: Result of the function.
+
+        """
+        if self.executor is None:
+            return function(*args)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    def restore(self):
+        """Restore stored news of the reporter's url from the backend.
+
+        Called instead of :meth:`parse` and :meth:`make_news` when the url has
+        not been modified since the last fetch. Defaults to `None`, which
+        makes the reporter fetch the url again without validators.
+
+        :returns: Either a list of stored news or a stored news.
+        :rtype: :class:`list` or `~news.models.AbstractNews` implemnetation.
+
+        """
+        return None
 
     def make_news(self, item):
         """Make a news instance from the passed item.
@@ -4,9 +4,8 @@
 Provide concrete feed news reporters.
 
 """
-import feedparser
-from ..models.abstract import Readable
 from .generics import FeedReporter
+from ..parsers import parse_feed
 
 
 class RSSReporter(FeedReporter):
@@ -18,23 +17,7 @@ class RSSReporter(FeedReporter):
     :type backend: :class:`news.backends.abstract.AbstractBackend`
 
     """
-    def parse(self, content):
-        """Parses feed content of http response body into multiple
-        :class:`news.models.abstract.Readable`s.
-
-        Internally uses :mod:`~feedparser` library to extract entries from the
-        response body.
-
-        :param content: Http response body
-        :type content: :class:`str`
-        :returns: An iterator of parsed readables
-        :rtype: An iterator of :class:`news.models.abstract.Readable`
-
-        """
-        f = feedparser.parse(content)
-        return (Readable(
-            author=e.author, title=e.title, content=e.content, url=e.link,
-            summary=e.summary, image=f.image) for e in f.entries)
+    parser = staticmethod(parse_feed)
 
     def make_news(self, readable):
         """Instantiate a news out of the readable parsed from :meth:`parse`.
@@ -58,23 +41,7 @@ class AtomReporter(FeedReporter):
     :type backend: :class:`news.backends.abstract.AbstractBackend`
 
     """
-    def parse(self, content):
-        """Parses feed content of http response body into multiple
-        :class:`news.models.abstract.Readable`s.
-
-        Internally uses :mod:`~feedparser` library to extract entries from the
-        response body.
-
-        :param content: Http response body
-        :type content: :class:`str`
-        :returns: An iterator of parsed readables
-        :rtype: An iterator of :class:`news.models.abstract.Readable`
-
-        """
-        f = feedparser.parse(content)
-        return (Readable(
-            author=e.author, title=e.title, content=e.content, url=e.link,
-            summary=e.summary, image=f.image) for e in f.entries)
+    parser = staticmethod(parse_feed)
 
     def make_news(self, readable):
         """Instantiate a news out of the readable parsed from :meth:`parse`.
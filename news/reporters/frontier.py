@@ -0,0 +1,282 @@
+""":mod:`news.reporters.frontier` --- Crawl frontier
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides a priority ordered crawl frontier of traversing reporters, so that
+covers with limited visit budgets fetch the most promising urls first.
+
+"""
+import re
+import math
+import heapq
+import asyncio
+import itertools
+import collections
+from urllib.parse import urlparse
+from ..utils.python import importattr
+
+
+def url_pattern(url):
+    """Returns a pattern of the url that is shared by similar urls.
+
+    Digits of the url's path are masked and the last segment of the path is
+    replaced with a wildcard, along with the query values. For example,
+    `http://a.com/2017/03/some-article?page=2` and
+    `http://a.com/2016/12/another-article?page=3` share the same pattern.
+
+    :param url: Url to make pattern of.
+    :type url: :class:`str`
+    :returns: Pattern of the url.
+    :rtype: :class:`str`
+
+    """
+    parsed = urlparse(url)
+    segments = re.sub(r'\d+', '#', parsed.path).split('/')
+    if segments[-1]:
+        segments[-1] = '*'
+    query = '&'.join(sorted(
+        q.split('=')[0] for q in parsed.query.split('&') if q))
+    return '{}{}{}'.format(parsed.hostname or '', '/'.join(segments),
+                           '?' + query if query else '')
+
+
+def score(reporter, frontier):
+    """Default score of a reporter in the crawl frontier.
+
+    Reporters closer to the root, of urls weighted by `url_weights` option,
+    of urls whose similar urls have yielded more new or changed news and of
+    urls linked from more pages score higher.
+
+    :param reporter: Reporter to score.
+    :type reporter: :class:`~news.reporters.generics.TraversingReporter`
+    :param frontier: Crawl frontier of the reporter.
+    :type frontier: :class:`~news.reporters.frontier.Frontier`
+    :returns: Score of the reporter.
+    :rtype: :class:`float`
+
+    """
+    url = reporter.url
+    return frontier.weight(url) * frontier.yield_rate(url) * \
+        (1 + math.log(max(frontier.inlinks[url], 1))) / \
+        (1 + reporter.distance)
+
+
+class Frontier(object):
+    """Priority ordered crawl frontier of a root reporter.
+
+    Reporters are popped out of the frontier in descending order of their
+    scores. Reporters of urls that are found again while queued are rescored
+    with their increased in-link counts. The frontier keeps no more reporters
+    than it's capacity, evicting the lowest scoring ones for better ones.
+
+    Yield rates of url patterns are seeded from the crawl state of the
+    schedule if it's kept, and updated with visits of the cover.
+
+    :param root: Root reporter of the frontier.
+    :type root: :class:`~news.reporters.generics.TraversingReporter`
+    :param scorer: Scorer of the reporters or it's dotted path. Defaults to
+        :func:`score`.
+    :type scorer: A function that takes a reporter and the frontier and
+        returns a score, or :class:`str`
+    :param capacity: Maximum number of queued reporters. Unbounded if not
+        given.
+    :type capacity: :class:`int`
+
+    """
+    def __init__(self, root, scorer=None, capacity=None):
+        if isinstance(scorer, str):
+            scorer = importattr(scorer)
+        self.root = root
+        self.scorer = scorer or score
+        self.capacity = capacity
+        self.inlinks = collections.Counter()
+
+        # queued reporters along with their scores, ordered by the best and
+        # the worst of them. entries of rescored or evicted reporters are
+        # skipped lazily.
+        self._queued = {}
+        self._best = []
+        self._worst = []
+        self._counter = itertools.count()
+        self._popped = 0
+        self._closed = False
+        self._pushed = asyncio.Event()
+        self._done = asyncio.Event()
+
+        self._stats = collections.defaultdict(lambda: [0, 0])
+        self._weights = [(re.compile(p), w) for p, w in
+                         root.options.get('url_weights', {}).items()]
+
+        # pages that have been found changed or found for the first time
+        # count as yields of their patterns.
+        crawl_state = root.crawl_state
+        if crawl_state is not None:
+            for url, page in crawl_state.pages.items():
+                stats = self._stats[url_pattern(url)]
+                stats[0] += (page.visits or 0) + 1
+                stats[1] += (page.changes or 0) + 1
+
+    def __len__(self):
+        return len(self._queued)
+
+    def __contains__(self, url):
+        return url in self._queued
+
+    def push(self, reporter):
+        """Push a reporter into the frontier. A reporter of the url that is
+        already queued will be rescored instead. The reporter will be dropped
+        if the frontier is full of better scoring reporters or closed.
+
+        :param reporter: Reporter to push.
+        :type reporter: :class:`~news.reporters.generics.TraversingReporter`
+        :returns: `True` if the reporter has been queued or rescored.
+        :rtype: :class:`bool`
+
+        """
+        if self._closed:
+            return False
+
+        url = reporter.url
+        queued = self._queued.get(url)
+        reporter = queued[0] if queued is not None else reporter
+        self.inlinks[url] += 1
+        entry_score = self.scorer(reporter, self)
+
+        if queued is None and self._is_full():
+            worst = self._peek_worst()
+            if entry_score <= worst[0]:
+                del self.inlinks[url]
+                return False
+            self._evict(worst[2])
+        if queued is not None and entry_score <= queued[1]:
+            return True
+
+        seq = next(self._counter)
+        self._queued[url] = (reporter, entry_score, seq)
+        heapq.heappush(self._best, (-entry_score, seq, url))
+        heapq.heappush(self._worst, (entry_score, seq, url))
+        self._compact()
+        self._pushed.set()
+        return True
+
+    async def pop(self):
+        """Pop the best scoring reporter out of the frontier. Should be
+        followed by :meth:`task_done` after the reporter's visit.
+
+        :returns: The best scoring reporter.
+        :rtype: :class:`~news.reporters.generics.TraversingReporter`
+
+        """
+        while True:
+            while self._best:
+                _, seq, url = heapq.heappop(self._best)
+                if self._is_live(seq, url):
+                    reporter = self._queued.pop(url)[0]
+                    self.inlinks.pop(url, None)
+                    self._popped += 1
+                    return reporter
+            self._pushed.clear()
+            await self._pushed.wait()
+
+    def task_done(self):
+        """Mark a popped reporter's visit as done."""
+        self._popped -= 1
+        self._check_done()
+
+    async def join(self):
+        """Wait until all reporters pushed into the frontier are visited."""
+        while self._queued or self._popped:
+            self._done.clear()
+            await self._done.wait()
+
+    def close(self):
+        """Drop all queued reporters and refuse further pushes, e.g. once the
+        visit budget of the cover has been exhausted."""
+        self._closed = True
+        self._queued.clear()
+        self._best = []
+        self._worst = []
+        self.inlinks.clear()
+        self._check_done()
+
+    def record(self, reporter, news):
+        """Record the yield of a reporter's visit to the yield rate of it's url
+        pattern.
+
+        :param reporter: Visited reporter.
+        :type reporter: :class:`~news.reporters.generics.TraversingReporter`
+        :param news: News fetched by the reporter or `None` if failed.
+        :type news: :class:`~news.models.abstract.AbstractNews`
+            implementation
+
+        """
+        url = reporter.url
+        stats = self._stats[url_pattern(url)]
+        stats[0] += 1
+        if news and self._is_yield(url, news):
+            stats[1] += 1
+
+    def yield_rate(self, url):
+        """Estimated rate of new or changed news from the urls similar to the
+        url.
+
+        :param url: Url to estimate yield rate of.
+        :type url: :class:`str`
+        :returns: Yield rate between 0 and 1.
+        :rtype: :class:`float`
+
+        """
+        fetched, yielded = self._stats.get(url_pattern(url), (0, 0))
+        return (yielded + 1) / (fetched + 2)
+
+    def weight(self, url):
+        """Weight of the url from the first matching pattern of `url_weights`
+        option. Defaults to 1.
+
+        :param url: Url to weight.
+        :type url: :class:`str`
+        :returns: Weight of the url.
+        :rtype: :class:`float`
+
+        """
+        for pattern, weight in self._weights:
+            if pattern.search(url):
+                return weight
+        return 1
+
+    def _is_full(self):
+        return bool(self.capacity) and len(self._queued) >= self.capacity
+
+    def _is_live(self, seq, url):
+        queued = self._queued.get(url)
+        return queued is not None and queued[2] == seq
+
+    def _peek_worst(self):
+        while not self._is_live(*self._worst[0][1:]):
+            heapq.heappop(self._worst)
+        return self._worst[0]
+
+    def _evict(self, url):
+        del self._queued[url]
+        self.inlinks.pop(url, None)
+
+    def _compact(self):
+        # rebuild the heaps when skipped entries outnumber the live ones.
+        if len(self._best) + len(self._worst) > 4 * len(self._queued) + 2:
+            entries = [(s, q, u) for u, (_, s, q) in self._queued.items()]
+            self._best = [(-s, q, u) for s, q, u in entries]
+            self._worst = entries
+            heapq.heapify(self._best)
+            heapq.heapify(self._worst)
+
+    def _check_done(self):
+        if not self._queued and not self._popped:
+            self._done.set()
+
+    def _is_yield(self, url, news):
+        stored_news = self.root.meta.stored_news
+        crawl_state = self.root.crawl_state
+        if crawl_state is not None and url in crawl_state.changed:
+            return True
+        if stored_news is not None:
+            return url not in stored_news
+        return getattr(news, 'id', None) is None
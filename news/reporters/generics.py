@@ -8,6 +8,10 @@ import copy
 import itertools
 import asyncio
 from .abstract import Reporter
+from .frontier import Frontier
+from .visited import VisitedSet
+from ..constants import DEFAULT_MAX_VISIT
+from ..utils.logging import logger
 
 
 class TraversingReporter(Reporter):
@@ -23,10 +27,17 @@ class TraversingReporter(Reporter):
     :type parent: :class:`TraversingReporter`
     :param bulk_report: Report news in bulk if given `True`.
     :type bulk_report: :class:`bool`
+    :param concurrency: Number of worker coroutines to crawl with. The root
+        reporter will be dispatched through a bounded crawl frontier
+        (:meth:`dispatch_frontier`) instead of recursive dispatches if given.
+    :type concurrency: :class:`int`
     :param dispatch_middlewares: Dispatch middlewares to apply.
     :type dispatch_middlewares: :class:`list`
     :param fetch_middlewares: Fetch middlewares to apply.
     :type fetch_middlewares: :class:`list`
+    :param session: A http client session to fetch urls with. The session
+        will be shared down to the reporter's descendents.
+    :type session: :class:`aiohttp.ClientSession`
 
     .. note::
 
@@ -36,16 +47,17 @@ class TraversingReporter(Reporter):
 
     """
     def __init__(self, meta, backend, url=None, parent=None, bulk_report=True,
-                 dispatch_middlewares=None, fetch_middlewares=None,
-                 *args, **kwargs):
+                 concurrency=None, dispatch_middlewares=None,
+                 fetch_middlewares=None, session=None, *args, **kwargs):
         super().__init__(meta=meta, backend=backend, url=url,
                          dispatch_middlewares=dispatch_middlewares,
-                         fetch_middlewares=fetch_middlewares, *args, **kwargs)
-        self._visited_urls_lock = asyncio.Lock()
-        self._visited_urls = set()
+                         fetch_middlewares=fetch_middlewares, session=session,
+                         *args, **kwargs)
+        self._visited_urls = None
         self._fetched_news = None
         self.parent = parent
         self.bulk_report = bulk_report
+        self.concurrency = concurrency
 
     @property
     def root(self):
@@ -63,6 +75,20 @@ class TraversingReporter(Reporter):
         """(:class:`int`) Returns the distance from the root reporter."""
         return 0 if not self.parent else self.parent.distance + 1
 
+    @property
+    def visited(self):
+        """(:class:`~news.reporters.visited.VisitedSet`) Urls visited by the
+        root reporter and it's descendents. The set is sized for `max_visit`
+        option, with a bloom filter in front of it if `visited_error_rate`
+        option is given."""
+        root = self.root
+        if root._visited_urls is None:
+            root._visited_urls = VisitedSet(
+                capacity=self.options.get('max_visit', DEFAULT_MAX_VISIT),
+                error_rate=self.options.get('visited_error_rate', None)
+            )
+        return root._visited_urls
+
     @property
     def fetched_news(self):
         """(:class:`~news.models.abstract.AbstractNews`) Fetched news.
@@ -80,29 +106,23 @@ class TraversingReporter(Reporter):
         :rtype: :class:`list`
 
         """
-        # fetch news from the url and determine whether it is worthy or not
-        news = await self.fetch()
+        # crawl through the bounded frontier if concurrency has been given.
+        if self.is_root and self.concurrency:
+            return await self.dispatch_frontier()
 
+        news, worthy_urls = await self.visit()
         if not news:
             return []
 
-        if not self.bulk_report:
-            self.report_news(news)
-
-        urls = await self.get_urls(news) if news else []
-        worthies = await asyncio.gather(*[
-            self.worth_to_visit(news, u) for u in urls])
-        worthy_urls = (u for u, w in zip(urls, worthies) if w)
-
         news_linked = await self.dispatch_reporters(worthy_urls)
-        news_total = news_linked + [news] if news else news_linked
+        news_total = news_linked + [news]
 
         # Bulk report news if the flag is set to `True`. We don't have to
         # take care of case of `False` since news should be reported on
         # `dispatch()` calls of each successor reporters already if
         # `bulk_report` flag was given `True`.
         if self.bulk_report and self.is_root:
-            self.report_news(*set(news_total))
+            self.report_news(*news_total)
 
         return news_total
 
@@ -122,7 +142,147 @@ class TraversingReporter(Reporter):
         news_sets_valid = (ns for ns in news_sets if
                            ns and not isinstance(ns, Exception))
 
-        return itertools.chain(*news_sets_valid)
+        return list(itertools.chain(*news_sets_valid))
+
+    async def dispatch_frontier(self):
+        """Dispatch the reporter and it's descendents through an explicit
+        crawl frontier.
+
+        Instead of dispatching every descendent at once, a fixed number of
+        worker coroutines(:attr:`concurrency`) pull the best scoring reporters
+        out of a single priority ordered frontier
+        (:class:`~news.reporters.frontier.Frontier`), so that `max_visit`
+        budget goes to the most promising urls first. Scorer of the frontier
+        can be given as a dotted path with `frontier_scorer` option.
+        Reporters are admitted synchronously as they are pulled out, so
+        `max_visit` and `max_dist` options are never exceeded and the number
+        of in-flight fetches never grows beyond the number of the workers.
+        The frontier keeps no more than `max_visit` of the best scoring
+        reporters, and is drained as soon as the budget has been exhausted.
+
+        :returns: A list of news fetched by the reporter and it's descendents.
+        :rtype: :class:`list`
+
+        """
+        max_visit = self.options.get('max_visit', DEFAULT_MAX_VISIT)
+        frontier = Frontier(self, self.options.get('frontier_scorer', None),
+                            capacity=max_visit)
+        news_total = []
+
+        async def work():
+            while True:
+                reporter = await frontier.pop()
+                try:
+                    if not self.admit(reporter):
+                        # drop the rest of the frontier if the visit budget
+                        # has been exhausted.
+                        if max_visit and len(self.visited) >= max_visit:
+                            frontier.close()
+                        continue
+                    news, worthy_urls = await reporter.visit()
+                    frontier.record(reporter, news)
+                    if not news:
+                        continue
+                    news_total.append(news)
+                    for child in reporter.recruit_reporters(worthy_urls):
+                        if child.url not in self.visited:
+                            frontier.push(child)
+                except asyncio.CancelledError:
+                    raise
+                # a failed visit shouldn't stop the worker from crawling the
+                # rest of the frontier.
+                except Exception:
+                    logger.exception('[TraversingReporter]: Failed to visit '
+                                     '{}'.format(reporter.url))
+                finally:
+                    frontier.task_done()
+
+        frontier.push(self)
+
+        workers = [asyncio.ensure_future(work()) for _ in
+                   range(max(self.concurrency or 1, 1))]
+        try:
+            await frontier.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if self.bulk_report:
+            self.report_news(*news_total)
+
+        return news_total
+
+    def admit(self, reporter):
+        """Admit a reporter pulled out of the root reporter's crawl frontier
+        to visit it's url.
+
+        The reporter's url will be marked as visited in advance on admission,
+        so that the admission is done without any suspension point and the
+        visit budget can not be raced over by concurrent workers.
+
+        :param reporter: A reporter to admit.
+        :type reporter: :class:`TraversingReporter`
+        :returns: `True` if the reporter has been admitted.
+        :rtype: :class:`bool`
+
+        """
+        visited = self.visited
+        max_visit = self.options.get('max_visit', DEFAULT_MAX_VISIT)
+        max_dist = self.options.get('max_dist', None)
+
+        if max_visit and len(visited) >= max_visit:
+            return False
+        if max_dist is not None and reporter.distance > max_dist:
+            return False
+        return visited.add(reporter.url)
+
+    async def visit(self):
+        """Fetch the reporter's url and find out worthy urls to visit next.
+
+        The fetched news will be reported immediately if :attr:`bulk_report`
+        is not set. Urls visited on the previous covers are visited again only
+        if they are likely to have changed, and the root reporter will
+        revisit such urls even if they are not linked from the fetched news,
+        the most likely changed ones first up to `revisit_budget` option.
+
+        :returns: A fetched news and a list of worthy urls found from it.
+        :rtype: :class:`tuple`
+
+        """
+        news = await self.fetch()
+        if not news:
+            return None, []
+
+        if not self.bulk_report:
+            self.report_news(news)
+
+        urls = await self.get_urls(news)
+        worthies = await asyncio.gather(*[
+            self.worth_to_visit(news, u) for u in urls])
+        worthy_urls = [u for u, w in zip(urls, worthies) if
+                       w and self.worth_to_revisit(u)]
+
+        if self.is_root and self.crawl_state is not None:
+            found = set(worthy_urls)
+            budget = self.options.get('revisit_budget', None)
+            due = [u for u in self.crawl_state.due() if
+                   u not in found and u != self.url]
+            worthy_urls += due if budget is None else due[:budget]
+        return news, worthy_urls
+
+    def worth_to_revisit(self, url):
+        """Decides whether the url should be visited again based on the crawl
+        state of the previous covers. New urls are always worthy to visit.
+
+        :param url: A URL to test it's worthiness.
+        :type url: :class:`str`
+        :returns: `True` if the url is new or likely to have changed.
+        :rtype: :class:`bool`
+
+        """
+        crawl_state = self.crawl_state
+        return crawl_state is None or crawl_state.likely_changed(url)
 
     async def fetch(self):
         """Fetch the given url and make an news from it.
@@ -169,13 +329,12 @@ class TraversingReporter(Reporter):
         :rtype: :class:`list`
 
         """
-        return [self._inherit_meta(t) for t in urls or []]
+        return [self._inherit_meta(t, parent=self) for t in urls or []]
 
     async def report_visit(self):
         """Report to the root reporter that the reporter visited assigned url.
         """
-        with (await self._visited_urls_lock):
-            self.root._visited_urls.add(self.url)
+        self.visited.add(self.url)
 
     async def already_visited(self, url):
         """Check if any descendent of the root reporter has already visited
@@ -187,18 +346,16 @@ class TraversingReporter(Reporter):
         :rtype: :class:`bool`
 
         """
-        with (await self._visited_urls_lock):
-            return url in self.root._visited_urls
+        return url in self.visited
 
     async def get_visited(self):
         """Get all visited urls from the root reporter.
 
         :returns: All visited urls by the time of calling the method.
-        :rtype: :class:`set`
+        :rtype: :class:`~news.reporters.visited.VisitedSet`
 
         """
-        with (await self._visited_urls_lock):
-            return self.root._visited_urls
+        return self.visited
 
     def _inherit_meta(self, url, parent=None):
         # we only inherit fetch middleware. dispatch middleware won't be
@@ -209,7 +366,8 @@ class TraversingReporter(Reporter):
         # useless bulk requests.
         child = self.create_instance(
             meta=self.meta, backend=self.backend, url=url,
-            fetch_middlewares=fetch_middlewares
+            fetch_middlewares=fetch_middlewares, session=self.session,
+            executor=self.executor
         ).enhance()
         if isinstance(child, TraversingReporter):
             child.parent = parent
@@ -229,6 +387,8 @@ class FeedReporter(Reporter):
     :type dispatch_middlewares: :class:`list`
     :param fetch_middlewares: Fetch middlewares to apply.
     :type fetch_middlewares: :class:`list`
+    :param session: A http client session to fetch urls with.
+    :type session: :class:`aiohttp.ClientSession`
 
     .. note::
 
@@ -238,8 +398,21 @@ class FeedReporter(Reporter):
     """
     async def dispatch(self):
         """Dispatch the reporter to the feed url."""
-        fetched = await self.fetch()
+        fetched = list(await self.fetch() or [])
         worthies = await asyncio.gather(*[
             self.worth_to_report(n) for n in fetched
         ])
         return (n for n, w in zip(fetched, worthies) if w)
+
+    def restore(self):
+        """Restore stored news of the feed from the backend.
+
+        :returns: A list of stored news of the feed or `None` if the feed
+            doesn't have any.
+        :rtype: :class:`list`
+
+        """
+        stored = list(self.backend.get_news_list(
+            owner=self.owner, root_url=self.schedule.url
+        ))
+        return stored or None
@@ -62,14 +62,17 @@ class DomainTraversingMixin(object):
         max_visit = self.options.get('max_visit', DEFAULT_MAX_VISIT)
 
         # conditions
-        already_visited = await self.already_visited(url)
+        visited = self.visited
+        already_visited = url in visited
         is_same_domain = issamedomain(root_url, url)
         is_url_white = any([issuburl(w, url) for w in url_whitelist])
         is_url_black = any([issuburl(b, url) for b in url_blacklist])
         ext_ok = ext(url) not in ext_blacklist
-        distance_ok = self.distance <= max_dist if max_dist else True
-        visit_count_ok = len(await self.get_visited()) <= max_visit if \
-            max_visit else True
+        # urls will be visited by our children, which are one step further
+        # from the root than us.
+        distance_ok = self.distance < max_dist if max_dist is not None \
+            else True
+        visit_count_ok = len(visited) <= max_visit if max_visit else True
 
         return not already_visited and \
             (is_same_domain or is_url_white) and \
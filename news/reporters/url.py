@@ -4,14 +4,17 @@
 Provide a concrete URL news reporter.
 
 """
-from bs4 import BeautifulSoup
-from extraction import Extractor
-from ..models.abstract import Readable
+import functools
 from .generics import TraversingReporter
 from .mixins import (
     BatchTraversingMixin,
     DomainTraversingMixin
 )
+from ..parsers import (
+    DEFAULT_HTML_PARSER,
+    parse_html,
+    extract_links,
+)
 from ..utils.url import fillurl
 
 
@@ -29,24 +32,18 @@ class URLReporter(
     :param intel: Intels to use for batch traversing.
     :type intel: :class:`list` of news
 
-    """
-    def parse(self, content):
-        """Parses html content of http response body into a single
-        :class:`~news.models.abstract.Readable`.
-
-        Internally uses :class:`~extraction.Extractor` extractor to extract
-        sementic tags from the plain html content.
+    Html parser backend can be selected with `html_parser` schedule option.
 
-        :param content: Http response body
-        :type content: :class:`str`
-        :returns: A parsed readable
-        :rtype: :class:`~news.models.abstract.Readable`
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._links = None
 
-        """
-        extractor = Extractor()
-        extracted = extractor.extract(content)
-        return Readable(url=self.url, title=extracted.title, content=content,
-                        summary=extracted.description, image=extracted.image)
+    @property
+    def parser(self):
+        """(function) Single pass html parser of the reporter."""
+        features = self.options.get('html_parser', DEFAULT_HTML_PARSER)
+        return functools.partial(parse_html, features=features)
 
     def make_news(self, readable):
         """Instantiate a news out of the readable parsed from :meth:`parse`.
@@ -57,8 +54,11 @@ class URLReporter(
         :rtype: :class:`~news.models.abstract.AbstractNews` implementation
 
         """
+        # keep links extracted by the parser for :meth:`get_urls`.
+        self._links = readable.links
+
         parent = self.parent.fetched_news if not self.is_root else None
-        stored = self.backend.get_news_by(owner=self.owner, url=self.url)
+        stored = self.get_stored_news()
         fetched = self.fetched_news
 
         if not fetched and not stored:
@@ -74,6 +74,19 @@ class URLReporter(
 
         return news
 
+    def restore(self):
+        """Restore the stored news of the url from the backend.
+
+        :returns: A stored news or `None` if we don't have any.
+        :rtype: :class:`~news.models.abstract.AbstractNews` implementation
+
+        """
+        stored = self.get_stored_news()
+        if stored is not None:
+            stored.parent = self.parent.fetched_news if not self.is_root \
+                else None
+        return stored
+
     async def get_urls(self, news):
         """Retrieve urls to visit from the instantiated news.
 
@@ -83,6 +96,11 @@ class URLReporter(
         :rtype: :set:
 
         """
-        atags = BeautifulSoup(news.content, 'html.parser')('a')
-        links = {a['href'] for a in atags if a.has_attr('href')}
-        return {fillurl(self.root.url, l) for l in links}
+        # links should have been extracted already if we parsed the content.
+        if self._links is not None:
+            return {fillurl(self.root.url, l) for l in self._links}
+
+        features = self.options.get('html_parser', DEFAULT_HTML_PARSER)
+        return await self.run_in_executor(
+            extract_links, self.root.url, news.content, features
+        )
@@ -0,0 +1,131 @@
+""":mod:`news.reporters.visited` --- Visited url set
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides a compact set of urls visited by a cover's reporters.
+
+"""
+import math
+import array
+import hashlib
+from ..constants import DEFAULT_VISITED_CAPACITY
+
+
+def url_fingerprint(url):
+    """Returns a 64-bit fingerprint of the url.
+
+    :param url: Url to make fingerprint of.
+    :type url: :class:`str`
+    :returns: A non-zero 64-bit fingerprint.
+    :rtype: :class:`int`
+
+    """
+    # truncated md5, as blake2 isn't available until python 3.6.
+    digest = hashlib.md5(url.encode('utf-8')).digest()[:8]
+    # zero marks empty slots of the table.
+    return int.from_bytes(digest, 'little') or 1
+
+
+class VisitedSet(object):
+    """Set of visited urls that keeps 64-bit fingerprints of the urls in an
+    open addressing hash table, instead of the urls themselves.
+
+    Each url takes 11 to 22 bytes of the table regardless of it's length, and
+    both membership tests and additions are done without any suspension
+    point, so the set can be shared by concurrent reporters of a cover
+    without locking. Urls are considered visited if their fingerprints
+    collide, which is negligible for 64-bit fingerprints.
+
+    An optional bloom filter can be put in front of the table to reject
+    most of the unvisited urls without probing the table.
+
+    :param capacity: Expected number of urls. The table grows beyond it if
+        needed.
+    :type capacity: :class:`int`
+    :param error_rate: False positive rate of the bloom filter at the
+        expected number of urls. No bloom filter will be used if not given.
+    :type error_rate: :class:`float`
+
+    """
+    def __init__(self, capacity=DEFAULT_VISITED_CAPACITY, error_rate=None):
+        capacity = max(capacity or DEFAULT_VISITED_CAPACITY, 1)
+        self._size = 0
+        self._table = self._make_table(
+            1 << (-(-capacity * 4 // 3) - 1).bit_length())
+
+        # size the bloom filter optimally for the expected number of urls.
+        if error_rate:
+            bits = max(int(-capacity * math.log(error_rate) /
+                           math.log(2) ** 2), 8)
+            self._bloom_bits = bits
+            self._bloom_hashes = max(int(round(
+                bits / capacity * math.log(2))), 1)
+            self._bloom = bytearray((bits + 7) // 8)
+        else:
+            self._bloom = None
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, url):
+        fingerprint = url_fingerprint(url)
+        if self._bloom is not None and not self._in_bloom(fingerprint):
+            return False
+        return self._table[self._probe(self._table, fingerprint)] != 0
+
+    def add(self, url):
+        """Add the url to the set.
+
+        :param url: Url to add.
+        :type url: :class:`str`
+        :returns: `False` if the url is already in the set.
+        :rtype: :class:`bool`
+
+        """
+        fingerprint = url_fingerprint(url)
+        index = self._probe(self._table, fingerprint)
+        if self._table[index]:
+            return False
+
+        self._table[index] = fingerprint
+        self._size += 1
+        if self._bloom is not None:
+            self._add_to_bloom(fingerprint)
+
+        # keep the load factor under three quarters.
+        if self._size * 4 > len(self._table) * 3:
+            self._grow()
+        return True
+
+    @staticmethod
+    def _make_table(size):
+        return array.array('Q', bytes(8 * size))
+
+    @staticmethod
+    def _probe(table, fingerprint):
+        # linear probing until either the fingerprint or an empty slot.
+        mask = len(table) - 1
+        index = fingerprint & mask
+        while table[index] and table[index] != fingerprint:
+            index = (index + 1) & mask
+        return index
+
+    def _grow(self):
+        table = self._make_table(len(self._table) * 2)
+        for fingerprint in self._table:
+            if fingerprint:
+                table[self._probe(table, fingerprint)] = fingerprint
+        self._table = table
+
+    def _bloom_indexes(self, fingerprint):
+        # double hashing with the halves of the fingerprint.
+        h1, h2 = fingerprint & 0xffffffff, fingerprint >> 32 | 1
+        return ((h1 + i * h2) % self._bloom_bits for i in
+                range(self._bloom_hashes))
+
+    def _in_bloom(self, fingerprint):
+        return all(self._bloom[i >> 3] & (1 << (i & 7)) for i in
+                   self._bloom_indexes(fingerprint))
+
+    def _add_to_bloom(self, fingerprint):
+        for i in self._bloom_indexes(fingerprint):
+            self._bloom[i >> 3] |= 1 << (i & 7)
@@ -0,0 +1,169 @@
+""":mod:`news.runtime` --- Cover runtime
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Provides a long-lived runtime that holds an event loop, a pooled http client
+session and a parser executor to be shared by all covers run on a worker.
+
+"""
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import aiohttp
+from .constants import (
+    DEFAULT_CONNECTION_LIMIT,
+    DEFAULT_CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_DNS_CACHE_TTL,
+)
+
+# use uvloop as event loop implementation if available.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+class Runtime(object):
+    """Event loop, pooled http client session and parser executor shared by
+    covers.
+
+    Covers run on a runtime don't have to set up their own loop, connection
+    pool and dns cache, and keep connections to the same hosts alive between
+    covers.
+
+    :param use_uvloop: Whether to use uvloop's event loop if it's available.
+    :type use_uvloop: :class:`bool`
+    :param executor: Executor to which reporters dispatch their parsers. A
+        process pool executor will be created lazily if not given.
+    :type executor: :class:`concurrent.futures.Executor`
+    :param connection_limit: Maximum number of simultaneous connections of
+        the runtime's session.
+    :type connection_limit: :class:`int`
+    :param connection_limit_per_host: Maximum number of simultaneous
+        connections to a single host of the runtime's session.
+    :type connection_limit_per_host: :class:`int`
+    :param dns_cache_ttl: Seconds to cache resolved host names for.
+    :type dns_cache_ttl: :class:`int`
+
+    *Example*::
+
+        from news.runtime import Runtime
+
+        runtime = Runtime().start()
+        cover.prepare(reporter_class=URLReporter, runtime=runtime)
+        cover.run()
+
+    """
+    def __init__(self, use_uvloop=True, executor=None,
+                 connection_limit=DEFAULT_CONNECTION_LIMIT,
+                 connection_limit_per_host=DEFAULT_CONNECTION_LIMIT_PER_HOST,
+                 dns_cache_ttl=DEFAULT_DNS_CACHE_TTL):
+        self.use_uvloop = use_uvloop
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.loop = None
+        self.session = None
+
+        self._executor = executor
+
+    @property
+    def started(self):
+        """(:class:`bool`) Whether the runtime has been started or not."""
+        return self.loop is not None and not self.loop.is_closed()
+
+    @property
+    def executor(self):
+        """(:class:`concurrent.futures.Executor`) Executor to which reporters
+        dispatch their parsers."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor()
+        return self._executor
+
+    def start(self):
+        """Start the runtime by creating it's event loop and session.
+
+        :returns: Started runtime itself.
+        :rtype: :class:`~news.runtime.Runtime`
+
+        """
+        if self.started:
+            return self
+
+        self.loop = uvloop.new_event_loop() if uvloop and self.use_uvloop \
+            else asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.session = self.loop.run_until_complete(self._make_session())
+        return self
+
+    def run(self, coroutine):
+        """Run the coroutine on the runtime's event loop.
+
+        :param coroutine: Coroutine to run.
+        :type coroutine: :class:`coroutine`
+        :returns: Result of the coroutine.
+
+        """
+        assert(self.started), 'Runtime is not started yet'
+        return self.loop.run_until_complete(coroutine)
+
+    def close(self):
+        """Close the runtime's session, executor and event loop."""
+        if not self.started:
+            return
+
+        self.loop.run_until_complete(self.session.close())
+        self.loop.close()
+        self.session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _make_session(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+
+# Runtimes of the threads. an event loop can only be run by one thread at a
+# time, so each thread running covers gets it's own runtime.
+__NEWS_RUNTIMES__ = threading.local()
+
+
+def get_runtime():
+    """Returns the current thread's runtime. Starts a default runtime if the
+    thread doesn't have any.
+
+    :returns: Runtime of the thread.
+    :rtype: :class:`~news.runtime.Runtime`
+
+    """
+    runtime = getattr(__NEWS_RUNTIMES__, 'runtime', None)
+    if runtime is None or not runtime.started:
+        runtime = __NEWS_RUNTIMES__.runtime = Runtime().start()
+    return runtime
+
+
+def init_runtime(**kwargs):
+    """Start a new runtime for the current thread. Runtime inherited from the
+    parent process is discarded without being closed, since it's resources
+    are still owned by the parent.
+
+    :param **kwargs: Runtime constructor arguments.
+    :type **kwargs: :class:`dict`
+    :returns: Runtime of the thread.
+    :rtype: :class:`~news.runtime.Runtime`
+
+    """
+    runtime = __NEWS_RUNTIMES__.runtime = Runtime(**kwargs).start()
+    return runtime
+
+
+def close_runtime():
+    """Close the current thread's runtime if exists."""
+    runtime = getattr(__NEWS_RUNTIMES__, 'runtime', None)
+    if runtime is not None:
+        runtime.close()
+        __NEWS_RUNTIMES__.runtime = None
@@ -1,18 +1,187 @@
 """:mod:`news.scheduler` --- Scheduler
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-Provides a scheduler class that will run news cover celery tasks.
+Provides a scheduler class that will run news cover celery tasks, or run the
+covers within it's own process on a local executor.
 
 """
 import time
+import heapq
+import asyncio
+import random
+import socket
+import itertools
 import threading
-import schedule as pusher
 from contextlib import contextmanager
 from celery import Task, states
+from celery.signals import (
+    worker_process_init,
+    worker_process_shutdown,
+)
 from .cover import Cover
+from .runtime import (
+    get_runtime,
+    init_runtime,
+    close_runtime,
+)
+from .inflight import (
+    InflightRegistry,
+    LocalInflightRegistry,
+)
+from .cycle import (
+    CycleRegistry,
+    LocalCycleRegistry,
+    adapt_interval,
+)
 from .mapping import DefaultMapping
-from .utils.logging import logger
-from .constants import COVER_PUSHER_CYCLE
+from .exceptions import SchedulerConfigurationError
+from .utils.python import chunks
+from .utils.logging import logger, elapsed_timer
+from .constants import (
+    SCHEDULE_PHASE_RATIO,
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_SCHEDULER_ID,
+    DEFAULT_MIN_CYCLE,
+    DEFAULT_MAX_CYCLE,
+    DEFAULT_TARGET_YIELD,
+)
+
+
+class JobQueue(object):
+    """Min-heap of periodic jobs keyed by their next run time.
+
+    Adding, removing and updating a job costs O(log n) and the scheduler
+    thread sleeps exactly until the next job is due instead of polling all
+    of them. Removed jobs are deleted lazily from the heap.
+
+    :param clock: Monotonic clock function to use.
+    :type clock: A function that returns seconds as :class:`float`
+
+    """
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    def push(self, key, interval, delay=None, jitter=0):
+        """Push a job or reschedule it if it's already in the queue.
+
+        :param key: Key of the job.
+        :type key: Any hashable
+        :param interval: Seconds between runs of the job. Should be
+            positive.
+        :type interval: :class:`float`
+        :param delay: Seconds until the first run of the job. Defaults to the
+            job's interval.
+        :type delay: :class:`float`
+        :param jitter: Maximum random seconds to delay each run of the job
+            by. Jitter doesn't accumulate over runs.
+        :type jitter: :class:`float`
+
+        """
+        if interval <= 0:
+            raise ValueError('Interval of a job should be positive')
+
+        delay = interval if delay is None else delay
+        with self._condition:
+            self._discard(key)
+            entry = self._make_entry(key, interval, self.clock() + delay,
+                                     jitter)
+            self._entries[key] = entry
+            heapq.heappush(self._heap, entry)
+
+            # wake up the waiting thread if the job became the next one.
+            if self._heap[0] is entry:
+                self._condition.notify_all()
+
+    def remove(self, key):
+        """Remove a job from the queue. Removal fails silently if the job
+        doesn't exist in the queue.
+
+        :param key: Key of the job.
+        :type key: Any hashable
+
+        """
+        with self._condition:
+            self._discard(key)
+
+    def clear(self):
+        """Remove all jobs from the queue."""
+        with self._condition:
+            self._heap = []
+            self._entries.clear()
+            self._condition.notify_all()
+
+    def pop_due(self, timeout=None):
+        """Wait until any jobs are due and return their keys, rescheduling
+        them for their next runs.
+
+        :param timeout: Maximum seconds to wait. Waits until any jobs are due
+            or :meth:`wake` is called if not given.
+        :type timeout: :class:`float`
+        :returns: Keys of the due jobs. May be empty when woken up or timed
+            out.
+        :rtype: :class:`list`
+
+        """
+        with self._condition:
+            now = self.clock()
+            if not self._heap or self._heap[0][0] > now:
+                wait = self._heap[0][0] - now if self._heap else None
+                if timeout is not None:
+                    wait = timeout if wait is None else min(wait, timeout)
+                self._condition.wait(wait)
+                now = self.clock()
+
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                _, _, key, interval, scheduled_at, jitter = entry
+                if self._entries.get(key) is not entry:
+                    continue
+                due.append(key)
+
+                # skip the missed runs, so that a late job runs once.
+                missed = (now - scheduled_at) // interval
+                entry = self._make_entry(
+                    key, interval, scheduled_at + interval * (missed + 1),
+                    jitter
+                )
+                self._entries[key] = entry
+                heapq.heappush(self._heap, entry)
+            return due
+
+    def wake(self):
+        """Wake up the threads waiting for due jobs."""
+        with self._condition:
+            self._condition.notify_all()
+
+    def _make_entry(self, key, interval, scheduled_at, jitter):
+        run_at = scheduled_at + random.uniform(0, jitter) if jitter else \
+            scheduled_at
+        return [run_at, next(self._counter), key, interval, scheduled_at,
+                jitter]
+
+    def _discard(self, key):
+        if self._entries.pop(key, None) is None:
+            return
+
+        # compact the heap when removed entries outnumber the live ones.
+        if len(self._heap) > 2 * len(self._entries) + 1:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
 
 
 class Scheduler(object):
@@ -24,7 +193,7 @@ class Scheduler(object):
         implementation.
     :param celery: Celery app instance to use as asynchronous job queue.
     :type celery: :class:`~celery.Celery`
-    :param persister: Persister that persists schedules via redis channel from
+    :param persister: Persister that persists schedules via a redis stream from
         backend. The persister that has been used when creating Schedule model
         with `create_schedule` factory method should be given. Note that the
         scheduler will not persist schedule changes if not given.
@@ -56,6 +225,66 @@ class Scheduler(object):
         enhanced fetch method. Note that the middlewares will be applied down
         to the descendent reporters of the root reporter.
     :type  fetch_middlewares: :class:`list`
+    :param parse_executor: Executor to which reporters dispatch their parsers.
+        The executor of the worker's runtime(:class:`~news.runtime.Runtime`)
+        will be used if not given.
+    :type parse_executor: :class:`concurrent.futures.Executor`
+    :param stagger: Whether to spread schedules of the same cycle over the
+        cycle with deterministic per-schedule phases. All schedules will be
+        run at the same time if disabled.
+    :type stagger: :class:`bool`
+    :param jitter: Maximum random seconds to delay each cover push by.
+    :type jitter: :class:`float`
+    :param cluster: Cluster to join. Schedules will be partitioned between
+        the schedulers of the cluster so that each schedule is run by only one
+        of them. The scheduler will run all schedules if not given.
+    :type cluster: :class:`~news.cluster.Cluster`
+    :param inflight: Registry of in-flight covers that keeps the scheduler
+        from pushing covers of a schedule while it's previous cover is still
+        queued or running. A process local registry will be used if covers
+        are run by a local executor. Otherwise a redis backed registry on the
+        redis of the cluster or the persister will be used, since covers are
+        released by the celery workers that run them.
+        :exc:`~news.exceptions.SchedulerConfigurationError` will be raised on
+        start if there's neither of them.
+    :type inflight: :class:`~news.inflight.InflightRegistry`
+    :param snapshot_max_age: Seconds for which schedule snapshots shipped
+        along with pushed covers are trusted. Workers will reload schedules
+        from the backend for covers that waited longer in the queue, or whose
+        schedules have been changed since their snapshots according to the
+        persister. Note that changes are not noticed within this window
+        without a persister.
+    :type snapshot_max_age: :class:`float`
+    :param batch_size: Maximum number of covers to push within a single
+        batch task. Covers due at the same time will be batched and run
+        concurrently on a worker's event loop. Each cover will be pushed as
+        it's own task if not given.
+    :type batch_size: :class:`int`
+    :param batch_concurrency: Maximum number of covers of a batch task to run
+        at the same time.
+    :type batch_concurrency: :class:`int`
+    :param executor: Local executor to run covers within the scheduler's
+        process. Covers will be run by the executor instead of being pushed
+        to celery if given.
+    :type executor: :class:`~news.executor.LocalExecutor`
+    :param cycles: Registry of adapted cover intervals of the schedules in
+        adaptive cycle mode. Schedules with `adaptive_cycle` option will have
+        their intervals adapted to the number of new or changed news found by
+        their covers, within their `min_cycle` and `max_cycle` options. A
+        process local registry will be used if covers are run by a local
+        executor. Otherwise a redis backed registry on the redis of the
+        cluster or the persister will be used, since intervals are adapted by
+        the celery workers that run the covers.
+        :exc:`~news.exceptions.SchedulerConfigurationError` will be raised on
+        adding schedules in adaptive cycle mode if there's neither of them.
+    :type cycles: :class:`~news.cycle.CycleRegistry`
+    :param id: Id of the scheduler, under which it's state on redis (e.g. the
+        persister's offset of the change log) is kept over restarts. Should
+        be unique among the schedulers sharing a redis and stable over their
+        restarts. Defaults to the host name if clustered, otherwise
+        `default`. Schedulers of a cluster running on the same host should be
+        given their own ids.
+    :type id: :class:`str`
 
     **Example**::
 
@@ -95,21 +324,50 @@ class Scheduler(object):
     def __init__(self, backend=None, celery=None, mapping=None, persister=None,
                  on_cover_start=None, on_cover_success=None,
                  on_cover_failure=None, dispatch_middlewares=None,
-                 fetch_middlewares=None):
-        # backend & celery
+                 fetch_middlewares=None,
+                 parse_executor=None, stagger=True, jitter=0, cluster=None,
+                 inflight=None, snapshot_max_age=DEFAULT_SNAPSHOT_MAX_AGE,
+                 batch_size=None,
+                 batch_concurrency=DEFAULT_BATCH_CONCURRENCY,
+                 executor=None, cycles=None, id=None):
+        # backend & celery or local executor
         self.backend = backend
         self.celery = celery
         self.celery_task = None
+        self.celery_batch_task = None
+        self.executor = executor
         self.mapping = DefaultMapping(mapping)
 
-        # schedule persister and pusher
+        # schedule persister and cluster
+        self.id = id
         self.persister = persister
-        self.pusher = pusher
+        self.cluster = cluster
 
         # scheduler state
-        self.jobs = dict()
-        self.queued = set()
+        self.jobs = JobQueue()
         self.running = False
+        self.thread = None
+        self.stagger = stagger
+        self.jitter = jitter
+
+        # schedule snapshots to ship along with covers and schedules of the
+        # covers running on this process.
+        self.snapshot_max_age = snapshot_max_age
+        self._snapshots = {}
+        self._covered_schedules = {}
+
+        # cover batching
+        self.batch_size = batch_size
+        self.batch_concurrency = batch_concurrency
+
+        # in-flight covers. defaults to a registry that fits where the covers
+        # are run, which is resolved on it's first use.
+        self.inflight = inflight
+
+        # adapted intervals of the schedules and the intervals of their jobs.
+        # the registry is resolved on it's first use as in-flight covers.
+        self.cycles = cycles
+        self._intervals = {}
 
         # scheduler cover callbacks
         self.on_cover_start = on_cover_start
@@ -120,6 +378,9 @@ class Scheduler(object):
         self.dispatch_middlewares = dispatch_middlewares or []
         self.fetch_middlewares = fetch_middlewares or []
 
+        # executor to dispatch parsers to
+        self._parse_executor = parse_executor
+
     # =================
     # Scheduler actions
     # =================
@@ -145,12 +406,14 @@ class Scheduler(object):
 
         """
         # set celery task if not set yet.
-        if not self.celery_task:
+        if not self.celery_task and self.executor is None:
             self.set_task()
 
         # stop and clear all schedule if the scheduler was already running.
         if self.running:
             self.running = False
+            self.jobs.wake()
+            self.thread.join()
             self.clear()
 
         # start schedule persistence if there's any persister available
@@ -158,28 +421,44 @@ class Scheduler(object):
             self.persister and self.persister.stop()
             self.persister = persister
 
-        # start persistence if persister exists.
+        # make sure that in-flight covers can be released where they run.
+        self.inflight
+
+        # start persistence if persister exists. persistence starts before
+        # loading schedules so that changes made during the load are kept.
         if self.persister:
             self.persister.start(self)
 
+        # join the cluster if exists.
+        if self.cluster:
+            self.cluster.start(self)
+
+        # start the local executor's workers if exists.
+        if self.executor is not None:
+            self.executor.start(self)
+
         # add schedules
-        schedules = self.backend.get_schedules()
-        (self.add_schedule(s) for s in schedules)
-        self._log('Starting with {} schedule(s)'.format(len(schedules)))
+        schedules = [s for s in self.backend.get_schedules() if s.enabled]
+        for s in schedules:
+            self.add(s)
+        self._log('Starting with {} schedule(s)'.format(len(self.jobs)))
 
         # start scheduler within a tiny thread.
         def schedule_forever():
-            self.running = True
             while self.running:
-                self._log('Flush pending covers', tag='debug')
-                self.pusher.run_pending()
-                time.sleep(COVER_PUSHER_CYCLE)
-        threading.Thread(target=schedule_forever).start()
+                self._push_covers(self.jobs.pop_due())
+        self.running = True
+        self.thread = threading.Thread(target=schedule_forever)
+        self.thread.start()
 
     def stop(self):
-        """Stop both the scheduler thread and the persister thread."""
+        """Stop the scheduler thread along with the persister thread, the
+        cluster thread and the local executor's workers."""
         self.persister and self.persister.stop()
+        self.cluster and self.cluster.stop()
+        self.executor is not None and self.executor.stop()
         self.running = False
+        self.jobs.wake()
 
     # ======================
     # Schedule manipulations
@@ -193,19 +472,34 @@ class Scheduler(object):
             :int:
 
         """
-        if not self.celery_task:
+        if not self.celery_task and self.executor is None:
             self.set_task()
 
+        # leave the schedule to the other scheduler in the cluster.
+        if not self.owns(getattr(schedule, 'id', schedule)):
+            self.remove(schedule)
+            return
+
         if isinstance(schedule, int):
-            schedule = self.backend.get_schedule_by_id(schedule)
+            schedule = self.backend.get_schedule(schedule)
 
         if not silent:
             self._log('Adding schedule {}'.format(schedule.id))
 
-        self.jobs[schedule.id] = self.pusher\
-            .every(schedule.cycle)\
-            .minutes\
-            .do(self._push_cover, schedule.id)
+        # schedules without a positive cycle would be due forever.
+        interval = self._get_interval(schedule)
+        if interval <= 0:
+            self._log('Skipping schedule {} of non-positive cycle {}'.format(
+                schedule.id, schedule.cycle), tag='error')
+            self.remove(schedule)
+            return
+
+        self._snapshots[schedule.id] = self.backend.dump_schedule(schedule)
+        self.jobs.push(
+            schedule.id, interval,
+            delay=self._get_delay(schedule, interval),
+            jitter=self.jitter,
+        )
 
     def remove(self, schedule, silent=True):
         """Remove an schedule from the scheduler.
@@ -226,15 +520,54 @@ class Scheduler(object):
         if not silent:
             self._log('Removing schedule {}'.format(id))
 
-        try:
-            self.pusher.cancel_job(self.jobs.pop(id))
-        except KeyError:
-            pass
+        self.jobs.remove(id)
+        self._snapshots.pop(id, None)
+        self._intervals.pop(id, None)
+
+    def rebalance(self):
+        """Reload schedules owned by the scheduler, after the cluster's
+        membership has been changed."""
+        schedules = [s for s in self.backend.get_schedules() if s.enabled]
+        owned = {s.id for s in schedules if self.owns(s.id)}
+
+        for id in self.jobs:
+            if id not in owned:
+                self.remove(id)
+        for s in schedules:
+            if s.id in owned and s.id not in self.jobs:
+                self.add(s)
+        self._log('Rebalanced to {} schedule(s)'.format(len(self.jobs)))
+
+    def reload(self):
+        """Reload all schedules from the backend, e.g. after the scheduler
+        has missed changes of them."""
+        schedules = [s for s in self.backend.get_schedules() if s.enabled]
+        enabled = {s.id for s in schedules}
+
+        for id in self.jobs:
+            if id not in enabled:
+                self.remove(id)
+        for s in schedules:
+            self.add(s)
+        self._log('Reloaded {} schedule(s)'.format(len(self.jobs)))
+
+    def owns(self, id):
+        """Check if the schedule should be run by the scheduler.
+
+        :param id: Id of the schedule.
+        :type id: :class:`int`
+        :returns: Whether the schedule belongs to the scheduler or not.
+        :rtype: :class:`bool`
+
+        """
+        return self.cluster is None or self.cluster.owns(id)
 
     def clear(self):
         """Clear all registered schedules from the scheduler."""
-        self._log('Clearing {} schedules'.format(len(self.jobs.keys())))
-        [self.remove(id) for id in self.jobs.keys()]
+        self._log('Clearing {} schedules'.format(len(self.jobs)))
+        self.jobs.clear()
+        self._snapshots.clear()
+        self._intervals.clear()
 
     def update(self, schedule):
         """Update the registered schedule by reconciliating with database
@@ -245,16 +578,52 @@ class Scheduler(object):
 
         """
         if isinstance(schedule, int):
-            schedule = self.backend.get_schedule_by_id(schedule)
+            schedule = self.backend.get_schedule(schedule)
 
         # log
-        self._log('Updating schedule {}'.format(
-            schedule if isinstance(schedule, int) else schedule.id))
+        self._log('Updating schedule {}'.format(schedule.id))
+
+        # adaptive cycle of the schedule starts over from it's new cycle.
+        if self._is_adaptive(schedule) or schedule.id in self._intervals:
+            self.cycles.discard(schedule.id)
 
         # remove schedule from job queue and add it if it's now enabled
-        self.remove_schedule(schedule)
+        self.remove(schedule)
         if schedule.enabled:
-            self.add_schedule(schedule)
+            self.add(schedule)
+
+    def adapt(self, schedule, yielded):
+        """Adapt the cover interval of the schedule in adaptive cycle mode to
+        the yield of it's latest cover. The schedule will be rescheduled
+        right away if it's run by the scheduler. Otherwise the adapted
+        interval will be picked up by the scheduler that runs it on the
+        schedule's next cover push.
+
+        :param schedule: Schedule whose cover has been finished.
+        :type schedule: :class:`~news.models.AbstractSchedule` implementation
+        :param yielded: Number of new or changed news found by the cover.
+        :type yielded: :class:`int`
+        :returns: Adapted interval in seconds or `None` if the schedule is not
+            in adaptive cycle mode.
+        :rtype: :class:`float`
+
+        """
+        if not self._is_adaptive(schedule):
+            return None
+
+        minimum, maximum = self._get_cycle_bounds(schedule)
+        interval = adapt_interval(
+            self.cycles.get(schedule.id) or schedule.cycle * 60,
+            yielded, minimum, maximum,
+            target=schedule.options.get('target_yield', DEFAULT_TARGET_YIELD)
+        )
+        self.cycles.set(schedule.id, interval)
+        self._log('Adapted cycle of schedule {} to {:.0f} second(s)'.format(
+            schedule.id, interval), tag='debug')
+
+        if schedule.id in self._intervals:
+            self._reschedule(schedule.id, interval)
+        return interval
 
     # ==================
     # Celery integration
@@ -270,21 +639,151 @@ class Scheduler(object):
         """
         class CallbackTask(Task):
             def on_success(task, retval, task_id, args, kwargs):
-                schedule = self.backend.get_schedule(args[0])
-                self.on_cover_success(schedule, retval)
+                self.inflight.release(args[0])
+                schedule = self._covered_schedules.pop(task_id, None)
+                if self.on_cover_success:
+                    schedule = schedule or self.backend.get_schedule(args[0])
+                    self.on_cover_success(schedule, retval)
 
             def on_failure(task, exc, task_id, args, kwargs, einfo):
-                schedule = self.backend.get_schedule(args[0])
-                self.on_cover_failure(schedule, exc)
+                self.inflight.release(args[0])
+                schedule = self._covered_schedules.pop(task_id, None)
+                if self.on_cover_failure:
+                    schedule = schedule or self.backend.get_schedule(args[0])
+                    self.on_cover_failure(schedule, exc)
 
         # make `run_cover` method into a celery task
         run_cover = self._make_run_cover()
         return self.celery.task(bind=True, base=CallbackTask)(run_cover)
 
+    def make_batch_task(self):
+        """Create an celery task responsible of running batches of reporter
+        covers concurrently.
+
+        Cover callbacks are called for each cover of the batch.
+
+        :returns: An celery task.
+        :rtype: :class:`~celery.Task`
+
+        """
+        run_covers = self._make_run_covers()
+        return self.celery.task(bind=True)(run_covers)
+
     def set_task(self):
         """Set an celery task responsible of running reporter covers on the
-        scheduler."""
+        scheduler, along with the worker runtime initialization."""
         self.celery_task = self.make_task()
+        self.celery_batch_task = self.make_batch_task()
+
+        # each worker process runs it's covers on a long-lived runtime.
+        worker_process_init.connect(
+            self._init_runtime, weak=False, dispatch_uid=id(self))
+        worker_process_shutdown.connect(
+            self._close_runtime, weak=False, dispatch_uid=id(self))
+
+    @property
+    def id(self):
+        """(:class:`str`) Id of the scheduler."""
+        if self._id is not None:
+            return self._id
+        # node ids of the cluster change on every start of the process.
+        return socket.gethostname() if self.cluster else DEFAULT_SCHEDULER_ID
+
+    @id.setter
+    def id(self, id):
+        self._id = id
+
+    @property
+    def inflight(self):
+        """(:class:`~news.inflight.InflightRegistry`) Registry of in-flight
+        covers of the scheduler."""
+        if self._inflight is None:
+            self._inflight = LocalInflightRegistry() if \
+                self.executor is not None else \
+                InflightRegistry(self._get_shared_redis('In-flight covers'))
+        return self._inflight
+
+    @inflight.setter
+    def inflight(self, inflight):
+        self._inflight = inflight
+
+    @property
+    def cycles(self):
+        """(:class:`~news.cycle.CycleRegistry`) Registry of adapted cover
+        intervals of the scheduler's schedules."""
+        if self._cycles is None:
+            self._cycles = LocalCycleRegistry() if \
+                self.executor is not None else \
+                CycleRegistry(self._get_shared_redis('Adaptive cycles'))
+        return self._cycles
+
+    @cycles.setter
+    def cycles(self, cycles):
+        self._cycles = cycles
+
+    @property
+    def parse_executor(self):
+        """(:class:`concurrent.futures.Executor`) Executor to which reporters
+        of the scheduler's covers dispatch their parsers."""
+        if self._parse_executor is None:
+            return get_runtime().executor
+        return self._parse_executor
+
+    def _get_shared_redis(self, state):
+        # state of the covers run by celery workers should be shared with the
+        # workers via redis.
+        redis = self.cluster.redis if self.cluster else \
+            getattr(self.persister, 'redis', None)
+        if redis is None:
+            raise SchedulerConfigurationError(
+                '{} should be shared with the celery workers via redis. '
+                'Give the scheduler a cluster, a persister or a local '
+                'executor, or a redis backed registry'.format(state)
+            )
+        return redis
+
+    def _is_adaptive(self, schedule):
+        return bool(schedule.options.get('adaptive_cycle', False))
+
+    def _get_cycle_bounds(self, schedule):
+        minimum = schedule.options.get('min_cycle') or DEFAULT_MIN_CYCLE
+        maximum = schedule.options.get('max_cycle') or DEFAULT_MAX_CYCLE
+        return minimum * 60, max(minimum, maximum) * 60
+
+    def _get_interval(self, schedule):
+        interval = schedule.cycle * 60
+        if not self._is_adaptive(schedule):
+            self._intervals.pop(schedule.id, None)
+            return interval
+
+        # resume from the adapted interval if the schedule has been adapted
+        # already, e.g. before the scheduler's restart.
+        minimum, maximum = self._get_cycle_bounds(schedule)
+        interval = self.cycles.get(schedule.id) or interval
+        interval = min(max(interval, minimum), maximum)
+        self._intervals[schedule.id] = interval
+        return interval
+
+    def _reschedule(self, id, interval):
+        if self._intervals.get(id) != interval:
+            self._intervals[id] = interval
+            self.jobs.push(id, interval, jitter=self.jitter)
+
+    def _sync_intervals(self, ids):
+        # pick up the intervals adapted by the workers that have run the
+        # schedules' previous covers.
+        adaptive = [id for id in ids if id in self._intervals]
+        for id, interval in self.cycles.get_many(adaptive).items():
+            self._reschedule(id, interval)
+
+    def _get_delay(self, schedule, interval):
+        if not self.stagger:
+            return interval
+
+        # phases are aligned to the wall clock so that they are kept over
+        # scheduler restarts and agreed by schedulers of other processes.
+        phase = (schedule.id * SCHEDULE_PHASE_RATIO) % 1 * interval
+        return (phase - time.time()) % interval
 
     def _make_cover(self, schedule):
         reporter_class, kwargs = self.mapping[schedule]
@@ -293,39 +792,160 @@ class Scheduler(object):
             reporter_class=reporter_class,
             dispatch_middlewares=self.dispatch_middlewares,
             fetch_middlewares=self.fetch_middlewares,
+            executor=self._parse_executor,
+            runtime=get_runtime(),
             **kwargs
         )
         return cover
 
     def _make_run_cover(self):
-        def run_cover(task, id):
+        def run_cover(task, id, snapshot=None):
             # mark task state started
             task.update_state(states.STARTED)
 
-            # retrieve a schedule and make cover from it
-            schedule = self.backend.get_schedule(id)
+            # load a schedule and make cover from it. keep the schedule for
+            # the callbacks.
+            schedule = self._load_schedule(id, snapshot)
+            self._covered_schedules[task.request.id] = schedule
             cover = self._make_cover(schedule)
 
-            # pop from task queue indicator
-            if id in self.queued:
-                self.queued.remove(id)
-
             # run news cover along with registered callbacks
             sl = 'Cover for schedule {} starting'.format(id)
             fl = 'Cover for schedule{} finished'.format(id)
             with self._log_ctx(sl, fl, t1='debug', t2='debug'):
                 if self.on_cover_start:
                     self.on_cover_start(schedule)
-                cover.run()
+                news = cover.run()
+                self._adapt_cycle(schedule, cover, news)
+                return news
 
         return run_cover
 
+    def _make_run_covers(self):
+        def run_covers(task, covers):
+            task.update_state(states.STARTED)
+
+            runtime = get_runtime()
+            semaphore = asyncio.Semaphore(self.batch_concurrency)
+            results = runtime.run(asyncio.gather(*[
+                self._run_batched_cover(semaphore, id, snapshot)
+                for id, snapshot in covers
+            ]))
+            return {
+                'succeeded': [id for (id, _), r in zip(covers, results) if r],
+                'failed': [id for (id, _), r in zip(covers, results) if not r],
+            }
+
+        return run_covers
+
+    async def _run_batched_cover(self, semaphore, id, snapshot=None):
+        async with semaphore:
+            return await self._dispatch_cover(id, snapshot)
+
+    async def _dispatch_cover(self, id, snapshot=None):
+        schedule = None
+        try:
+            schedule = self._load_schedule(id, snapshot)
+            cover = self._make_cover(schedule)
+            if self.on_cover_start:
+                self.on_cover_start(schedule)
+            news = await cover.dispatch()
+        except Exception as e:
+            self.inflight.release(id)
+            self._log('Cover for schedule {} failed: {}'.format(id, e),
+                      tag='error')
+            if self.on_cover_failure:
+                schedule = schedule or self.backend.get_schedule(id)
+                self.on_cover_failure(schedule, e)
+            return False
+
+        self.inflight.release(id)
+        self._adapt_cycle(schedule, cover, news)
+        if self.on_cover_success:
+            self.on_cover_success(schedule, news)
+        return True
+
+    def _adapt_cycle(self, schedule, cover, news):
+        try:
+            self.adapt(schedule, cover.count_yield(news))
+        except Exception as e:
+            self._log('Failed to adapt cycle of schedule {}: {}'.format(
+                schedule.id, e), tag='error')
+
     def _push_cover(self, id):
-        # do not push cover into task queue if already exists
-        if not self.celery_task or id in self.queued:
+        self._push_covers([id])
+
+    def _push_covers(self, ids):
+        # do not push covers into task queue if they are still in-flight.
+        if not ids or (not self.celery_task and self.executor is None):
             return
-        self.celery_task.apply_async((id,), task_id=str(id))
-        self.queued.add(id)
+        ids = self.inflight.acquire_many(ids)
+        if not ids:
+            return
+
+        # hand the covers over to the local executor if we have any. covers
+        # run by the executor reschedule their schedules by themselves.
+        if self.executor is not None:
+            for id in ids:
+                self.executor.submit(id, self._make_snapshot(id))
+            return
+
+        self._sync_intervals(ids)
+
+        # publish the covers over a single producer. the queued covers
+        # expire along with their in-flight registrations.
+        with elapsed_timer() as elapsed:
+            with self.celery.producer_or_acquire() as producer:
+                if self.batch_size and self.celery_batch_task:
+                    for batch in chunks(ids, self.batch_size):
+                        self._publish(
+                            self.celery_batch_task, batch, producer,
+                            ([(id, self._make_snapshot(id)) for id in batch],)
+                        )
+                else:
+                    for id in ids:
+                        self._publish(
+                            self.celery_task, [id], producer,
+                            (id, self._make_snapshot(id)), task_id=str(id)
+                        )
+
+        self._log('Pushed {} cover(s) in {:.3f} second(s)'.format(
+            len(ids), elapsed()), tag='debug')
+
+    def _publish(self, task, ids, producer, args, **options):
+        try:
+            task.apply_async(args, expires=self.inflight.deadline,
+                             producer=producer, **options)
+        except Exception as e:
+            for id in ids:
+                self.inflight.release(id)
+            self._log('Failed to push cover for schedule(s) {}: {}'.format(
+                ', '.join(str(id) for id in ids), e), tag='error')
+
+    def _init_runtime(self, **kwargs):
+        init_runtime()
+
+    def _close_runtime(self, **kwargs):
+        close_runtime()
+
+    def _make_snapshot(self, id):
+        snapshot = self._snapshots.get(id)
+        return dict(snapshot, pushed=time.time()) if snapshot else None
+
+    def _load_schedule(self, id, snapshot=None):
+        # trust the snapshot only if it's fresh enough and it's schedule
+        # hasn't been changed since.
+        if snapshot is None or \
+                time.time() - snapshot['pushed'] > self.snapshot_max_age or \
+                self._is_stale(snapshot):
+            return self.backend.get_schedule(id)
+        return self.backend.load_schedule(snapshot)
+
+    def _is_stale(self, snapshot):
+        if self.persister is None or snapshot.get('updated') is None:
+            return False
+        stamp = self.persister.get_stamp(snapshot['id'])
+        return stamp is not None and stamp > snapshot['updated']
 
     def _log(self, message, tag='info'):
         logging_method = getattr(logger, tag)
@@ -1,4 +1,7 @@
+import calendar
 import importlib
+import itertools
+from datetime import datetime
 
 
 def importattr(path):
@@ -9,3 +12,17 @@ def importattr(path):
         middleware_name
     )
     return middleware
+
+
+def chunks(iterable, size):
+    iterator = iter(iterable)
+    chunk = list(itertools.islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, size))
+
+
+def timestamp(value):
+    if not isinstance(value, datetime):
+        return None
+    return calendar.timegm(value.utctimetuple()) + value.microsecond / 1e6
@@ -31,25 +31,24 @@ else:
 # dependencies
 peer_dependencies = [
     'celery>=3.1.23',
-    'redis>=2.10.5',
+    'redis>=3.0.0',
 ]
 install_dependencies = [
-    'aiohttp>=0.19.0',
-    'schedule>=0.3.2',
+    'aiohttp>=2.0.0',
     'feedparser>=5.2.1',
     'beautifulsoup4>=4.4.1',
-    'extraction==0.2.1',
     'urltools>=0.3.2',
     'colorlog>=2.6.0',
-    'django>=1.7,<1.10',
+    'django>=1.8,<1.10',
     'django-jsonfield>=0.9.16',
     'SQLAlchemy>=1.0.11',
     'sqlalchemy-utils>=0.31.6',
 ]
-external_dependencies = [
-    'https://github.com/kuc2477/extraction/archive/master.zip' +
-    '#egg=extraction-0.2.1'
-]
+external_dependencies = []
+optional_dependencies = {
+    'lxml': ['lxml>=3.5.0'],
+    'uvloop': ['uvloop>=0.8.0'],
+}
 test_dependencies = [
     'pytest>=2.8.5',
     'pytest-asyncio>=0.3.0',
@@ -57,7 +56,8 @@ test_dependencies = [
     'pytest-mock>=0.11.0',
     'pytest-cov>=2.2.1',
     'celery>=3.1.23',
-    'redis>=2.10.5',
+    'redis>=3.0.0',
+    'fakeredis>=1.0.0',
 ]
 
 
@@ -75,6 +75,7 @@ setup(
     maintainer_email='kuc2477@gmail.com',
     url='https://github.com/kuc2477/news',
     install_requires=(install_dependencies + peer_dependencies),
+    extras_require=optional_dependencies,
     dependency_links=external_dependencies,
     test_suite='tests',
     tests_require=test_dependencies,
@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 
 @pytest.mark.django_db
@@ -48,8 +50,9 @@ def test_save_news(django_backend, django_schedule, django_news_model,
 
 
 @pytest.mark.django_db
-def test_cascade_save_news(django_backend, django_schedule, django_news_model,
-                           url_root, content_root, url_child, content_child):
+def test_save_news_with_unsaved_parent(
+        django_backend, django_schedule, django_news_model,
+        url_root, content_root, url_child, content_child):
     root = django_news_model(
         schedule=django_schedule,
         url=url_root,
@@ -98,3 +101,101 @@ def test_get_schedules(django_backend, django_schedule):
     assert(django_schedule in django_backend.get_schedules(
         owner=django_schedule.owner, url=django_schedule.url
     ))
+
+
+@pytest.mark.django_db
+def test_get_news_map(django_backend, django_schedule, django_root_news,
+                      django_child_news):
+    news_map = django_backend.get_news_map(django_schedule)
+    assert(news_map[django_root_news.url] == django_root_news)
+    assert(news_map[django_child_news.url] == django_child_news)
+    assert(news_map[django_child_news.url].parent == django_root_news)
+
+
+@pytest.mark.django_db
+def test_save_news_updates_existing_news(django_backend, django_schedule,
+                                         django_news_model, django_root_news,
+                                         django_child_news, content_child):
+    news = django_news_model(
+        schedule=django_schedule,
+        parent=django_root_news,
+        url=django_child_news.url,
+        content=content_child + 'updated'
+    )
+    django_backend.save_news(news)
+    assert(news.id == django_child_news.id)
+    assert(django_backend.get_news(news.id).content == news.content)
+
+
+@pytest.mark.django_db
+def test_save_news_in_bulk(django_backend, django_schedule, django_news_model,
+                           url_root, content_root):
+    root = django_news_model(
+        schedule=django_schedule, url=url_root, content=content_root
+    )
+    children = [django_news_model(
+        schedule=django_schedule, parent=root,
+        url='{}/{}'.format(url_root, i), content=content_root
+    ) for i in range(1000)]
+    django_backend.save_news(*reversed(children))
+
+    assert(root.id is not None)
+    assert(all(c.id is not None for c in children))
+    assert(all(c.parent == root for c in
+               django_backend.get_news_list(root_url=url_root)
+               if c.id != root.id))
+
+
+@pytest.mark.django_db
+def test_save_news_map_with_constant_queries(django_backend, django_schedule,
+                                             django_news_model, url_root,
+                                             content_root):
+    root = django_news_model(
+        schedule=django_schedule, url=url_root, content=content_root
+    )
+    children = [django_news_model(
+        schedule=django_schedule, parent=root,
+        url='{}/{}'.format(url_root, i), content=content_root
+    ) for i in range(10)]
+    django_backend.save_news(*children)
+
+    # deferred fields of the stored news shouldn't be loaded one by one.
+    news_map = django_backend.get_news_map(django_schedule)
+    with CaptureQueriesContext(connection) as queries:
+        django_backend.save_news(*news_map.values())
+    assert(not any(q['sql'].startswith('SELECT') for q in queries))
+    assert(all(n.content == content_root for n in
+               django_backend.get_news_list(root_url=url_root)))
+
+
+@pytest.mark.django_db
+def test_dump_and_load_schedule(django_backend, django_schedule):
+    snapshot = django_backend.dump_schedule(django_schedule)
+    schedule = django_backend.load_schedule(snapshot)
+    assert(schedule == django_schedule)
+    assert(schedule.owner == django_schedule.owner)
+    assert(django_backend.dump_schedule(schedule) == snapshot)
+
+
+@pytest.mark.django_db
+def test_save_and_get_pages(django_backend, django_schedule,
+                            django_page_model, url_root, url_child):
+    now = django_backend.now()
+    root = django_page_model.create_instance(
+        url=url_root, schedule=django_schedule, fingerprint='root',
+        fetched=now, changed=now, etag='etag'
+    )
+    django_backend.save_pages(root)
+
+    pages = django_backend.get_pages(django_schedule)
+    assert(set(pages) == {url_root})
+    assert(pages[url_root].etag == 'etag')
+
+    pages[url_root].fingerprint = 'changed'
+    child = django_page_model.create_instance(url=url_child,
+                                              schedule=django_schedule)
+    django_backend.save_pages(pages[url_root], child)
+
+    pages = django_backend.get_pages(django_schedule)
+    assert(set(pages) == {url_root, url_child})
+    assert(pages[url_root].fingerprint == 'changed')
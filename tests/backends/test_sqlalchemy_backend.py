@@ -48,3 +48,76 @@ def test_get_schedule(sa_session, sa_backend, sa_schedule):
 def test_get_schedules(sa_session, sa_backend, sa_schedule,
                        sa_owner, url_root):
     assert(sa_schedule in sa_backend.get_schedules(sa_owner, url_root))
+
+
+def test_get_news_map(sa_session, sa_backend, sa_schedule, sa_root_news,
+                      sa_child_news):
+    news_map = sa_backend.get_news_map(sa_schedule)
+    assert(news_map[sa_root_news.url] == sa_root_news)
+    assert(news_map[sa_child_news.url] == sa_child_news)
+    assert(news_map[sa_child_news.url].parent == sa_root_news)
+
+
+def test_save_news_without_root(sa_session, sa_backend, sa_schedule,
+                                sa_news_model, sa_root_news, sa_child_news):
+    news = sa_news_model.create_instance(
+        schedule=sa_schedule,
+        parent=sa_child_news,
+        url=sa_child_news.url + '/grandchild',
+        title='title',
+        content='content',
+        summary='summary'
+    )
+    sa_backend.save_news(news)
+    assert(news.id is not None)
+    assert(sa_backend.get_news(news.id).parent == sa_child_news)
+
+
+def test_save_news_updates_existing_news(sa_session, sa_backend, sa_schedule,
+                                         sa_news_model, sa_root_news,
+                                         sa_child_news):
+    news = sa_news_model.create_instance(
+        schedule=sa_schedule,
+        parent=sa_root_news,
+        url=sa_child_news.url,
+        title='title',
+        content='updated',
+        summary='summary'
+    )
+    sa_backend.save_news(news)
+    assert(news.id == sa_child_news.id)
+    assert(sa_backend.get_news(news.id).content == 'updated')
+
+
+def test_dump_and_load_schedule(sa_session, sa_backend, sa_schedule):
+    snapshot = sa_backend.dump_schedule(sa_schedule)
+    sa_session.expunge_all()
+
+    schedule = sa_backend.load_schedule(snapshot)
+    assert(schedule.id == sa_schedule.id)
+    assert(schedule.options == sa_schedule.options)
+    assert(schedule.owner.id == sa_schedule.owner_id)
+    assert(sa_backend.dump_schedule(schedule) == snapshot)
+
+
+def test_save_and_get_pages(sa_session, sa_backend, sa_schedule,
+                            sa_page_model, url_root, url_child):
+    now = sa_backend.now()
+    root = sa_page_model.create_instance(
+        url=url_root, schedule=sa_schedule, fingerprint='root',
+        fetched=now, changed=now, etag='etag'
+    )
+    sa_backend.save_pages(root)
+
+    pages = sa_backend.get_pages(sa_schedule)
+    assert(set(pages) == {url_root})
+    assert(pages[url_root].etag == 'etag')
+
+    pages[url_root].fingerprint = 'changed'
+    child = sa_page_model.create_instance(url=url_child,
+                                          schedule=sa_schedule)
+    sa_backend.save_pages(pages[url_root], child)
+
+    pages = sa_backend.get_pages(sa_schedule)
+    assert(set(pages) == {url_root, url_child})
+    assert(pages[url_root].fingerprint == 'changed')
@@ -0,0 +1,54 @@
+import pytest
+from news.contrib.throttling.middlewares import (
+    TokenBucket,
+    get_host_bucket,
+)
+
+
+def test_token_bucket_reserve():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert(bucket.reserve() == 0)
+    assert(bucket.reserve() == 0)
+    assert(0.05 < bucket.reserve() <= 0.1)
+    assert(0.15 < bucket.reserve() <= 0.2)
+
+
+def test_token_bucket_configure():
+    bucket = TokenBucket(rate=10, burst=5)
+    bucket.configure(rate=20, burst=10)
+    assert(bucket.rate == 20)
+    assert(bucket.burst == 10)
+    bucket.configure(rate=1, burst=1)
+    assert(bucket.rate == 1)
+    assert(bucket.burst == 1)
+    assert(bucket.reserve() == 0)
+    assert(0.9 < bucket.reserve() <= 1)
+
+
+def test_token_bucket_limited_by_strictest_user():
+    bucket = TokenBucket(rate=10, burst=5, ttl=60)
+    bucket.limit('strict', rate=1, burst=1)
+    bucket.limit('loose', rate=20, burst=10)
+    assert((bucket.rate, bucket.burst) == (1, 1))
+
+    # users' own limits are replaced and expire after the ttl.
+    bucket.limit('strict', rate=5, burst=2)
+    assert((bucket.rate, bucket.burst) == (5, 2))
+    rate, burst, stamp = bucket._limits['strict']
+    bucket._limits['strict'] = (rate, burst, stamp - 61)
+    bucket.limit('loose', rate=20, burst=10)
+    assert((bucket.rate, bucket.burst) == (20, 10))
+
+
+def test_host_bucket_shared():
+    bucket = get_host_bucket('www.throttled.com', rate=5)
+    assert(get_host_bucket('www.throttled.com', rate=5) is bucket)
+    assert(get_host_bucket('www.other.com', rate=5) is not bucket)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_acquire():
+    bucket = TokenBucket(rate=1000, burst=1)
+    await bucket.acquire()
+    await bucket.acquire()
+    assert(bucket.reserve() > 0)
@@ -3,8 +3,10 @@ from news.backends.django import DjangoBackend
 
 
 @pytest.fixture
-def django_backend(django_schedule_model, django_news_model):
+def django_backend(django_schedule_model, django_news_model,
+                   django_page_model):
     return DjangoBackend.create_backend(
         schedule_model=django_schedule_model,
-        news_model=django_news_model
+        news_model=django_news_model,
+        page_model=django_page_model,
     )
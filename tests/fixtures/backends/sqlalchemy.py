@@ -3,9 +3,10 @@ from news.backends.sqlalchemy import SQLAlchemyBackend
 
 
 @pytest.fixture
-def sa_backend(sa_schedule_model, sa_news_model, sa_session):
+def sa_backend(sa_schedule_model, sa_news_model, sa_page_model, sa_session):
     backend = SQLAlchemyBackend.create_backend(
         schedule_model=sa_schedule_model,
-        news_model=sa_news_model
+        news_model=sa_news_model,
+        page_model=sa_page_model,
     ).bind(sa_session)
     return backend
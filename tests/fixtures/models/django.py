@@ -22,6 +22,11 @@ def django_news_abc(django_schedule_model):
     return django.create_news_abc(django_schedule_model)
 
 
+@pytest.fixture(scope='session')
+def django_page_abc(django_schedule_model):
+    return django.create_page_abc(django_schedule_model)
+
+
 @pytest.fixture(scope='session')
 def django_schedule_model(django_schedule_abc, persister):
     return django.create_schedule(django_schedule_abc,
@@ -33,6 +38,11 @@ def django_news_model(django_news_abc):
     return django.create_news(django_news_abc)
 
 
+@pytest.fixture(scope='session')
+def django_page_model(django_page_abc):
+    return django.create_page(django_page_abc)
+
+
 # ======================
 # Django model instances
 # ======================
@@ -31,7 +31,7 @@ def sa_declarative_base():
 @pytest.fixture(scope='session')
 def sa_db(request,
           sa_declarative_base, sa_engine,
-          sa_owner_model, sa_schedule_model, sa_news_model):
+          sa_owner_model, sa_schedule_model, sa_news_model, sa_page_model):
     # create tables
     sa_declarative_base.metadata.create_all(bind=sa_engine)
 
@@ -73,6 +73,11 @@ def sa_news_abc(sa_schedule_model):
     return sa.create_news_abc(sa_schedule_model)
 
 
+@pytest.fixture(scope='session')
+def sa_page_abc(sa_schedule_model):
+    return sa.create_page_abc(sa_schedule_model)
+
+
 @pytest.fixture(scope='session')
 def sa_owner_model(sa_declarative_base):
 
@@ -94,6 +99,11 @@ def sa_news_model(sa_news_abc, sa_declarative_base):
     return sa.create_news(sa_news_abc, sa_declarative_base)
 
 
+@pytest.fixture(scope='session')
+def sa_page_model(sa_page_abc, sa_declarative_base):
+    return sa.create_page(sa_page_abc, sa_declarative_base)
+
+
 # ===========================
 # SQLAlchemy model instances
 # ===========================
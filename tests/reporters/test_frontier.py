@@ -0,0 +1,31 @@
+import pytest
+from unittest.mock import Mock
+from news.reporters.frontier import Frontier
+
+
+def reporter(url):
+    return Mock(url=url, distance=0)
+
+
+@pytest.mark.asyncio
+async def test_bounded_frontier():
+    root = Mock(options={}, crawl_state=None)
+    scores = {'http://a': 1, 'http://b': 2, 'http://c': 3, 'http://d': 0}
+    frontier = Frontier(root, scorer=lambda r, f: scores[r.url], capacity=2)
+
+    # the lowest scoring reporters should be evicted for better ones.
+    assert(frontier.push(reporter('http://a')))
+    assert(frontier.push(reporter('http://b')))
+    assert(frontier.push(reporter('http://c')))
+    assert(not frontier.push(reporter('http://d')))
+    assert(len(frontier) == 2 and 'http://a' not in frontier)
+    assert(set(frontier.inlinks) == {'http://b', 'http://c'})
+
+    assert((await frontier.pop()).url == 'http://c')
+    frontier.task_done()
+
+    # closed frontiers should be drained and refuse further pushes.
+    frontier.close()
+    assert(not frontier.push(reporter('http://a')))
+    assert(not frontier)
+    await frontier.join()
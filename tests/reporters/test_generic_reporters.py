@@ -0,0 +1,123 @@
+import asyncio
+import pytest
+from news.reporters import ReporterMeta
+from news.reporters import generics
+from news.reporters.generics import TraversingReporter
+from news.reporters.mixins import DomainTraversingMixin
+
+
+class GraphReporter(TraversingReporter):
+    graph = {
+        'http://a': ['http://b', 'http://c', 'http://d'],
+        'http://b': ['http://e', 'http://f'],
+        'http://c': ['http://g'],
+        'http://e': ['http://h'],
+    }
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch(self):
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        await asyncio.sleep(0.01)
+        cls.in_flight -= 1
+        await self.report_visit()
+        return self.url
+
+    async def get_urls(self, news):
+        return self.graph.get(self.url, [])
+
+    def report_news(self, *news):
+        pass
+
+
+@pytest.mark.django_db
+@pytest.mark.asyncio
+async def test_dispatch_frontier(django_schedule):
+    django_schedule.url = 'http://a'
+    django_schedule.options = {'max_visit': 5, 'max_dist': 2}
+    meta = ReporterMeta(django_schedule)
+    reporter = GraphReporter(meta=meta, backend=None, concurrency=2)
+
+    news = await reporter.dispatch()
+    assert(len(news) == 5)
+    assert('http://h' not in news)
+    assert(len(await reporter.get_visited()) == 5)
+    assert(GraphReporter.max_in_flight <= 2)
+
+
+@pytest.mark.django_db
+@pytest.mark.asyncio
+async def test_dispatch_frontier_in_priority_order(django_schedule):
+    django_schedule.url = 'http://a'
+    django_schedule.options = {
+        'max_visit': 3,
+        'url_weights': {'http://c': 10, 'http://g': 10},
+    }
+    meta = ReporterMeta(django_schedule)
+    reporter = GraphReporter(meta=meta, backend=None, concurrency=1)
+
+    news = await reporter.dispatch()
+    assert(news == ['http://a', 'http://c', 'http://g'])
+
+
+@pytest.mark.django_db
+@pytest.mark.asyncio
+async def test_dispatch_frontier_within_max_dist(django_schedule):
+    django_schedule.url = 'http://a'
+    django_schedule.options = {'max_dist': 0}
+    meta = ReporterMeta(django_schedule)
+    reporter = GraphReporter(meta=meta, backend=None, concurrency=2)
+    assert(await reporter.dispatch() == ['http://a'])
+
+    django_schedule.options = {'max_dist': 1}
+    meta = ReporterMeta(django_schedule)
+    reporter = GraphReporter(meta=meta, backend=None, concurrency=2)
+    news = await reporter.dispatch()
+    assert(sorted(news) == ['http://a', 'http://b', 'http://c', 'http://d'])
+
+
+class FailingGraphReporter(GraphReporter):
+    async def fetch(self):
+        if self.url == 'http://b':
+            raise ValueError('Failed to fetch')
+        return await super().fetch()
+
+
+@pytest.mark.django_db
+@pytest.mark.asyncio
+async def test_dispatch_frontier_over_failed_visits(django_schedule,
+                                                    monkeypatch):
+    failures = []
+    monkeypatch.setattr(generics.logger, 'exception',
+                        lambda msg, *args, **kwargs: failures.append(msg))
+    django_schedule.url = 'http://a'
+    django_schedule.options = {}
+    meta = ReporterMeta(django_schedule)
+    reporter = FailingGraphReporter(meta=meta, backend=None, concurrency=2)
+
+    news = await reporter.dispatch()
+    assert(sorted(news) == ['http://a', 'http://c', 'http://d', 'http://g'])
+    assert(len(failures) == 1 and 'http://b' in failures[0])
+
+
+class DomainGraphReporter(DomainTraversingMixin, GraphReporter):
+    pass
+
+
+@pytest.mark.django_db
+@pytest.mark.asyncio
+async def test_worth_to_visit_within_max_dist(django_schedule):
+    django_schedule.url = 'http://a'
+    django_schedule.options = {'max_dist': 0}
+    meta = ReporterMeta(django_schedule)
+    root = DomainGraphReporter(meta=meta, backend=None)
+    assert(not await root.worth_to_visit(None, 'http://a/b'))
+
+    django_schedule.options = {'max_dist': 1}
+    meta = ReporterMeta(django_schedule)
+    root = DomainGraphReporter(meta=meta, backend=None)
+    child = root._inherit_meta(url='http://a/b', parent=root)
+    assert(await root.worth_to_visit(None, 'http://a/b'))
+    assert(not await child.worth_to_visit(None, 'http://a/b/c'))
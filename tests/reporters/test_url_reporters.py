@@ -53,10 +53,10 @@ async def test_get_urls(django_backend, django_schedule):
 @pytest.mark.asyncio
 async def test_report_visited(django_root_url_reporter):
     assert(django_root_url_reporter.url not in
-           django_root_url_reporter._visited_urls)
+           django_root_url_reporter.visited)
     await django_root_url_reporter.report_visit()
     assert(django_root_url_reporter.url in
-           django_root_url_reporter._visited_urls)
+           django_root_url_reporter.visited)
 
 
 @pytest.mark.asyncio
@@ -137,3 +137,10 @@ def test_batch_traversing_reporter_mixin(
     assert(summoned[1].parent == summoned[0])
     assert(summoned[2].parent == summoned[1])
     assert(summoned[3].parent == summoned[2])
+
+
+def test_inherit_session(django_root_url_reporter, url_child):
+    session = object()
+    django_root_url_reporter.session = session
+    child = django_root_url_reporter._inherit_meta(url_child)
+    assert(child.session is session)
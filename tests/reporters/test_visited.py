@@ -0,0 +1,16 @@
+import pytest
+from news.reporters.visited import VisitedSet
+
+
+@pytest.mark.parametrize('error_rate', [None, 0.01])
+def test_visited_set(error_rate):
+    visited = VisitedSet(capacity=4, error_rate=error_rate)
+    urls = ['http://a.com/{}'.format(i) for i in range(1000)]
+    assert(all(visited.add(u) for u in urls))
+    assert(not visited.add(urls[0]))
+    assert(len(visited) == 1000)
+
+    # the table should have grown beyond it's capacity.
+    assert(all(u in visited for u in urls))
+    assert(not any('http://b.com/{}'.format(i) in visited for i in
+                   range(1000)))
@@ -0,0 +1,44 @@
+import pytest
+from fakeredis import FakeRedis
+from news.cluster import Cluster, HashRing
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+def test_hash_ring_is_consistent():
+    ring = HashRing(['a', 'b', 'c'])
+    grown = HashRing(['a', 'b', 'c', 'd'])
+    keys = range(10000)
+
+    owners = [ring.get_node(k) for k in keys]
+    assert(all(owners.count(n) > 2000 for n in 'abc'))
+
+    # only keys moved to the new node should change their owners
+    moved = [k for k in keys if ring.get_node(k) != grown.get_node(k)]
+    assert(all(grown.get_node(k) == 'd' for k in moved))
+    assert(len(moved) < 4000)
+
+
+def test_cluster_membership(redis):
+    a = Cluster(redis, node_id='a')
+    b = Cluster(redis, node_id='b')
+    assert(not a.beat())
+    assert(b.beat())
+    assert(a.beat())
+    assert(a.nodes == b.nodes == {'a', 'b'})
+    assert(all(a.owns(id) != b.owns(id) for id in range(100)))
+
+    b.stop()
+    assert(a.beat())
+    assert(all(a.owns(id) for id in range(100)))
+
+
+def test_cluster_drops_dead_nodes(redis):
+    a = Cluster(redis, node_id='a', timeout=-1)
+    b = Cluster(redis, node_id='b', timeout=-1)
+    b.beat()
+    a.beat()
+    assert(a.nodes == {'a'})
@@ -42,3 +42,11 @@ async def test_cover_prepare(cover, django_root_news):
     # check middlewares has been applied properly
     assert(await cover.reporter.dispatch() == [1, 2, 3])
     assert(await cover.reporter.fetch() == 10)
+
+
+def test_cover_prepare_without_news_map(mocker, cover):
+    mocker.patch.object(cover.backend, 'get_news_map',
+                        side_effect=NotImplementedError)
+    cover.prepare(reporter_class=URLReporter)
+    assert(cover.reporter.meta.stored_news is None)
+    assert(cover.stored_urls is None)
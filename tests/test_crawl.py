@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from news.crawl import CrawlState, fingerprint
+from news.models.abstract import AbstractPage
+
+
+class Page(AbstractPage):
+    def __init__(self, url, schedule, **kwargs):
+        self.id = None
+        self.url = url
+        self.schedule = schedule
+        for k in ('fingerprint', 'fetched', 'changed', 'etag',
+                  'last_modified', 'discovered'):
+            setattr(self, k, kwargs.get(k))
+        self.visits = kwargs.get('visits', 0)
+        self.changes = kwargs.get('changes', 0)
+
+
+class Backend(object):
+    Page = Page
+
+    def __init__(self):
+        self.clock = datetime(2017, 1, 1)
+        self.saved = []
+
+    def now(self):
+        return self.clock
+
+    def get_pages(self, schedule):
+        return {}
+
+    def save_pages(self, *pages):
+        self.saved.extend(pages)
+
+
+def test_fingerprint():
+    assert(fingerprint('content') == fingerprint('content'))
+    assert(fingerprint('content') != fingerprint('changed'))
+    assert(len(fingerprint('content')) == 16)
+
+
+def test_record_changes():
+    backend = Backend()
+    crawl_state = CrawlState.load(None, backend)
+    page = crawl_state.record('url', 'content', {'ETag': 'etag'})
+    assert(page.changed == page.fetched == backend.clock)
+    assert(crawl_state.headers('url') == {'If-None-Match': 'etag'})
+
+    # unmodified or unchanged contents shouldn't renew the changed datetime.
+    changed = backend.clock
+    backend.clock += timedelta(minutes=10)
+    crawl_state.record('url')
+    crawl_state.record('url', 'content')
+    assert(page.changed == changed and page.fetched == backend.clock)
+
+    backend.clock += timedelta(minutes=10)
+    crawl_state.record('url', 'changed')
+    assert(page.changed == backend.clock)
+    assert(page.visits == 3 and page.changes == 1)
+    assert(crawl_state.changed == {'url'})
+
+    crawl_state.save()
+    crawl_state.save()
+    assert(backend.saved == [page])
+
+
+def test_validators_kept_between_covers():
+    backend = Backend()
+    crawl_state = CrawlState.load(None, backend)
+    crawl_state.record('url', 'content', {
+        'ETag': 'etag', 'Last-Modified': 'last modified'
+    })
+    crawl_state.save()
+
+    # validators should be restored from the saved pages on the next cover.
+    backend.get_pages = lambda schedule: {p.url: p for p in backend.saved}
+    crawl_state = CrawlState.load(None, backend)
+    assert(crawl_state.headers('url') == {
+        'If-None-Match': 'etag', 'If-Modified-Since': 'last modified'
+    })
+
+    backend.saved = []
+    crawl_state.discard_validators('url')
+    assert(crawl_state.headers('url') == {})
+    crawl_state.save()
+    assert([p.etag for p in backend.saved] == [None])
+
+
+def test_likely_changed():
+    backend = Backend()
+    crawl_state = CrawlState.load(None, backend)
+    assert(crawl_state.likely_changed('url'))
+
+    # pages that have not been revisited yet are always likely to have
+    # changed.
+    crawl_state.record('url', 'content')
+    assert(crawl_state.likely_changed('url'))
+
+    # pages never found changed are expected to stay unchanged as long as
+    # they've been observed.
+    backend.clock += timedelta(minutes=10)
+    crawl_state.record('url', 'content')
+    backend.clock += timedelta(minutes=5)
+    assert(not crawl_state.likely_changed('url'))
+    assert(crawl_state.due() == [])
+    backend.clock += timedelta(minutes=5)
+    assert(crawl_state.likely_changed('url'))
+    assert(crawl_state.due() == ['url'])
+
+
+def test_change_rate():
+    backend = Backend()
+    crawl_state = CrawlState.load(None, backend, threshold=0.5)
+    for i in range(10):
+        crawl_state.record('front', 'front {}'.format(i))
+        crawl_state.record('article', 'article')
+        backend.clock += timedelta(hours=1)
+    assert(crawl_state.change_rate('front') >
+           crawl_state.change_rate('article') * 10)
+
+    # pages that change often should be revisited first and more often.
+    assert(crawl_state.due() == ['front'])
+    backend.clock += timedelta(hours=10)
+    assert(crawl_state.due() == ['front', 'article'])
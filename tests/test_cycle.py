@@ -0,0 +1,34 @@
+import pytest
+from fakeredis import FakeRedis
+from news.cycle import CycleRegistry, LocalCycleRegistry, adapt_interval
+
+
+@pytest.fixture(params=['redis', 'local'])
+def cycles(request):
+    if request.param == 'redis':
+        return CycleRegistry(FakeRedis())
+    return LocalCycleRegistry()
+
+
+def test_adapt_interval():
+    # stretch on empty covers and shrink on fruitful ones.
+    assert(adapt_interval(600, 0, 60, 3600) == 1200)
+    assert(adapt_interval(600, 1, 60, 3600) == 600)
+    assert(adapt_interval(600, 10, 60, 3600) == 300)
+    assert(adapt_interval(600, 4, 60, 3600, target=2) == 300)
+
+    # intervals shouldn't exceed their bounds.
+    assert(adapt_interval(3000, 0, 60, 3600) == 3600)
+    assert(adapt_interval(100, 10, 60, 3600) == 60)
+
+
+def test_get_and_set(cycles):
+    assert(cycles.get(1) is None)
+    cycles.set(1, 600)
+    cycles.set(2, 1200.5)
+    assert(cycles.get(1) == 600)
+    assert(cycles.get_many([1, 2, 3]) == {1: 600, 2: 1200.5})
+
+    cycles.discard(1)
+    assert(cycles.get(1) is None)
+    assert(cycles.get_many([]) == {})
@@ -0,0 +1,57 @@
+import time
+import asyncio
+from celery import states
+from news.executor import LocalExecutor
+from news.inflight import LocalInflightRegistry
+
+
+class FakeScheduler(object):
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.inflight = LocalInflightRegistry()
+        self.covered = []
+
+    async def _dispatch_cover(self, id, snapshot=None):
+        await asyncio.sleep(self.delay)
+        self.covered.append(id)
+        self.inflight.release(id)
+        return id > 0
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return condition()
+
+
+def test_local_executor_runs_covers():
+    scheduler = FakeScheduler()
+    executor = LocalExecutor(workers=2)
+    executor.start(scheduler)
+    try:
+        assert(executor.AsyncResult('1').state == states.PENDING)
+        executor.submit(1)
+        executor.submit(-1)
+        assert(wait_for(lambda: len(scheduler.covered) == 2))
+
+        # states of finished covers should be pruned.
+        assert(wait_for(lambda: not executor._states))
+        assert(executor.AsyncResult('1').state == states.PENDING)
+    finally:
+        executor.stop()
+    assert(not executor.running)
+
+
+def test_local_executor_releases_cancelled_covers():
+    scheduler = FakeScheduler(delay=60)
+    executor = LocalExecutor()
+    executor.start(scheduler)
+    assert(scheduler.inflight.acquire(1))
+    executor.submit(1)
+    assert(wait_for(
+        lambda: executor.AsyncResult('1').state == states.STARTED))
+    executor.stop()
+
+    assert(not executor._states)
+    assert(1 not in scheduler.inflight)
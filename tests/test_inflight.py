@@ -0,0 +1,35 @@
+import time
+import pytest
+from fakeredis import FakeRedis
+from news.inflight import InflightRegistry, LocalInflightRegistry
+
+
+@pytest.fixture(params=['redis', 'local'])
+def inflight(request):
+    if request.param == 'redis':
+        return InflightRegistry(FakeRedis(), deadline=1)
+    return LocalInflightRegistry(deadline=1)
+
+
+def test_acquire_and_release(inflight):
+    assert(inflight.acquire(1))
+    assert(1 in inflight)
+    assert(not inflight.acquire(1))
+    assert(inflight.acquire(2))
+
+    inflight.release(1)
+    assert(1 not in inflight)
+    assert(inflight.acquire(1))
+
+
+def test_stalled_covers_expire(inflight):
+    assert(inflight.acquire(1))
+    time.sleep(1.1)
+    assert(1 not in inflight)
+    assert(inflight.acquire(1))
+
+
+def test_acquire_many(inflight):
+    assert(inflight.acquire(2))
+    assert(inflight.acquire_many([1, 2, 3]) == [1, 3])
+    assert(inflight.acquire_many([1, 2, 3]) == [])
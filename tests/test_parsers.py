@@ -0,0 +1,60 @@
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from news.models.abstract import Readable
+from news.parsers import parse_html, extract_links
+
+
+@pytest.fixture(params=['html.parser', 'lxml'])
+def html_parser(request):
+    return request.param
+
+
+def test_parse_html(url_root, content_root):
+    readable = parse_html(url_root, content_root)
+    assert(isinstance(readable, Readable))
+    assert(readable.url == url_root)
+    assert(readable.content == content_root)
+    assert(readable.title == 'Herman Melville - Moby-Dick')
+    assert(readable.summary.startswith('Lorem ipsum'))
+    assert(readable.links == {'/html'})
+    assert('links' not in readable.kwargs())
+
+
+def test_parse_html_meta(html_parser):
+    content = """
+    <html>
+        <head>
+            <title>head title</title>
+            <meta property="og:title" content="og title" />
+            <meta name="description" content="description" />
+            <meta name="twitter:image" content="http://image" />
+        </head>
+        <body>
+            <h1>heading</h1>
+            <p>paragraph</p>
+            <img src="/image" />
+            <a href="/a">a</a>
+            <a href="http://b">b</a>
+            <a>no link</a>
+        </body>
+    </html>
+    """
+    readable = parse_html('http://index', content, features=html_parser)
+    assert(readable.title == 'og title')
+    assert(readable.summary == 'description')
+    assert(readable.image == 'http://image')
+    assert(readable.links == {'/a', 'http://b'})
+
+
+def test_extract_links(url_root, content_root, content_child):
+    assert(extract_links(url_root, content_root) == {url_root + '/html'})
+    assert(extract_links(url_root, content_child) == set())
+
+
+def test_parse_html_in_process_pool(url_root, content_root):
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        readable = executor.submit(parse_html, url_root, content_root)\
+            .result()
+    assert(isinstance(readable, Readable))
+    assert(readable.url == url_root)
+    assert(readable.content == content_root)
@@ -1,60 +1,164 @@
-from time import sleep
-from news.constants import REDIS_PUBSUB_SLEEP_TIME
+import time
+import pytest
+from unittest.mock import Mock
+from news.persister import Persister
+from news.constants import (
+    REDIS_STREAM_BLOCK_TIME,
+    REDIS_PERSISTER_OFFSET_KEY_PREFIX,
+)
+
+
+def wait_for(condition, timeout=REDIS_STREAM_BLOCK_TIME * 5):
+    # changes are read by the persister's thread, which might be blocked on
+    # the stream until it's block time.
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture(autouse=True)
+def fresh_persister(persister):
+    # read only the changes made within each test.
+    persister.offset = None
+    for key in persister.redis.scan_iter(
+            REDIS_PERSISTER_OFFSET_KEY_PREFIX + '*'):
+        persister.redis.delete(key)
+    yield
+    persister.stop()
 
 
 def test_schedule_update(mocker, sa_session, sa_schedule,
                          sa_scheduler, persister):
-    persister.persist_save = lambda *args, **kwargs: None
     mocker.spy(persister, 'notify_saved')
-    mocker.spy(persister, 'persist_save')
+    mocker.patch.object(persister, 'persist')
     persister.start(sa_scheduler)
 
     assert(not persister.notify_saved.called)
-    assert(not persister.persist_save.called)
+    assert(not persister.persist.called)
 
     sa_schedule.url = 'changed'
     sa_session.commit()
 
-    sleep(REDIS_PUBSUB_SLEEP_TIME * 50)
+    assert(wait_for(lambda: persister.persist.called))
     assert(persister.notify_saved.called)
-    assert(persister.persist_save.called)
+    persister.persist.assert_called_once_with({sa_schedule.id: False})
     persister.stop()
 
 
 def test_schedule_create(mocker, sa_session, sa_schedule_model, sa_owner,
                          sa_scheduler, persister):
-    persister.persist_save = lambda *args, **kwargs: None
     mocker.spy(persister, 'notify_saved')
-    mocker.spy(persister, 'persist_save')
+    mocker.patch.object(persister, 'persist')
     persister.start(sa_scheduler)
 
     assert(not persister.notify_saved.called)
-    assert(not persister.persist_save.called)
+    assert(not persister.persist.called)
 
     schedule = sa_schedule_model(owner=sa_owner, url='new')
     sa_session.add(schedule)
     sa_session.commit()
 
-    sleep(REDIS_PUBSUB_SLEEP_TIME * 50)
+    assert(wait_for(lambda: persister.persist.called))
     assert(persister.notify_saved.called)
-    assert(persister.persist_save.called)
+    persister.persist.assert_called_once_with({schedule.id: False})
     persister.stop()
 
 
 def test_schedule_delete(mocker, sa_session, sa_schedule,
                          persister, sa_scheduler):
-    persister.persist_delete = lambda *args, **kwargs: None
     mocker.spy(persister, 'notify_deleted')
-    mocker.spy(persister, 'persist_delete')
+    mocker.patch.object(persister, 'persist')
     persister.start(sa_scheduler)
 
     assert(not persister.notify_deleted.called)
-    assert(not persister.persist_delete.called)
+    assert(not persister.persist.called)
 
+    id = sa_schedule.id
     sa_session.delete(sa_schedule)
     sa_session.commit()
 
-    sleep(REDIS_PUBSUB_SLEEP_TIME * 50)
+    assert(wait_for(lambda: persister.persist.called))
     assert(persister.notify_deleted.called)
-    assert(persister.persist_delete.called)
+    persister.persist.assert_called_once_with({id: True})
+    persister.stop()
+
+
+def test_schedule_changes_coalesced(mocker, sa_scheduler, persister):
+    mocker.patch.object(persister, 'persist')
+    persister.start(sa_scheduler)
+
+    for id in (1, 2, 1, 2):
+        persister.notify_saved(Mock(id=id), False)
+    persister.notify_deleted(Mock(id=2))
+
+    assert(wait_for(lambda: persister.persist.called))
+    persister.persist.assert_called_once_with({1: False, 2: True})
+    persister.stop()
+
+
+def test_missed_changes_replayed(mocker, sa_scheduler, persister):
+    mocker.patch.object(persister, 'persist')
+    mocker.spy(persister, 'reload')
+    persister.start(sa_scheduler)
+    persister.stop()
+
+    persister.notify_saved(Mock(id=1), True)
+    persister.start(sa_scheduler)
+
+    assert(wait_for(lambda: persister.persist.called))
+    persister.persist.assert_called_once_with({1: False})
+    assert(not persister.reload.called)
     persister.stop()
+
+
+def test_offset_resumed_over_restarts(mocker, sa_scheduler, persister):
+    persister.start(sa_scheduler)
+    key = persister._get_offset_key()
+    persister.stop()
+
+    # offsets of stopped schedulers should expire unless they come back.
+    assert(persister.redis.ttl(key) > 0)
+
+    # a new persister of the same scheduler should resume from the offset.
+    persister.notify_saved(Mock(id=1), True)
+    restarted = Persister(persister.redis)
+    mocker.patch.object(restarted, 'persist')
+    mocker.spy(restarted, 'reload')
+    restarted.start(sa_scheduler)
+
+    assert(wait_for(lambda: restarted.persist.called))
+    restarted.persist.assert_called_once_with({1: False})
+    assert(not restarted.reload.called)
+    assert(persister.redis.ttl(key) == -1)
+    restarted.stop()
+
+
+def test_offset_saved_after_scheduler_let_go(mocker, sa_scheduler,
+                                             persister):
+    persister.start(sa_scheduler)
+    key = persister._get_offset_key()
+    mocker.spy(persister, '_save_offset')
+
+    # the listener might outlive the scheduler when stop has timed out.
+    persister.scheduler = None
+    persister.notify_saved(Mock(id=1), True)
+    assert(wait_for(lambda: persister._save_offset.called))
+    assert(persister._decode(persister.redis.get(key)) == persister.offset)
+    persister.stop()
+
+
+def test_persist_with_single_query(mocker, sa_schedule, sa_scheduler,
+                                   persister):
+    mocker.spy(sa_scheduler.backend, 'get_schedules')
+    mocker.spy(sa_scheduler, 'update')
+    mocker.spy(sa_scheduler, 'remove')
+    persister.scheduler = sa_scheduler
+
+    persister.persist({sa_schedule.id: False, -1: False, -2: True})
+    sa_scheduler.backend.get_schedules.assert_called_once_with(
+        ids=[sa_schedule.id, -1])
+    sa_scheduler.update.assert_called_once_with(sa_schedule)
+    sa_scheduler.remove.assert_any_call(-1, silent=False)
+    sa_scheduler.remove.assert_any_call(-2, silent=False)
+    persister.scheduler = None
@@ -0,0 +1,34 @@
+import asyncio
+import threading
+from news.runtime import Runtime, get_runtime, close_runtime
+
+
+def test_runtime():
+    runtime = Runtime().start()
+    assert(runtime.started)
+    assert(not runtime.session.closed)
+
+    async def running_loop():
+        return asyncio.get_event_loop()
+    assert(runtime.run(running_loop()) is runtime.loop)
+
+    session = runtime.session
+    runtime.close()
+    assert(not runtime.started)
+    assert(session.closed)
+
+
+def test_get_runtime():
+    runtime = get_runtime()
+    assert(runtime is get_runtime())
+
+    # other threads should get their own runtimes
+    runtimes = []
+    thread = threading.Thread(target=lambda: runtimes.append(get_runtime()))
+    thread.start()
+    thread.join()
+    assert(runtimes[0] is not runtime)
+
+    close_runtime()
+    assert(get_runtime() is not runtime)
+    close_runtime()
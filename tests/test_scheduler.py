@@ -1,4 +1,12 @@
+import pytest
 import celery
+from news.scheduler import JobQueue, Scheduler
+from news.executor import LocalExecutor
+from news.inflight import InflightRegistry, LocalInflightRegistry
+from news.cycle import CycleRegistry, LocalCycleRegistry
+from news.exceptions import SchedulerConfigurationError
+from news.cluster import Cluster
+from news.constants import REDIS_SCHEDULE_STAMP_KEY, DEFAULT_SCHEDULER_ID
 
 
 def test_run(django_scheduler, django_schedule):
@@ -17,3 +25,169 @@ def test_remove_schedule(django_scheduler, django_schedule):
     assert(django_scheduler.jobs)
     django_scheduler.remove(django_schedule)
     assert(not django_scheduler.jobs)
+
+
+def test_job_queue_pops_due_jobs_in_order():
+    now = [0]
+    jobs = JobQueue(clock=lambda: now[0])
+    jobs.push(1, 10)
+    jobs.push(2, 5)
+    jobs.push(3, 7, delay=0)
+    assert(jobs.pop_due(timeout=0) == [3])
+
+    now[0] = 10
+    assert(jobs.pop_due(timeout=0) == [2, 3, 1])
+
+    # missed runs should be skipped
+    now[0] = 100
+    assert(sorted(jobs.pop_due(timeout=0)) == [1, 2, 3])
+    assert(not jobs.pop_due(timeout=0))
+
+
+def test_job_queue_rejects_non_positive_intervals():
+    jobs = JobQueue()
+    with pytest.raises(ValueError):
+        jobs.push(1, 0, delay=0)
+    with pytest.raises(ValueError):
+        jobs.push(1, -10)
+    assert(not jobs)
+    assert(jobs.pop_due(timeout=0) == [])
+
+
+def test_add_schedule_of_non_positive_cycle(django_scheduler,
+                                           django_schedule):
+    django_schedule.cycle = 0
+    django_scheduler.add(django_schedule)
+    assert(not django_scheduler.jobs)
+
+
+def test_job_queue_remove():
+    now = [0]
+    jobs = JobQueue(clock=lambda: now[0])
+    jobs.push(1, 10)
+    jobs.push(2, 10)
+    jobs.remove(1)
+    jobs.remove(3)
+    assert(1 not in jobs and 2 in jobs)
+
+    now[0] = 10
+    assert(jobs.pop_due(timeout=0) == [2])
+
+
+def test_job_queue_jitter():
+    now = [0]
+    jobs = JobQueue(clock=lambda: now[0])
+    jobs.push(1, 10, jitter=5)
+
+    now[0] = 9.9
+    assert(not jobs.pop_due(timeout=0))
+    now[0] = 15
+    assert(jobs.pop_due(timeout=0) == [1])
+
+    # jitter shouldn't accumulate over runs
+    now[0] = 25
+    assert(jobs.pop_due(timeout=0) == [1])
+
+
+def test_staggered_schedules(django_scheduler, django_schedule):
+    interval = django_schedule.cycle * 60
+    django_scheduler.configure(stagger=True)
+    delays = set()
+    for id in range(100):
+        django_schedule.id = id
+        delays.add(int(django_scheduler._get_delay(django_schedule, interval)
+                       * 10 // interval))
+    assert(delays == set(range(10)))
+
+
+@pytest.mark.django_db
+def test_load_schedule_from_snapshot(mocker, django_scheduler,
+                                     django_schedule):
+    django_scheduler.add(django_schedule)
+    snapshot = django_scheduler._make_snapshot(django_schedule.id)
+    mocker.spy(django_scheduler.backend, 'get_schedule')
+
+    schedule = django_scheduler._load_schedule(django_schedule.id, snapshot)
+    assert(schedule == django_schedule)
+    assert(not django_scheduler.backend.get_schedule.called)
+
+    # snapshots of schedules changed since their dumps shouldn't be trusted.
+    persister = django_scheduler.persister
+    persister.notify_deleted(django_schedule)
+    schedule = django_scheduler._load_schedule(django_schedule.id, snapshot)
+    assert(schedule == django_schedule)
+    assert(django_scheduler.backend.get_schedule.call_count == 1)
+    persister.redis.hdel(REDIS_SCHEDULE_STAMP_KEY, django_schedule.id)
+
+    snapshot['pushed'] -= django_scheduler.snapshot_max_age + 1
+    schedule = django_scheduler._load_schedule(django_schedule.id, snapshot)
+    assert(schedule == django_schedule)
+    assert(django_scheduler.backend.get_schedule.call_count == 2)
+
+
+def test_push_covers_in_batches(mocker, django_scheduler):
+    django_scheduler.configure(batch_size=2)
+    django_scheduler.set_task()
+    mocker.patch.object(django_scheduler.celery_batch_task, 'apply_async')
+
+    django_scheduler._push_covers([1, 2, 3])
+    assert(django_scheduler.celery_batch_task.apply_async.call_count == 2)
+    django_scheduler.inflight.release(1)
+    django_scheduler._push_covers([1, 2, 3])
+    assert(django_scheduler.celery_batch_task.apply_async.call_count == 3)
+
+
+def test_inflight_registry_of_covers(celery, persister):
+    # covers run by celery workers should be released via redis.
+    scheduler = Scheduler(celery=celery, persister=persister)
+    assert(isinstance(scheduler.inflight, InflightRegistry))
+    scheduler = Scheduler(executor=LocalExecutor())
+    assert(isinstance(scheduler.inflight, LocalInflightRegistry))
+    with pytest.raises(SchedulerConfigurationError):
+        Scheduler(celery=celery).start()
+
+
+def test_cycle_registry_of_covers(celery, persister):
+    # intervals adapted by celery workers should be shared via redis.
+    scheduler = Scheduler(celery=celery, persister=persister)
+    assert(isinstance(scheduler.cycles, CycleRegistry))
+    scheduler = Scheduler(executor=LocalExecutor())
+    assert(isinstance(scheduler.cycles, LocalCycleRegistry))
+    with pytest.raises(SchedulerConfigurationError):
+        Scheduler(celery=celery).cycles
+
+
+def test_scheduler_id(celery, persister):
+    # ids of clustered schedulers should be kept over their restarts.
+    cluster = Cluster(persister.redis)
+    restarted = Cluster(persister.redis)
+    assert(cluster.node_id != restarted.node_id)
+    assert(Scheduler(celery=celery, cluster=cluster).id ==
+           Scheduler(celery=celery, cluster=restarted).id)
+    assert(Scheduler(celery=celery, cluster=cluster, id='a').id == 'a')
+    assert(Scheduler(celery=celery).id == DEFAULT_SCHEDULER_ID)
+
+
+def test_adapt_cycle(django_scheduler, django_schedule):
+    django_schedule.cycle = 10
+    django_schedule.enabled = True
+    django_schedule.options = dict(django_schedule.options, max_cycle=60,
+                                   adaptive_cycle=True)
+    django_scheduler.add(django_schedule)
+    assert(django_scheduler._intervals[django_schedule.id] == 600)
+
+    # empty covers should stretch the schedule's cycle within it's bounds.
+    assert(django_scheduler.adapt(django_schedule, 0) == 1200)
+    assert(django_scheduler.adapt(django_schedule, 0) == 2400)
+    assert(django_scheduler.adapt(django_schedule, 0) == 3600)
+    assert(django_scheduler.adapt(django_schedule, 4) == 1800)
+    assert(django_scheduler._intervals[django_schedule.id] == 1800)
+
+    # adapted cycles should be kept over re-adds but not over updates.
+    django_scheduler.add(django_schedule)
+    assert(django_scheduler._intervals[django_schedule.id] == 1800)
+    django_scheduler.update(django_schedule)
+    assert(django_scheduler._intervals[django_schedule.id] == 600)
+
+    django_schedule.options['adaptive_cycle'] = False
+    assert(django_scheduler.adapt(django_schedule, 0) is None)